@@ -4,14 +4,63 @@ from typing import Optional, Dict, Any
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import os
-from backend.mysql_db import db
+from backend.mysql_db import async_db
+from backend.utils.cache import MemoryCache
 
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
 
+# How long a confirmed "this user exists" result is trusted before the
+# database is asked again. Each worker process has its own cache, so this
+# is also the longest a deleted user's tokens keep working. 0 disables it.
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", 60))
+
 security = HTTPBearer()
 
+# email -> user id, only for users confirmed to exist
+user_cache = MemoryCache(
+    max_entries=int(os.getenv("AUTH_CACHE_MAX_ENTRIES", 10000)),
+    default_ttl=AUTH_CACHE_TTL
+) if AUTH_CACHE_TTL > 0 else None
+
+
+def invalidate_user(email: str):
+    """
+    Drop a user from the auth cache. Call this whenever a user is deleted or
+    their email changes so their tokens stop being accepted right away (in
+    this worker; other workers catch up within AUTH_CACHE_TTL).
+    """
+    if user_cache is not None:
+        user_cache.delete(email)
+
+
+def clear_user_cache():
+    if user_cache is not None:
+        user_cache.clear()
+
+
+def auth_cache_stats() -> Dict[str, Any]:
+    if user_cache is None:
+        return {"backend": "disabled"}
+    stats = user_cache.stats()
+    stats["ttl"] = AUTH_CACHE_TTL
+    return stats
+
+
+async def user_exists(email: str, user_id: str) -> bool:
+    if user_cache is not None and user_cache.get(email) == user_id:
+        return True
+    
+    user = await async_db.get_user_by_email(email)
+    # The id check rejects tokens of a deleted user whose email was re-registered
+    if not user or user["id"] != user_id:
+        return False
+    
+    if user_cache is not None:
+        user_cache.set(email, user_id)
+    return True
+
 
 def create_access_token(user_data: Dict[str, Any]) -> str:
 
@@ -44,7 +93,7 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
     # Extract token from credentials
     token = credentials.credentials
     
@@ -57,9 +106,8 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Verify user still exists in database
-    user = db.get_user_by_email(user_data["email"])
-    if not user:
+    # Verify user still exists (cached for AUTH_CACHE_TTL seconds)
+    if not await user_exists(user_data["email"], user_data["user_id"]):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
@@ -69,7 +117,7 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
     return user_data
 
 
-def register_user(full_name: str, email: str, password: str) -> Dict[str, Any]:
+async def register_user(full_name: str, email: str, password: str) -> Dict[str, Any]:
     try:
         # Basic validation
         if not full_name or not email or not password:
@@ -84,7 +132,8 @@ def register_user(full_name: str, email: str, password: str) -> Dict[str, Any]:
                 detail="Password must be at least 8 characters long"
             )
         
-        user = db.create_user(full_name, email, password)
+        user = await async_db.create_user(full_name, email, password)
+        invalidate_user(email)
         
         return {
             "success": True,
@@ -99,9 +148,9 @@ def register_user(full_name: str, email: str, password: str) -> Dict[str, Any]:
         )
 
 
-def login_user(email: str, password: str) -> Dict[str, Any]:
+async def login_user(email: str, password: str) -> Dict[str, Any]:
     
-    user = db.verify_user_password(email, password)
+    user = await async_db.verify_user_password(email, password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -25,7 +25,7 @@ def main():
         print()
         
         print("Creating database tables...")
-        db._init_tables()
+        db.init_schema()
         print("✓ Tables created successfully!")
         print()
         
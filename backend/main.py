@@ -6,6 +6,8 @@ import os
 # Load environment variables
 load_dotenv()
 
+from backend.utils.helpers import BodySizeLimitMiddleware, MAX_UPLOAD_BYTES
+
 app = FastAPI(
     title="Rapidread Summarizer API",
     description="AI-powered content summarization service using Google Gemini",
@@ -21,7 +23,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-from backend.routes import auth, article, youtube, pdf, github, summaries
+# Multipart framing adds a little on top of the file itself
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=MAX_UPLOAD_BYTES + 64 * 1024,
+    path_prefixes=("/pdf", "/jobs/pdf"),
+)
+
+from backend.routes import auth, article, youtube, pdf, github, summaries, jobs
+from backend.services.job_service import job_manager
+from backend.utils.execution import host_limiter, stage_executor
+from backend.utils.http_client import http_client
 
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 
@@ -32,6 +44,25 @@ app.include_router(github.router, prefix="/github", tags=["GitHub Summarization"
 
 app.include_router(summaries.router, prefix="/summaries", tags=["Summary Management"])
 
+app.include_router(jobs.router, prefix="/jobs", tags=["Background Jobs"])
+
+
+@app.on_event("startup")
+async def start_job_workers():
+    # Autoscaled workers can skip this and rely on `python backend/init_database.py`
+    # having been run once per deployment.
+    if os.getenv("DB_MIGRATE_ON_STARTUP", "true").lower() == "true":
+        from backend.mysql_db import async_db
+        await async_db.init_schema()
+    await job_manager.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_workers():
+    await job_manager.stop()
+    stage_executor.shutdown(wait=False)
+    http_client.close()
+
 
 @app.get("/", tags=["Root"])
 def read_root():
@@ -50,40 +81,55 @@ def health_check():
         gemini_api_key = os.getenv("GEMINI_API_KEY")
         gemini_configured = gemini_api_key and gemini_api_key != "your-gemini-api-key-here"
         
+        from backend.services.summarizer_service import summarizer_service
+        
         gemini_status = "not_configured"
         gemini_details = {}
+        summary_cache = summarizer_service.cache_stats()
+        completion_paths = summarizer_service.completion_stats()
+        engines = summarizer_service.engine_stats()
         
         if gemini_configured:
             try:
-                from backend.services.summarizer_service import summarizer_service
-                if summarizer_service:
-                    test_result = summarizer_service.test_connection()
-                    if test_result["success"]:
-                        gemini_status = "connected"
-                        gemini_details = {
-                            "model": test_result["model"],
-                            "test_response": test_result["response"]
-                        }
-                    else:
-                        gemini_status = "connection_failed"
-                        gemini_details = {"error": test_result["message"]}
+                test_result = summarizer_service.test_connection()
+                if test_result["success"]:
+                    gemini_status = "connected"
+                    gemini_details = {
+                        "model": test_result["model"],
+                        "test_response": test_result["response"]
+                    }
                 else:
-                    gemini_status = "service_unavailable"
+                    gemini_status = "connection_failed"
+                    gemini_details = {"error": test_result["message"]}
             except Exception as e:
                 gemini_status = "error"
                 gemini_details = {"error": str(e)}
         
         # Check MySQL database
         from backend.mysql_db import db
+        from backend.services.article_store import article_store
+        from backend.services.transcript_store import transcript_store
+        from backend.auth import auth_cache_stats
         db_status = "connected"
         
         return {
             "status": "healthy",
             "database": db_status,
+            "database_pool": db.pool_stats(),
+            "execution": stage_executor.stats(),
+            "host_limits": host_limiter.stats(),
+            "jobs": job_manager.stats(),
+            "auth_cache": auth_cache_stats(),
+            "article_cache": article_store.stats(),
+            "transcript_cache": transcript_store.stats(),
+            "http_client": http_client.stats(),
             "ai_service": {
                 "status": gemini_status,
                 "configured": gemini_configured,
-                "details": gemini_details
+                "details": gemini_details,
+                "engines": engines,
+                "summary_cache": summary_cache,
+                "completion_paths": completion_paths
             },
             "environment": os.getenv("ENVIRONMENT", "development")
         }
@@ -121,7 +167,8 @@ def get_storage_info():
             "database": db.connection_params['database'],
             "host": db.connection_params['host'],
             "users_count": users_count,
-            "summaries_count": summaries_count
+            "summaries_count": summaries_count,
+            "connection_pool": db.pool_stats()
         }
         
     except Exception as e:
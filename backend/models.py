@@ -29,18 +29,27 @@ class LoginResponse(BaseModel):
 
 class SummaryRequest(BaseModel):
     url: str
+    engine: Optional[str] = None  # "gemini" or "extractive"; server default when omitted
 
 
 class ArticleRequest(SummaryRequest):
-    pass
+    include_keywords: bool = False  # keyword extraction costs extra CPU, so it is opt-in
 
 
 class YouTubeRequest(SummaryRequest):
-    pass
+    chapters: Optional[bool] = None  # per-chapter summaries; default: only for long videos
+
+
+class YouTubeBatchRequest(BaseModel):
+    videos: List[str]  # video URLs or ids; repeats are summarized once
+    engine: Optional[str] = None
+    chapters: Optional[bool] = None
+    combined: bool = False  # also summarize the per-video summaries together
 
 
 class GitHubRequest(BaseModel):
     repo_url: str
+    engine: Optional[str] = None
 
 
 class PDFUpload(BaseModel):
@@ -1,6 +1,13 @@
 import pymysql
 import os
-from typing import Dict, List, Optional, Any
+import json
+import asyncio
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import uuid
 from dotenv import load_dotenv
@@ -8,6 +15,209 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+
+class PoolTimeoutError(Exception):
+    pass
+
+
+class PooledConnection:
+    """
+    Thin proxy around a pymysql connection checked out from a ConnectionPool.
+
+    Calling close() hands the connection back to the pool instead of closing
+    the socket, so existing ``try/finally: connection.close()`` call sites
+    keep working unchanged.
+    """
+
+    def __init__(self, pool: "ConnectionPool", raw_connection, created_at: float):
+        self._pool = pool
+        self._raw = raw_connection
+        self.created_at = created_at
+        self.last_used_at = time.monotonic()
+        self.broken = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def close(self):
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and issubclass(exc_type, pymysql.err.OperationalError):
+            self.broken = True
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Bounded, thread-safe pool of pymysql connections.
+
+    Idle connections are pinged before reuse once they have been idle longer
+    than ``ping_interval`` seconds and are recycled after ``max_lifetime``
+    seconds. Callers block for up to ``timeout`` seconds when every
+    connection is checked out.
+    """
+
+    def __init__(self, connection_params: Dict[str, Any], max_size: int = 10,
+                 timeout: float = 10.0, max_lifetime: float = 1800.0,
+                 ping_interval: float = 30.0):
+        self.connection_params = connection_params
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_interval = ping_interval
+        
+        self._idle = deque()
+        self._size = 0
+        self._in_use = 0
+        self._condition = threading.Condition()
+        
+        self._stats = {
+            "checkouts": 0,
+            "connections_created": 0,
+            "connections_recycled": 0,
+            "health_check_failures": 0,
+            "timeouts": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+        }
+    
+    def _connect(self) -> PooledConnection:
+        raw_connection = pymysql.connect(**self.connection_params)
+        with self._condition:
+            self._stats["connections_created"] += 1
+        return PooledConnection(self, raw_connection, time.monotonic())
+    
+    def _discard(self, connection: PooledConnection):
+        try:
+            connection._raw.close()
+        except Exception:
+            pass
+    
+    def _is_expired(self, connection: PooledConnection, now: float) -> bool:
+        return self.max_lifetime > 0 and now - connection.created_at > self.max_lifetime
+    
+    def _is_healthy(self, connection: PooledConnection, now: float) -> bool:
+        if now - connection.last_used_at < self.ping_interval:
+            return True
+        try:
+            connection._raw.ping(reconnect=False)
+            return True
+        except Exception:
+            with self._condition:
+                self._stats["health_check_failures"] += 1
+            return False
+    
+    def acquire(self) -> PooledConnection:
+        started = time.monotonic()
+        deadline = started + self.timeout
+        
+        with self._condition:
+            while True:
+                if self._idle:
+                    connection = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    connection = None
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeoutError(
+                        f"Timed out after {self.timeout}s waiting for a database connection"
+                    )
+                self._condition.wait(remaining)
+            self._in_use += 1
+        
+        # Health checks and new connections happen outside the lock so a slow
+        # handshake never blocks other threads returning connections.
+        try:
+            now = time.monotonic()
+            if connection is not None:
+                if self._is_expired(connection, now):
+                    with self._condition:
+                        self._stats["connections_recycled"] += 1
+                    self._discard(connection)
+                    connection = None
+                elif not self._is_healthy(connection, now):
+                    self._discard(connection)
+                    connection = None
+            if connection is None:
+                connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        
+        connection._pool = self
+        connection.broken = False
+        
+        waited = time.monotonic() - started
+        with self._condition:
+            self._stats["checkouts"] += 1
+            self._stats["total_wait_time"] += waited
+            self._stats["max_wait_time"] = max(self._stats["max_wait_time"], waited)
+        
+        return connection
+    
+    def release(self, connection: PooledConnection):
+        keep = not connection.broken
+        if keep:
+            try:
+                # End any open transaction so the next borrower never sees a
+                # stale REPEATABLE READ snapshot or uncommitted writes.
+                connection._raw.rollback()
+            except Exception:
+                keep = False
+        
+        with self._condition:
+            if keep and self._is_expired(connection, time.monotonic()):
+                self._stats["connections_recycled"] += 1
+                keep = False
+            self._in_use -= 1
+            if keep:
+                connection.last_used_at = time.monotonic()
+                self._idle.append(connection)
+            else:
+                self._size -= 1
+            self._condition.notify()
+        
+        if not keep:
+            self._discard(connection)
+    
+    def close_all(self):
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+        for connection in idle:
+            self._discard(connection)
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            checkouts = self._stats["checkouts"]
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "checkouts": checkouts,
+                "connections_created": self._stats["connections_created"],
+                "connections_recycled": self._stats["connections_recycled"],
+                "health_check_failures": self._stats["health_check_failures"],
+                "timeouts": self._stats["timeouts"],
+                "avg_wait_ms": round(self._stats["total_wait_time"] / checkouts * 1000, 3) if checkouts else 0.0,
+                "max_wait_ms": round(self._stats["max_wait_time"] * 1000, 3),
+            }
+
+
 class MySQLDatabase:
     
     def __init__(self):
@@ -45,12 +255,24 @@ class MySQLDatabase:
                 'cursorclass': pymysql.cursors.DictCursor
             }
         
-        self._init_tables()
+        self.pool = ConnectionPool(
+            self.connection_params,
+            max_size=int(os.getenv('DB_POOL_SIZE', 10)),
+            timeout=float(os.getenv('DB_POOL_TIMEOUT', 10)),
+            max_lifetime=float(os.getenv('DB_POOL_MAX_LIFETIME', 1800)),
+            ping_interval=float(os.getenv('DB_POOL_PING_INTERVAL', 30))
+        )
+        # No connection is opened here: the pool connects on first checkout and
+        # the schema is created by init_schema() (app startup or init_database.py).
     
     def _get_connection(self):
-        return pymysql.connect(**self.connection_params)
+        # Returns a pooled connection; close() checks it back into the pool.
+        return self.pool.acquire()
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        return self.pool.stats()
     
-    def _init_tables(self):
+    def init_schema(self):
         connection = self._get_connection()
         try:
             with connection.cursor() as cursor:
@@ -66,7 +288,39 @@ class MySQLDatabase:
                     )
                 """)
                 
-                # Create summaries table
+                # Create sources table: one row per distinct extracted content,
+                # keyed by the hash of its normalized text
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS sources (
+                        id CHAR(64) PRIMARY KEY,
+                        source_type VARCHAR(50) NOT NULL,
+                        source_url TEXT NOT NULL,
+                        content_preview TEXT,
+                        content_length INT NOT NULL,
+                        created_at DATETIME NOT NULL
+                    )
+                """)
+                
+                # Create summary artifacts table: one summary per source and engine,
+                # shared by every user who summarizes that source
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS summary_artifacts (
+                        id VARCHAR(36) PRIMARY KEY,
+                        source_id CHAR(64) NOT NULL,
+                        engine_id VARCHAR(128) NOT NULL,
+                        summary MEDIUMTEXT NOT NULL,
+                        completion_path VARCHAR(32),
+                        details LONGTEXT NULL,
+                        created_at DATETIME NOT NULL,
+                        UNIQUE KEY uq_source_engine (source_id, engine_id)
+                    )
+                """)
+                if self._column_nullable(cursor, "summary_artifacts", "details") is None:
+                    cursor.execute("ALTER TABLE summary_artifacts ADD COLUMN details LONGTEXT NULL")
+                
+                # Create summaries table: per-user history. New rows reference an
+                # artifact; summary/original_content are only set on older rows
+                # and on summaries that were not worth sharing (errors).
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS summaries (
                         id VARCHAR(36) PRIMARY KEY,
@@ -74,16 +328,84 @@ class MySQLDatabase:
                         source_type VARCHAR(50) NOT NULL,
                         source_url TEXT NOT NULL,
                         original_content TEXT,
-                        summary TEXT NOT NULL,
+                        summary TEXT NULL,
+                        artifact_id VARCHAR(36) NULL,
+                        created_at DATETIME NOT NULL,
+                        INDEX idx_user_created (user_id, created_at)
+                    )
+                """)
+                self._ensure_index(cursor, "summaries", "idx_user_created", "(user_id, created_at)")
+                if self._column_nullable(cursor, "summaries", "artifact_id") is None:
+                    cursor.execute("ALTER TABLE summaries ADD COLUMN artifact_id VARCHAR(36) NULL")
+                if self._column_nullable(cursor, "summaries", "summary") is False:
+                    cursor.execute("ALTER TABLE summaries MODIFY summary TEXT NULL")
+                
+                # Create shared cache table (summary cache and other namespaces)
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_entries (
+                        namespace VARCHAR(64) NOT NULL,
+                        cache_key CHAR(64) NOT NULL,
+                        value LONGTEXT NOT NULL,
+                        size_bytes INT NOT NULL,
+                        created_at DATETIME NOT NULL,
+                        accessed_at DATETIME NOT NULL,
+                        expires_at DATETIME NULL,
+                        PRIMARY KEY (namespace, cache_key),
+                        INDEX idx_namespace_accessed (namespace, accessed_at)
+                    )
+                """)
+                
+                # Create background jobs table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        id VARCHAR(36) PRIMARY KEY,
+                        user_id VARCHAR(36) NOT NULL,
+                        job_type VARCHAR(50) NOT NULL,
+                        status VARCHAR(20) NOT NULL,
+                        payload TEXT NOT NULL,
+                        result LONGTEXT,
+                        error TEXT,
                         created_at DATETIME NOT NULL,
-                        INDEX idx_user_id (user_id)
+                        started_at DATETIME NULL,
+                        finished_at DATETIME NULL,
+                        worker_id VARCHAR(64) NULL,
+                        heartbeat_at DATETIME NULL,
+                        INDEX idx_user_created (user_id, created_at),
+                        INDEX idx_status (status)
                     )
                 """)
+                # Running jobs record which worker owns them and when it last
+                # checked in, so only jobs of dead workers are requeued
+                if self._column_nullable(cursor, "jobs", "worker_id") is None:
+                    cursor.execute("ALTER TABLE jobs ADD COLUMN worker_id VARCHAR(64) NULL")
+                if self._column_nullable(cursor, "jobs", "heartbeat_at") is None:
+                    cursor.execute("ALTER TABLE jobs ADD COLUMN heartbeat_at DATETIME NULL")
                 
             connection.commit()
         finally:
             connection.close()
     
+    @staticmethod
+    def _ensure_index(cursor, table: str, index: str, columns: str):
+        # CREATE TABLE IF NOT EXISTS leaves tables from older versions untouched
+        cursor.execute("""
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+            LIMIT 1
+        """, (table, index))
+        if not cursor.fetchone():
+            cursor.execute(f"ALTER TABLE {table} ADD INDEX {index} {columns}")
+    
+    @staticmethod
+    def _column_nullable(cursor, table: str, column: str) -> Optional[bool]:
+        # None when the column does not exist yet
+        cursor.execute("""
+            SELECT is_nullable AS nullable FROM information_schema.columns
+            WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s
+        """, (table, column))
+        row = cursor.fetchone()
+        return None if row is None else row["nullable"] == "YES"
+    
     def create_user(self, full_name: str, email: str, password: str) -> Dict[str, Any]:
         connection = self._get_connection()
         try:
@@ -142,7 +464,8 @@ class MySQLDatabase:
         return None
     
     def create_summary(self, user_id: str, source_type: str, source_url: str, 
-                      original_content: str, summary: str) -> Dict[str, Any]:
+                      original_content: Optional[str], summary: Optional[str],
+                      artifact_id: Optional[str] = None) -> Dict[str, Any]:
         connection = self._get_connection()
         try:
             with connection.cursor() as cursor:
@@ -152,10 +475,10 @@ class MySQLDatabase:
                 
                 cursor.execute("""
                     INSERT INTO summaries (id, user_id, source_type, source_url, 
-                                         original_content, summary, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                                         original_content, summary, artifact_id, created_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                 """, (summary_id, user_id, source_type, source_url, 
-                      original_content, summary, created_at))
+                      original_content, summary, artifact_id, created_at))
                 
             connection.commit()
             
@@ -166,22 +489,101 @@ class MySQLDatabase:
                 'source_url': source_url,
                 'original_content': original_content,
                 'summary': summary,
+                'artifact_id': artifact_id,
                 'created_at': created_at.isoformat()
             }
         finally:
             connection.close()
     
-    def get_user_summaries(self, user_id: str) -> List[Dict[str, Any]]:
+    def get_summary_artifact(self, source_id: str, engine_id: str) -> Optional[Dict[str, Any]]:
         connection = self._get_connection()
         try:
             with connection.cursor() as cursor:
                 cursor.execute("""
-                    SELECT id, user_id, source_type, source_url, 
-                           original_content, summary, created_at
-                    FROM summaries
-                    WHERE user_id = %s
-                    ORDER BY created_at DESC
-                """, (user_id,))
+                    SELECT id, source_id, engine_id, summary, completion_path, details, created_at
+                    FROM summary_artifacts
+                    WHERE source_id = %s AND engine_id = %s
+                """, (source_id, engine_id))
+                
+                artifact = cursor.fetchone()
+                
+                if artifact:
+                    artifact['details'] = json.loads(artifact['details']) if artifact['details'] else {}
+                    artifact['created_at'] = artifact['created_at'].isoformat()
+                
+                return artifact
+        finally:
+            connection.close()
+    
+    def save_summary_artifact(self, source_id: str, source_type: str, source_url: str,
+                              content_preview: str, content_length: int, engine_id: str,
+                              summary: str, completion_path: str,
+                              details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Store a summary for a source (registering the source on first sight)
+        and return the stored artifact. When another request stored one for
+        the same source and engine first, that artifact is returned instead.
+        """
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                created_at = datetime.now()
+                
+                cursor.execute("""
+                    INSERT INTO sources (id, source_type, source_url, content_preview,
+                                         content_length, created_at)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE id = id
+                """, (source_id, source_type, source_url, content_preview, content_length, created_at))
+                
+                cursor.execute("""
+                    INSERT INTO summary_artifacts (id, source_id, engine_id, summary,
+                                                   completion_path, details, created_at)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE id = id
+                """, (str(uuid.uuid4()), source_id, engine_id, summary, completion_path,
+                      json.dumps(details) if details else None, created_at))
+                
+            connection.commit()
+        finally:
+            connection.close()
+        
+        return self.get_summary_artifact(source_id, engine_id)
+    
+    def get_user_summaries(self, user_id: str, limit: int = 20,
+                           before: Optional[Tuple[datetime, str]] = None) -> List[Dict[str, Any]]:
+        """
+        One page of a user's summaries, newest first, without original_content.
+        
+        ``before`` is the (created_at, id) of the last row of the previous
+        page. Seeking past it on idx_user_created keeps every page as cheap
+        as the first, unlike OFFSET.
+        """
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                if before is None:
+                    cursor.execute("""
+                        SELECT h.id, h.source_type, h.source_url,
+                               COALESCE(a.summary, h.summary) AS summary, h.created_at
+                        FROM summaries h
+                        LEFT JOIN summary_artifacts a ON a.id = h.artifact_id
+                        WHERE h.user_id = %s
+                        ORDER BY h.created_at DESC, h.id DESC
+                        LIMIT %s
+                    """, (user_id, limit))
+                else:
+                    created_at, summary_id = before
+                    cursor.execute("""
+                        SELECT h.id, h.source_type, h.source_url,
+                               COALESCE(a.summary, h.summary) AS summary, h.created_at
+                        FROM summaries h
+                        LEFT JOIN summary_artifacts a ON a.id = h.artifact_id
+                        WHERE h.user_id = %s
+                          AND (h.created_at < %s OR (h.created_at = %s AND h.id < %s))
+                        ORDER BY h.created_at DESC, h.id DESC
+                        LIMIT %s
+                    """, (user_id, created_at, created_at, summary_id, limit))
                 
                 summaries = cursor.fetchall()
                 
@@ -198,10 +600,13 @@ class MySQLDatabase:
         try:
             with connection.cursor() as cursor:
                 cursor.execute("""
-                    SELECT id, user_id, source_type, source_url, 
-                           original_content, summary, created_at
-                    FROM summaries
-                    WHERE id = %s
+                    SELECT h.id, h.user_id, h.source_type, h.source_url,
+                           COALESCE(src.content_preview, h.original_content) AS original_content,
+                           COALESCE(a.summary, h.summary) AS summary, h.created_at
+                    FROM summaries h
+                    LEFT JOIN summary_artifacts a ON a.id = h.artifact_id
+                    LEFT JOIN sources src ON src.id = a.source_id
+                    WHERE h.id = %s
                 """, (summary_id,))
                 
                 summary = cursor.fetchone()
@@ -213,5 +618,234 @@ class MySQLDatabase:
                 return summary
         finally:
             connection.close()
+    
+    def _format_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        job['payload'] = json.loads(job['payload']) if job['payload'] else {}
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        for field in ('created_at', 'started_at', 'finished_at'):
+            if job[field]:
+                job[field] = job[field].isoformat()
+        return job
+    
+    def create_job(self, user_id: str, job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                job_id = str(uuid.uuid4())
+                created_at = datetime.now()
+                
+                cursor.execute("""
+                    INSERT INTO jobs (id, user_id, job_type, status, payload, created_at)
+                    VALUES (%s, %s, %s, %s, %s, %s)
+                """, (job_id, user_id, job_type, 'queued', json.dumps(payload), created_at))
+                
+            connection.commit()
+            
+            return {
+                'id': job_id,
+                'user_id': user_id,
+                'job_type': job_type,
+                'status': 'queued',
+                'payload': payload,
+                'result': None,
+                'error': None,
+                'created_at': created_at.isoformat(),
+                'started_at': None,
+                'finished_at': None
+            }
+        finally:
+            connection.close()
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    SELECT id, user_id, job_type, status, payload, result, error,
+                           created_at, started_at, finished_at
+                    FROM jobs WHERE id = %s
+                """, (job_id,))
+                
+                job = cursor.fetchone()
+                return self._format_job(job) if job else None
+        finally:
+            connection.close()
+    
+    def get_jobs_by_status(self, statuses: List[str]) -> List[Dict[str, Any]]:
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                placeholders = ', '.join(['%s'] * len(statuses))
+                cursor.execute(f"""
+                    SELECT id, user_id, job_type, status, payload, result, error,
+                           created_at, started_at, finished_at
+                    FROM jobs WHERE status IN ({placeholders})
+                    ORDER BY created_at
+                """, tuple(statuses))
+                
+                return [self._format_job(job) for job in cursor.fetchall()]
+        finally:
+            connection.close()
+    
+    def claim_job(self, job_id: str, worker_id: str) -> bool:
+        # Atomic queued -> running transition so a job only ever runs once
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                now = datetime.now()
+                cursor.execute("""
+                    UPDATE jobs SET status = 'running', started_at = %s, worker_id = %s, heartbeat_at = %s
+                    WHERE id = %s AND status = 'queued'
+                """, (now, worker_id, now, job_id))
+                claimed = cursor.rowcount == 1
+            connection.commit()
+            return claimed
+        finally:
+            connection.close()
+    
+    def heartbeat_jobs(self, worker_id: str) -> int:
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE jobs SET heartbeat_at = %s
+                    WHERE worker_id = %s AND status = 'running'
+                """, (datetime.now(), worker_id))
+                updated = cursor.rowcount
+            connection.commit()
+            return updated
+        finally:
+            connection.close()
+    
+    def release_job(self, job_id: str, worker_id: str) -> bool:
+        # Hand a running job back to the queue, e.g. when its worker shuts down
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE jobs SET status = 'queued', started_at = NULL, worker_id = NULL, heartbeat_at = NULL
+                    WHERE id = %s AND worker_id = %s AND status = 'running'
+                """, (job_id, worker_id))
+                released = cursor.rowcount == 1
+            connection.commit()
+            return released
+        finally:
+            connection.close()
+    
+    def requeue_stale_jobs(self, heartbeat_before: datetime) -> int:
+        # Running jobs whose worker stopped checking in (crashed or killed);
+        # rows from before heartbeats existed fall back to their start time
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE jobs SET status = 'queued', started_at = NULL, worker_id = NULL, heartbeat_at = NULL
+                    WHERE status = 'running' AND COALESCE(heartbeat_at, started_at) < %s
+                """, (heartbeat_before,))
+                requeued = cursor.rowcount
+            connection.commit()
+            return requeued
+        finally:
+            connection.close()
+    
+    def finish_job(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+                   error: Optional[str] = None):
+        connection = self._get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE jobs SET status = %s, result = %s, error = %s, finished_at = %s
+                    WHERE id = %s
+                """, (status, json.dumps(result) if result is not None else None,
+                      error, datetime.now(), job_id))
+            connection.commit()
+        finally:
+            connection.close()
+
+
+class AsyncMySQLDatabase:
+    """
+    Async facade over MySQLDatabase for use from ``async def`` routes.
+
+    Each call runs on a dedicated thread pool sized to the connection pool,
+    so a slow query only occupies one executor thread instead of stalling
+    the event loop for every concurrent request.
+    """
+
+    def __init__(self, database: MySQLDatabase):
+        self.database = database
+        self.executor = ThreadPoolExecutor(
+            max_workers=database.pool.max_size,
+            thread_name_prefix="mysql"
+        )
+    
+    async def run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+    
+    async def create_user(self, full_name: str, email: str, password: str) -> Dict[str, Any]:
+        return await self.run(self.database.create_user, full_name, email, password)
+    
+    async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        return await self.run(self.database.get_user_by_email, email)
+    
+    async def verify_user_password(self, email: str, password: str) -> Optional[Dict[str, Any]]:
+        return await self.run(self.database.verify_user_password, email, password)
+    
+    async def create_summary(self, user_id: str, source_type: str, source_url: str,
+                             original_content: Optional[str], summary: Optional[str],
+                             artifact_id: Optional[str] = None) -> Dict[str, Any]:
+        return await self.run(self.database.create_summary, user_id, source_type,
+                              source_url, original_content, summary, artifact_id)
+    
+    async def get_summary_artifact(self, source_id: str, engine_id: str) -> Optional[Dict[str, Any]]:
+        return await self.run(self.database.get_summary_artifact, source_id, engine_id)
+    
+    async def save_summary_artifact(self, source_id: str, source_type: str, source_url: str,
+                                    content_preview: str, content_length: int, engine_id: str,
+                                    summary: str, completion_path: str,
+                                    details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return await self.run(self.database.save_summary_artifact, source_id, source_type, source_url,
+                              content_preview, content_length, engine_id, summary, completion_path, details)
+    
+    async def get_user_summaries(self, user_id: str, limit: int = 20,
+                                 before: Optional[Tuple[datetime, str]] = None) -> List[Dict[str, Any]]:
+        return await self.run(self.database.get_user_summaries, user_id, limit, before)
+    
+    async def get_summary_by_id(self, summary_id: str) -> Optional[Dict[str, Any]]:
+        return await self.run(self.database.get_summary_by_id, summary_id)
+    
+    async def create_job(self, user_id: str, job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.run(self.database.create_job, user_id, job_type, payload)
+    
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.run(self.database.get_job, job_id)
+    
+    async def get_jobs_by_status(self, statuses: List[str]) -> List[Dict[str, Any]]:
+        return await self.run(self.database.get_jobs_by_status, statuses)
+    
+    async def claim_job(self, job_id: str, worker_id: str) -> bool:
+        return await self.run(self.database.claim_job, job_id, worker_id)
+    
+    async def heartbeat_jobs(self, worker_id: str) -> int:
+        return await self.run(self.database.heartbeat_jobs, worker_id)
+    
+    async def release_job(self, job_id: str, worker_id: str) -> bool:
+        return await self.run(self.database.release_job, job_id, worker_id)
+    
+    async def requeue_stale_jobs(self, heartbeat_before: datetime) -> int:
+        return await self.run(self.database.requeue_stale_jobs, heartbeat_before)
+    
+    async def finish_job(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+                         error: Optional[str] = None):
+        return await self.run(self.database.finish_job, job_id, status, result, error)
+    
+    async def init_schema(self):
+        return await self.run(self.database.init_schema)
+    
+    def pool_stats(self) -> Dict[str, Any]:
+        return self.database.pool_stats()
+
 
 db = MySQLDatabase()
+async_db = AsyncMySQLDatabase(db)
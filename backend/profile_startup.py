@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+DEFAULT_TARGET = "backend.main"
+DEFAULT_TOP = 25
+
+
+def profile_imports(target: str = DEFAULT_TARGET):
+    """
+    Import ``target`` in a fresh interpreter with ``-X importtime`` and return
+    the wall time plus (module, self_us, cumulative_us) for every import.
+    """
+    env = dict(os.environ, PYTHONPATH=str(project_root))
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=project_root, env=env, capture_output=True, text=True
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    rows = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+    errors = [line for line in process.stderr.splitlines() if not line.startswith("import time:")]
+    return wall_ms, rows, process.returncode, errors
+
+
+def main():
+    target = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TARGET
+    top = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TOP
+
+    print("=" * 60)
+    print(f"Rapidread Summarizer - Import Profile ({target})")
+    print("=" * 60)
+    print()
+
+    wall_ms, rows, returncode, errors = profile_imports(target)
+    if returncode != 0:
+        print(f"Importing {target} failed:")
+        print("\n".join(errors[-10:]))
+        sys.exit(1)
+
+    # Top-level entries (no leading indentation) are what the target pulled in
+    # directly or through a first-time import; their cumulative times add up
+    # to the total.
+    top_level = [(name.strip(), cumulative) for name, _, cumulative in rows if not name.startswith("  ")]
+    total_ms = sum(cumulative for _, cumulative in top_level) / 1000
+
+    print(f"Interpreter + import wall time: {wall_ms:.0f} ms")
+    print(f"Import time (sum of top-level): {total_ms:.0f} ms across {len(rows)} modules")
+    print()
+
+    print(f"Slowest imports by cumulative time (top {top}):")
+    for name, cumulative in sorted(top_level, key=lambda row: row[1], reverse=True)[:top]:
+        print(f"  {cumulative / 1000:9.1f} ms  {name}")
+    print()
+
+    print(f"Slowest modules by self time (top {top}):")
+    for name, self_us, _ in sorted(rows, key=lambda row: row[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:9.1f} ms  {name.strip()}")
+    print()
+
+    heavy = ("google.genai", "newspaper", "nltk", "bs4", "PyPDF2", "youtube_transcript_api", "numpy",
+             "httpx", "h2")
+    loaded = sorted({name.strip() for name, _, _ in rows if name.strip() in heavy})
+    print("Heavy optional dependencies imported at startup: " + (", ".join(loaded) if loaded else "none"))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,7 @@ router = APIRouter(tags=["Authentication"])
 async def register_new_user(user_data: UserRegister):
     
     try:
-        result = register_user(
+        result = await register_user(
             full_name=user_data.full_name,
             email=user_data.email,
             password=user_data.password
@@ -32,7 +32,7 @@ async def register_new_user(user_data: UserRegister):
 async def login_existing_user(user_credentials: UserLogin):
     
     try:
-        result = login_user(
+        result = await login_user(
             email=user_credentials.email,
             password=user_credentials.password
         )
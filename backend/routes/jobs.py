@@ -0,0 +1,151 @@
+from fastapi import APIRouter, HTTPException, Depends, Request, status
+from backend.models import ArticleRequest, YouTubeRequest, YouTubeBatchRequest, GitHubRequest
+from backend.auth import get_current_user
+from backend.mysql_db import async_db
+from backend.services.job_service import job_manager
+from backend.services.pipeline_service import require_engine, SummarizationError
+from backend.routes.pdf import PDF_UPLOAD_FORM, receive_pdf_upload
+from backend.utils.helpers import remove_file
+from typing import Dict, Any, Optional
+
+router = APIRouter(tags=["Background Jobs"])
+
+
+def _job_status(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "job_id": job["id"],
+        "job_type": job["job_type"],
+        "status": job["status"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "status_url": f"/jobs/{job['id']}",
+        "result_url": f"/jobs/{job['id']}/result"
+    }
+
+
+def _check_engine(engine: Optional[str]):
+    # Fail fast with 400 instead of accepting a job that is bound to fail
+    try:
+        require_engine(engine)
+    except SummarizationError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+async def _submit(user_id: str, job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    _check_engine(payload.get("engine"))
+    try:
+        job = await job_manager.submit(user_id, job_type, payload)
+        return {"success": True, **_job_status(job)}
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit job: {str(e)}"
+        )
+
+
+async def _get_owned_job(job_id: str, user_id: str) -> Dict[str, Any]:
+    job = await async_db.get_job(job_id)
+    
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    if job["user_id"] != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to access this job"
+        )
+    
+    return job
+
+
+@router.post("/article", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+async def submit_article_job(
+    request: ArticleRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    return await _submit(current_user["user_id"], "article", {
+        "url": request.url, "engine": request.engine, "include_keywords": request.include_keywords
+    })
+
+
+@router.post("/youtube", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+async def submit_youtube_job(
+    request: YouTubeRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    return await _submit(current_user["user_id"], "youtube", {
+        "url": request.url, "engine": request.engine, "chapters": request.chapters
+    })
+
+
+@router.post("/youtube/batch", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+async def submit_youtube_batch_job(
+    request: YouTubeBatchRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    return await _submit(current_user["user_id"], "youtube_batch", {
+        "videos": request.videos, "engine": request.engine,
+        "chapters": request.chapters, "combined": request.combined
+    })
+
+
+@router.post("/github", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED)
+async def submit_github_job(
+    request: GitHubRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    return await _submit(current_user["user_id"], "github", {"repo_url": request.repo_url, "engine": request.engine})
+
+
+@router.post("/pdf", response_model=Dict[str, Any], status_code=status.HTTP_202_ACCEPTED,
+             openapi_extra=PDF_UPLOAD_FORM)
+async def submit_pdf_job(
+    request: Request,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    filename, file_path, engine = await receive_pdf_upload(request, prefix="job")
+    try:
+        # Once submitted, the job manager owns the upload and removes it when the job finishes
+        return await _submit(current_user["user_id"], "pdf", {
+            "filename": filename, "file_path": file_path, "engine": engine
+        })
+    except BaseException:
+        # No job will ever process the upload
+        remove_file(file_path)
+        raise
+
+
+@router.get("/{job_id}", response_model=Dict[str, Any])
+async def get_job_status(
+    job_id: str,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    job = await _get_owned_job(job_id, current_user["user_id"])
+    return {"success": True, **_job_status(job)}
+
+
+@router.get("/{job_id}/result", response_model=Dict[str, Any])
+async def get_job_result(
+    job_id: str,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    job = await _get_owned_job(job_id, current_user["user_id"])
+    
+    if job["status"] == "failed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=job["error"] or "Job failed"
+        )
+    
+    if job["status"] != "succeeded":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is still {job['status']}"
+        )
+    
+    return job["result"]
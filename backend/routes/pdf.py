@@ -1,61 +1,86 @@
-from fastapi import APIRouter, HTTPException, Depends, status, UploadFile, File
+from fastapi import APIRouter, HTTPException, Depends, Request, status
 from backend.auth import get_current_user
-from backend.services.pdf_service import get_pdf_info
-from backend.services.summarizer_service import summarizer_service
-from backend.mysql_db import db
-from typing import Dict, Any
+from backend.services.pipeline_service import (
+    require_engine, summarize_pdf_source, stream_source_summary, SummarizationError
+)
+from backend.utils.helpers import (
+    MAX_UPLOAD_BYTES,
+    UploadFormError,
+    UploadTooLargeError,
+    receive_upload,
+    remove_file,
+    sse_response
+)
+from typing import Dict, Any, Optional, Tuple
 
 router = APIRouter(tags=["PDF Summarization"])
 
+# The upload is parsed by receive_upload rather than File()/Form()
+# parameters, so describe the form for the API docs here.
+PDF_UPLOAD_FORM = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {
+                        "file": {"type": "string", "format": "binary"},
+                        "engine": {"type": "string"}
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+def check_engine(engine: Optional[str]):
+    try:
+        require_engine(engine)
+    except SummarizationError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+async def receive_pdf_upload(request: Request, prefix: str = "upload") -> Tuple[str, str, Optional[str]]:
+    """
+    Write the uploaded PDF to UPLOAD_DIR once and return its filename, path
+    and the requested engine. The caller owns the file from then on; on any
+    error here it has already been removed.
+    """
+    try:
+        fields, upload = await receive_upload(request, "file", prefix, MAX_UPLOAD_BYTES)
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+    except UploadFormError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.post("/summarize", response_model=Dict[str, Any])
+    if upload is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No PDF file uploaded")
+
+    engine = fields.get("engine") or None
+    try:
+        check_engine(engine)
+    except HTTPException:
+        remove_file(upload["path"])
+        raise
+    return upload["filename"], upload["path"], engine
+
+
+@router.post("/summarize", response_model=Dict[str, Any], openapi_extra=PDF_UPLOAD_FORM)
 async def summarize_pdf_document(
-    file: UploadFile = File(...),
+    request: Request,
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
   
+    filename, file_path, engine = await receive_pdf_upload(request)
     try:
-        if not summarizer_service:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="AI service is not available. Please check GEMINI_API_KEY configuration."
-            )
-        
-        file_content = await file.read()
-        
-        pdf_info = get_pdf_info(file_content, file.filename)
-        
-        if not pdf_info["success"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=pdf_info["error"]
-            )
-        
-        pdf_content = pdf_info["content"]
-        summary = summarizer_service.summarize_text(pdf_content, "pdf")
-        
-        summary_record = db.create_summary(
-            user_id=current_user["user_id"],
-            source_type="pdf",
-            source_url=file.filename,
-            original_content=pdf_content[:1000] + "..." if len(pdf_content) > 1000 else pdf_content,
-            summary=summary
-        )
-        
-        return {
-            "success": True,
-            "message": "PDF document summarized successfully",
-            "summary": {
-                "id": summary_record["id"],
-                "source_type": "pdf",
-                "filename": file.filename,
-                "page_count": pdf_info.get("page_count", 0),
-                "file_size": pdf_info.get("file_size", 0),
-                "summary": summary,
-                "created_at": summary_record["created_at"]
-            }
-        }
+        return await summarize_pdf_source(current_user["user_id"], filename, file_path=file_path,
+                                          engine=engine)
         
+    except SummarizationError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except HTTPException:
         raise
     except Exception as e:
@@ -63,12 +88,30 @@ async def summarize_pdf_document(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"PDF summarization failed: {str(e)}"
         )
+    finally:
+        # This request owns the upload
+        remove_file(file_path)
+
+
+@router.post("/summarize/stream", openapi_extra=PDF_UPLOAD_FORM)
+async def stream_pdf_summary(
+    request: Request,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    
+    filename, file_path, engine = await receive_pdf_upload(request)
+    
+    # The response owns the upload and removes it when it ends, even if the
+    # client disconnects before the stream starts extracting
+    return sse_response(stream_source_summary(
+        current_user["user_id"], "pdf", engine, filename=filename, file_path=file_path
+    ), on_close=lambda: remove_file(file_path))
 
 
-@router.post("/upload", response_model=Dict[str, Any])
+@router.post("/upload", response_model=Dict[str, Any], openapi_extra=PDF_UPLOAD_FORM)
 async def upload_pdf_legacy(
-    file: UploadFile = File(...),
+    request: Request,
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     
-    return await summarize_pdf_document(file, current_user)
+    return await summarize_pdf_document(request, current_user)
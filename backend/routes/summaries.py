@@ -1,34 +1,42 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, status
 from backend.models import SummaryListResponse, SummaryResponse
 from backend.auth import get_current_user
-from backend.mysql_db import db
-from typing import Dict, Any, List
+from backend.mysql_db import async_db
+from backend.utils.helpers import decode_cursor, encode_cursor
+from typing import Dict, Any, List, Optional
 
 router = APIRouter(tags=["Summary Management"])
 
 
 @router.get("/my-summaries", response_model=Dict[str, Any])
-async def get_my_summaries(current_user: Dict[str, Any] = Depends(get_current_user)):
+async def get_my_summaries(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
   
     try:
-        # Get user's summaries from database
-        summaries = db.get_user_summaries(current_user["user_id"])
+        before = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    try:
+        # One extra row tells us whether another page exists
+        summaries = await async_db.get_user_summaries(current_user["user_id"], limit + 1, before)
+        has_more = len(summaries) > limit
+        summaries = summaries[:limit]
         
-        # Format summaries for response
-        formatted_summaries = []
-        for summary in summaries:
-            formatted_summaries.append({
-                "id": summary["id"],
-                "source_type": summary["source_type"],
-                "source_url": summary["source_url"],
-                "summary": summary["summary"],
-                "created_at": summary["created_at"]
-            })
+        next_cursor = None
+        if has_more:
+            last = summaries[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"])
         
         return {
             "success": True,
-            "count": len(formatted_summaries),
-            "summaries": formatted_summaries
+            "count": len(summaries),
+            "summaries": summaries,
+            "has_more": has_more,
+            "next_cursor": next_cursor
         }
         
     except Exception as e:
@@ -45,7 +53,7 @@ async def get_summary_by_id(
 ):
     try:
        
-        summary = db.get_summary_by_id(summary_id)
+        summary = await async_db.get_summary_by_id(summary_id)
         
         if not summary:
             raise HTTPException(
@@ -87,7 +95,7 @@ async def delete_summary(
 ):
    
     try:
-        summary = db.get_summary_by_id(summary_id)
+        summary = await async_db.get_summary_by_id(summary_id)
         
         if not summary:
             raise HTTPException(
@@ -1,9 +1,13 @@
 from fastapi import APIRouter, HTTPException, Depends, status
-from backend.models import YouTubeRequest
+from backend.models import YouTubeRequest, YouTubeBatchRequest
 from backend.auth import get_current_user
-from backend.services.youtube_service import get_video_info, get_available_languages
-from backend.services.summarizer_service import summarizer_service
-from backend.mysql_db import db
+from backend.services.youtube_service import get_available_languages
+from backend.services.pipeline_service import (
+    summarize_youtube_source, summarize_youtube_batch, stream_source_summary, stream_youtube_batch,
+    SummarizationError
+)
+from backend.utils.helpers import sse_response
+from backend.utils.execution import stage_executor
 from typing import Dict, Any
 
 router = APIRouter(tags=["YouTube Summarization"])
@@ -14,91 +18,11 @@ async def summarize_youtube_video(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     try:
-        print(f"DEBUG: YouTube summarize request for URL: {request.url}")
-        
-        if not summarizer_service:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="AI service is not available. Please check GEMINI_API_KEY configuration."
-            )
-        
-        from backend.services.youtube_service import YOUTUBE_API_AVAILABLE
-        if not YOUTUBE_API_AVAILABLE:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="YouTube Transcript API is not installed. Please install with: pip install youtube-transcript-api"
-            )
-        
-        print("DEBUG: Calling get_video_info...")
-        video_info = get_video_info(request.url)
-        print(f"DEBUG: get_video_info result: success={video_info.get('success')}")
-        
-        if not video_info["success"]:
-            error_msg = video_info["error"]
-            print(f"DEBUG: Video info error: {error_msg}")
-            
-            if "Invalid YouTube URL" in error_msg:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid YouTube URL. Please provide a valid YouTube video URL (e.g., https://youtube.com/watch?v=VIDEO_ID or https://youtu.be/VIDEO_ID)"
-                )
-            elif "No transcript" in error_msg or "captions" in error_msg:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="This video does not have transcripts/captions available. Please try a different video that has captions enabled."
-                )
-            elif "Could not access transcripts" in error_msg:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Unable to access video transcripts. The video may be private, restricted, or have disabled captions."
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to process YouTube video: {error_msg}"
-                )
-        
-        video_content = video_info["content"]
-        print(f"DEBUG: Video content length: {len(video_content)} characters")
-        
-        if len(video_content.strip()) < 50:  
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="The video transcript is too short to generate a meaningful summary."
-            )
-        
-        print("DEBUG: Generating summary...")
-        summary = summarizer_service.summarize_text(video_content, "youtube")
-        print(f"DEBUG: Summary generated, length: {len(summary)} characters")
-        
-        print("DEBUG: Saving to database...")
-        summary_record = db.create_summary(
-            user_id=current_user["user_id"],
-            source_type="youtube",
-            source_url=request.url,
-            original_content=video_content[:1000] + "..." if len(video_content) > 1000 else video_content,
-            summary=summary
-        )
-        print(f"DEBUG: Saved with ID: {summary_record['id']}")
-        
-        return {
-            "success": True,
-            "message": "YouTube video summarized successfully",
-            "summary": {
-                "id": summary_record["id"],
-                "source_type": "youtube",
-                "source_url": request.url,
-                "video_id": video_info.get("video_id", ""),
-                "title": video_info.get("title", "YouTube Video"),
-                "duration": video_info.get("duration", "Unknown"),
-                "language": video_info.get("language", "Unknown"),
-                "transcript_type": video_info.get("transcript_type", "Unknown"),
-                "transcript_length": len(video_content),
-                "summary": summary,
-                "created_at": summary_record["created_at"]
-            }
-        }
+        return await summarize_youtube_source(current_user["user_id"], request.url, request.engine,
+                                              request.chapters)
         
+    except SummarizationError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
     except HTTPException:
         raise
     except Exception as e:
@@ -111,6 +35,40 @@ async def summarize_youtube_video(
         )
 
 
+@router.post("/summarize/stream")
+async def stream_youtube_summary(
+    request: YouTubeRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    return sse_response(stream_source_summary(
+        current_user["user_id"], "youtube", request.engine,
+        url=request.url, chapters=request.chapters
+    ))
+
+
+@router.post("/summarize/batch", response_model=Dict[str, Any])
+async def summarize_youtube_videos(
+    request: YouTubeBatchRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    try:
+        return await summarize_youtube_batch(current_user["user_id"], request.videos, request.engine,
+                                             request.chapters, request.combined)
+    except SummarizationError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+
+@router.post("/summarize/batch/stream")
+async def stream_youtube_batch_summary(
+    request: YouTubeBatchRequest,
+    current_user: Dict[str, Any] = Depends(get_current_user)
+):
+    return sse_response(stream_youtube_batch(
+        current_user["user_id"], request.videos, request.engine,
+        request.chapters, request.combined
+    ))
+
+
 @router.get("/test/{video_id}", response_model=Dict[str, Any])
 async def test_youtube_video(
     video_id: str,
@@ -139,13 +97,13 @@ async def test_youtube_video(
         }
         
         try:
-            languages = get_available_languages(video_id)
+            languages = await stage_executor.run("fetch", get_available_languages, video_id)
             debug_info["available_languages"] = languages
         except Exception as e:
             debug_info["errors"].append(f"Language check failed: {str(e)}")
         
         try:
-            transcript = fetch_transcript_sync(test_url)
+            transcript = await stage_executor.run("fetch", fetch_transcript_sync, test_url)
             if transcript.startswith("Error:"):
                 debug_info["transcript_test"] = f"Failed: {transcript}"
             else:
@@ -173,7 +131,7 @@ async def get_youtube_video_info(
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     try:
-        available_languages = get_available_languages(video_id)
+        available_languages = await stage_executor.run("fetch", get_available_languages, video_id)
         
         if not available_languages:
             return {
@@ -1,33 +1,59 @@
-import requests
 import re
-from typing import Dict, Any, Optional, List
+import math
+import os
+import threading
+from typing import Dict, Any, Optional, List, Callable
 from urllib.parse import urlparse
 from datetime import datetime
-import time
-
-try:
-    from newspaper import Article, fulltext
-    import newspaper
-    NEWSPAPER_AVAILABLE = True
-except ImportError:
-    NEWSPAPER_AVAILABLE = False
-
-try:
-    from bs4 import BeautifulSoup
-    BEAUTIFULSOUP_AVAILABLE = True
-except ImportError:
-    BEAUTIFULSOUP_AVAILABLE = False
-
-if NEWSPAPER_AVAILABLE:
+from backend.services.article_store import article_store, canonicalize_url
+from backend.utils.chunking import limit_content
+from backend.utils.http_client import http_client
+from backend.utils.lazy_import import lazy_import, module_available
+
+# newspaper3k pulls in nltk, lxml and PIL, so it is only imported once an
+# article is actually extracted.
+newspaper = lazy_import("newspaper")
+newspaper_nlp = lazy_import("newspaper.nlp")
+NEWSPAPER_AVAILABLE = module_available("newspaper")
+
+bs4 = lazy_import("bs4")
+BEAUTIFULSOUP_AVAILABLE = module_available("bs4")
+
+_stopwords_lock = threading.Lock()
+_stopwords_loaded = False
+
+
+def extract_keywords(title: str, text: str, limit: int = 10) -> List[str]:
+    """
+    Keywords for an extracted article, computed on request with newspaper's
+    frequency-based keyword scorer. Unlike ``Article.nlp()`` this skips the
+    sentence summarizer, so no NLTK tokenizer data is needed.
+    """
+    global _stopwords_loaded
+    if not NEWSPAPER_AVAILABLE or not text:
+        return []
+    
     try:
-        import nltk
-        nltk.download('punkt', quiet=True)
-        nltk.download('punkt_tab', quiet=True)
+        with _stopwords_lock:
+            if not _stopwords_loaded:
+                newspaper_nlp.load_stopwords("en")
+                _stopwords_loaded = True
+        
+        keywords = list(newspaper_nlp.keywords(title or "").keys())
+        keywords += [keyword for keyword in newspaper_nlp.keywords(text).keys() if keyword not in keywords]
+        return keywords[:limit]
     except Exception:
-        pass
+        return []
+
 
+def get_article_info(url: str, include_keywords: bool = False) -> Dict[str, Any]:
+    result = _get_article(url)
+    if include_keywords and result.get("success") and not result.get("keywords"):
+        result["keywords"] = extract_keywords(result.get("title", ""), result["content"])
+    return result
 
-def get_article_info(url: str) -> Dict[str, Any]:
+
+def _get_article(url: str) -> Dict[str, Any]:
     try:
         # Validate URL first
         if not validate_article_url(url):
@@ -39,17 +65,37 @@ def get_article_info(url: str) -> Dict[str, Any]:
                 "url": url
             }
         
-        if NEWSPAPER_AVAILABLE:
-            result = try_newspaper_extraction(url)
-            if result["success"]:
-                return result
+        # Serve repeat URLs from the content store; once an entry is past its
+        # freshness window, a conditional request decides whether to re-extract
+        canonical_url = canonicalize_url(url)
+        entry = article_store.lookup(canonical_url)
+        if entry is not None and article_store.is_fresh(entry):
+            return article_store.serve(entry)
+        if entry is not None and not article_store.can_revalidate(entry):
+            entry = None
         
-        if BEAUTIFULSOUP_AVAILABLE:
-            result = try_beautifulsoup_extraction(url)
-            if result["success"]:
-                return result
+        try:
+            fetched = fetch_html(url, entry)
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Failed to download article: {str(e)}",
+                "content": "",
+                "title": "",
+                "url": url
+            }
         
-        result = try_basic_extraction(url)
+        if fetched["not_modified"]:
+            return article_store.revalidated(canonical_url, entry)
+        
+        result = extract_article(url, fetched["html"])
+        if result["success"]:
+            article_store.store(
+                canonical_url, result,
+                etag=fetched["etag"],
+                last_modified=fetched["last_modified"],
+                replaced=entry is not None
+            )
         return result
         
     except Exception as e:
@@ -62,7 +108,118 @@ def get_article_info(url: str) -> Dict[str, Any]:
         }
 
 
-def try_newspaper_extraction(url: str) -> Dict[str, Any]:
+def fetch_html(url: str, cached_entry: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Download a page once, as a conditional request when a cached entry has
+    validators. Returns ``not_modified`` for a 304, otherwise the HTML and
+    the ETag / Last-Modified headers to store with the extraction.
+    """
+    headers = get_enhanced_headers()
+    if cached_entry:
+        if cached_entry.get("etag"):
+            headers["If-None-Match"] = cached_entry["etag"]
+        if cached_entry.get("last_modified"):
+            headers["If-Modified-Since"] = cached_entry["last_modified"]
+    
+    response = http_client.get(url, headers=headers, allow_redirects=True)
+    if response.status_code == 304 and cached_entry:
+        return {"not_modified": True}
+    response.raise_for_status()
+    
+    return {
+        "not_modified": False,
+        "html": response.text,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+
+# Strategy preference when quality scores are close: newspaper and the
+# selector-based soup extractor isolate the article body, while the regex
+# fallback keeps navigation and footer text.
+STRATEGY_WEIGHTS = {"newspaper3k": 1.1, "beautifulsoup": 1.0, "basic": 0.8}
+
+# An extraction scoring at least this (roughly 300+ words of clean prose)
+# is kept without running the remaining, less precise extractors
+GOOD_EXTRACTION_SCORE = float(os.getenv("ARTICLE_GOOD_EXTRACTION_SCORE", 5.0))
+
+
+def extraction_strategies() -> List[Callable[[str, str], Dict[str, Any]]]:
+    strategies = []
+    if NEWSPAPER_AVAILABLE:
+        strategies.append(try_newspaper_extraction)
+    if BEAUTIFULSOUP_AVAILABLE:
+        strategies.append(try_beautifulsoup_extraction)
+    strategies.append(try_basic_extraction)
+    return strategies
+
+
+def score_extraction(result: Dict[str, Any]) -> float:
+    """
+    Rough quality score for an extraction: longer prose-like text scores
+    higher, while text dominated by short fragments (menus, link lists) or
+    non-letters scores lower.
+    """
+    if not result.get("success"):
+        return 0.0
+    
+    text = result.get("content", "")
+    words = text.split()
+    if len(words) < 10:
+        return 0.0
+    
+    sentences = [sentence for sentence in re.split(r'[.!?]+(?:\s|$)', text) if sentence.strip()]
+    words_per_sentence = len(words) / max(1, len(sentences))
+    prose = 1.0 if 8 <= words_per_sentence <= 40 else 0.6
+    letters = sum(character.isalpha() for character in text) / len(text)
+    metadata = 1.0 + 0.05 * sum(bool(result.get(field)) for field in ("authors", "publish_date", "top_image"))
+    
+    weight = STRATEGY_WEIGHTS.get(result.get("extraction_method"), 1.0)
+    return round(math.log1p(len(words)) * prose * letters * metadata * weight, 4)
+
+
+def extract_article(url: str, html: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run the available extractors over one downloaded copy of the page, most
+    precise first, and return the result with the best quality score. The
+    parsers are CPU-bound, so they run one after another on the calling
+    thread and stop at the first result scoring ``GOOD_EXTRACTION_SCORE``.
+    """
+    try:
+        if html is None:
+            html = fetch_html(url)["html"]
+        
+        results = []
+        for strategy in extraction_strategies():
+            results.append(strategy(url, html))
+            if score_extraction(results[-1]) >= GOOD_EXTRACTION_SCORE:
+                break
+        
+        best = max(results, key=score_extraction)
+        if not best["success"]:
+            errors = "; ".join(result.get("error", "") for result in results if result.get("error"))
+            return {
+                "success": False,
+                "error": f"All extraction methods failed. {errors}",
+                "content": "",
+                "title": "",
+                "url": url
+            }
+        
+        best["quality_score"] = score_extraction(best)
+        return best
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to extract article: {str(e)}",
+            "content": "",
+            "title": "",
+            "url": url
+        }
+
+
+def try_newspaper_extraction(url: str, html: Optional[str] = None) -> Dict[str, Any]:
     try:
         config = newspaper.Config()
         config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -71,17 +228,11 @@ def try_newspaper_extraction(url: str) -> Dict[str, Any]:
         config.fetch_images = False
         config.memoize_articles = False
         
-        article = Article(url, config=config)
+        article = newspaper.Article(url, config=config)
         
-        max_retries = 2
-        for attempt in range(max_retries):
-            try:
-                article.download()
-                break
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                time.sleep(1)
+        if html is None:
+            html = fetch_html(url)["html"]
+        article.download(input_html=html)
         
         if not article.html or len(article.html) < 100:
             return {"success": False, "error": "No content downloaded"}
@@ -95,15 +246,6 @@ def try_newspaper_extraction(url: str) -> Dict[str, Any]:
         if not article_text or len(article_text.strip()) < 50:
             return {"success": False, "error": "Content too short"}
         
-        keywords = []
-        summary = ""
-        try:
-            article.nlp()
-            keywords = article.keywords[:10] if hasattr(article, 'keywords') and article.keywords else []
-            summary = article.summary[:500] + "..." if hasattr(article, 'summary') and len(article.summary) > 500 else getattr(article, 'summary', '')
-        except Exception:
-            pass
-        
         authors = getattr(article, 'authors', [])
         publish_date = getattr(article, 'publish_date', None)
         top_image = getattr(article, 'top_image', '')
@@ -118,8 +260,7 @@ def try_newspaper_extraction(url: str) -> Dict[str, Any]:
             except:
                 publish_date_str = ""
         
-        if len(article_text) > 15000:
-            article_text = article_text[:15000] + "..."
+        article_text = limit_content(article_text)
         
         return {
             "success": True,
@@ -129,8 +270,8 @@ def try_newspaper_extraction(url: str) -> Dict[str, Any]:
             "domain": urlparse(url).netloc,
             "authors": authors,
             "publish_date": publish_date_str,
-            "keywords": keywords,
-            "summary": summary,
+            "keywords": [],
+            "summary": "",
             "top_image": top_image,
             "extraction_method": "newspaper3k"
         }
@@ -139,22 +280,14 @@ def try_newspaper_extraction(url: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
-def try_beautifulsoup_extraction(url: str) -> Dict[str, Any]:
+def try_beautifulsoup_extraction(url: str, html: Optional[str] = None) -> Dict[str, Any]:
     try:
-        # Make request with enhanced headers
-        headers = get_enhanced_headers()
-        session = requests.Session()
-        session.headers.update(headers)
-        
-        response = session.get(url, timeout=15, allow_redirects=True)
-        response.raise_for_status()
-        
-        html_content = response.text
+        html_content = html if html is not None else fetch_html(url)["html"]
         
         if len(html_content) < 100:
             return {"success": False, "error": "HTML content too short"}
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = bs4.BeautifulSoup(html_content, 'html.parser')
         
         title = extract_title_from_soup(soup) or extract_title_from_url(url)
         
@@ -163,8 +296,7 @@ def try_beautifulsoup_extraction(url: str) -> Dict[str, Any]:
         if not content or len(content.strip()) < 50:
             return {"success": False, "error": "No meaningful content found"}
         
-        if len(content) > 15000:
-            content = content[:15000] + "..."
+        content = limit_content(content)
         
         return {
             "success": True,
@@ -184,14 +316,9 @@ def try_beautifulsoup_extraction(url: str) -> Dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
-def try_basic_extraction(url: str) -> Dict[str, Any]:
+def try_basic_extraction(url: str, html: Optional[str] = None) -> Dict[str, Any]:
     try:
-        # Make request
-        headers = get_enhanced_headers()
-        response = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-        response.raise_for_status()
-        
-        html_content = response.text
+        html_content = html if html is not None else fetch_html(url)["html"]
         
         if len(html_content) < 100:
             return {"success": False, "error": "HTML content too short"}
@@ -218,13 +345,7 @@ def try_basic_extraction(url: str) -> Dict[str, Any]:
         }
         
     except Exception as e:
-        return {
-            "success": False,
-            "error": f"All extraction methods failed. Last error: {str(e)}",
-            "content": "",
-            "title": "",
-            "url": url
-        }
+        return {"success": False, "error": str(e)}
 
 
 def get_enhanced_headers() -> Dict[str, str]:
@@ -372,8 +493,7 @@ def extract_text_from_html_regex(html_content: str) -> str:
         
         text_content = re.sub(r'\s+', ' ', text_content).strip()
         
-        if len(text_content) > 15000:
-            text_content = text_content[:15000] + "..."
+        text_content = limit_content(text_content)
         
         return text_content
         
@@ -0,0 +1,118 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from backend.utils.cache import create_cache, make_cache_key
+
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid", "ref_src", "_hsenc", "_hsmi"}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so trivially different links to the same article share a
+    cache entry: lower-case scheme and host, no default port, fragment or
+    tracking parameters, sorted query and no trailing slash.
+    """
+    url = url.strip()
+    if not url.lower().startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+class ArticleContentStore:
+    """
+    Extracted article text and metadata keyed by canonical URL.
+
+    Entries keep the ETag and Last-Modified headers of the response they were
+    extracted from. For ``fresh_for`` seconds after a fetch an entry is served
+    without touching the network; after that it is revalidated with a
+    conditional request, and a ``304 Not Modified`` reuses it without
+    downloading or parsing the page again. The cache TTL and size limits
+    bound how long and how many entries are kept.
+    """
+
+    def __init__(self, cache, fresh_for: float = 3600):
+        self.cache = cache
+        self.fresh_for = fresh_for
+        self._lock = threading.Lock()
+        self._stats = {"fresh_hits": 0, "revalidated": 0, "changed": 0, "misses": 0, "stored": 0}
+
+    def _key(self, canonical_url: str) -> str:
+        return make_cache_key("article", canonical_url)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def lookup(self, canonical_url: str) -> Optional[Dict[str, Any]]:
+        if not self.cache:
+            return None
+        entry = self.cache.get(self._key(canonical_url))
+        if entry is None:
+            self._count("misses")
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["fetched_at"] < self.fresh_for
+
+    @staticmethod
+    def can_revalidate(entry: Dict[str, Any]) -> bool:
+        return bool(entry.get("etag") or entry.get("last_modified"))
+
+    def serve(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        self._count("fresh_hits")
+        return dict(entry["article"])
+
+    def revalidated(self, canonical_url: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+        # 304: the stored extraction is still current, so restart its freshness window
+        self._count("revalidated")
+        if self.cache:
+            self.cache.set(self._key(canonical_url), {**entry, "fetched_at": time.time()})
+        return dict(entry["article"])
+
+    def store(self, canonical_url: str, article: Dict[str, Any], etag: Optional[str] = None,
+              last_modified: Optional[str] = None, replaced: bool = False):
+        if not self.cache:
+            return
+        if replaced:
+            self._count("changed")
+        self._count("stored")
+        # Keep a copy: callers get (and may annotate) the dict passed in, and
+        # the memory tier stores objects without serializing them
+        self.cache.set(self._key(canonical_url), {
+            "article": dict(article),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time()
+        })
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["fresh_for"] = self.fresh_for
+        stats["cache"] = self.cache.stats() if self.cache else {"backend": "disabled"}
+        return stats
+
+
+article_store = ArticleContentStore(
+    create_cache("article", "ARTICLE_CACHE", default_ttl=7 * 86400,
+                 default_memory_entries=500, default_memory_bytes=64 * 1024 * 1024),
+    fresh_for=float(os.getenv("ARTICLE_CACHE_FRESH_SECONDS", 3600))
+)
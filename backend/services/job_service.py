@@ -0,0 +1,185 @@
+import asyncio
+import os
+import socket
+import traceback
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, Any, Callable, Awaitable, Optional
+from backend.mysql_db import async_db
+from backend.utils.helpers import remove_file
+from backend.services.pipeline_service import (
+    SummarizationError,
+    summarize_article_source,
+    summarize_github_source,
+    summarize_pdf_source,
+    summarize_youtube_batch,
+    summarize_youtube_source
+)
+
+JobHandler = Callable[..., Awaitable[Dict[str, Any]]]
+JobCleanup = Callable[[Dict[str, Any]], None]
+
+
+class JobManager:
+    """
+    Local worker pool for long-running summarization jobs.
+
+    Jobs are persisted in the ``jobs`` table so their status and result
+    survive restarts; the in-memory queue only carries job ids. Workers
+    claim a job atomically before running it, so several processes can
+    share the table. Each manager stamps the jobs it runs with its own
+    ``worker_id`` and refreshes their heartbeat every
+    ``heartbeat_interval`` seconds; only running jobs whose heartbeat is
+    older than ``stale_after`` seconds (their worker died) are queued
+    again. Jobs interrupted by ``stop()`` are handed back to the queue
+    right away.
+    """
+
+    def __init__(self, worker_count: int = 4, stale_after: float = 120,
+                 heartbeat_interval: float = 15):
+        self.worker_count = max(1, worker_count)
+        self.stale_after = stale_after
+        self.heartbeat_interval = heartbeat_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.handlers: Dict[str, JobHandler] = {}
+        self.cleanups: Dict[str, JobCleanup] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending = set()
+        self._workers = []
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._stats = {"submitted": 0, "succeeded": 0, "failed": 0}
+
+    def register_handler(self, job_type: str, handler: JobHandler, cleanup: Optional[JobCleanup] = None):
+        """
+        ``cleanup`` is called with the job payload once the job has
+        succeeded or failed, e.g. to remove an upload the job owns.
+        """
+        self.handlers[job_type] = handler
+        if cleanup is not None:
+            self.cleanups[job_type] = cleanup
+
+    async def start(self):
+        if self._workers:
+            return
+
+        self._queue = asyncio.Queue()
+        for index in range(self.worker_count):
+            self._workers.append(asyncio.create_task(self._worker(index)))
+
+        await self._recover_jobs()
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self):
+        tasks = list(self._workers)
+        if self._heartbeat is not None:
+            tasks.append(self._heartbeat)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._heartbeat = None
+
+    async def submit(self, user_id: str, job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        if self._queue is None:
+            raise RuntimeError("Job workers are not running")
+
+        job = await async_db.create_job(user_id, job_type, payload)
+        await self._enqueue(job["id"])
+        self._stats["submitted"] += 1
+        return job
+
+    async def _enqueue(self, job_id: str):
+        if job_id not in self._pending:
+            self._pending.add(job_id)
+            await self._queue.put(job_id)
+
+    async def _recover_jobs(self):
+        # Requeue jobs of workers that stopped heartbeating, then pick up
+        # everything queued, including jobs released by other processes
+        await async_db.requeue_stale_jobs(datetime.now() - timedelta(seconds=self.stale_after))
+        for job in await async_db.get_jobs_by_status(["queued"]):
+            await self._enqueue(job["id"])
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await async_db.heartbeat_jobs(self.worker_id)
+                await self._recover_jobs()
+            except Exception:
+                traceback.print_exc()
+
+    async def _worker(self, index: int):
+        while True:
+            job_id = await self._queue.get()
+            self._pending.discard(job_id)
+            try:
+                await self._run_job(job_id)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str):
+        if not await async_db.claim_job(job_id, self.worker_id):
+            return
+
+        try:
+            await self._execute(job_id)
+        except asyncio.CancelledError:
+            # Shutting down mid-job: give the job back instead of leaving it
+            # ``running`` until it goes stale
+            await asyncio.shield(async_db.release_job(job_id, self.worker_id))
+            raise
+
+    async def _execute(self, job_id: str):
+        job = await async_db.get_job(job_id)
+
+        handler = self.handlers.get(job["job_type"])
+        if handler is None:
+            await self._finish(job, "failed", error=f"Unknown job type: {job['job_type']}")
+            return
+
+        try:
+            result = await handler(job["user_id"], **job["payload"])
+        except SummarizationError as e:
+            await self._finish(job, "failed", error=e.detail)
+            return
+        except Exception as e:
+            await self._finish(job, "failed", error=f"Summarization failed: {str(e)}")
+            return
+
+        await self._finish(job, "succeeded", result=result)
+
+    async def _finish(self, job: Dict[str, Any], status: str, result: Optional[Dict[str, Any]] = None,
+                      error: Optional[str] = None):
+        await async_db.finish_job(job["id"], status, result=result, error=error)
+        self._stats[status] += 1
+        cleanup = self.cleanups.get(job["job_type"])
+        if cleanup is not None:
+            try:
+                cleanup(job["payload"])
+            except Exception:
+                traceback.print_exc()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue else 0,
+            **self._stats
+        }
+
+
+job_manager = JobManager(
+    worker_count=int(os.getenv("JOB_WORKERS", 4)),
+    stale_after=float(os.getenv("JOB_STALE_AFTER", 120)),
+    heartbeat_interval=float(os.getenv("JOB_HEARTBEAT_INTERVAL", 15))
+)
+job_manager.register_handler("article", summarize_article_source)
+job_manager.register_handler("youtube", summarize_youtube_source)
+job_manager.register_handler("youtube_batch", summarize_youtube_batch)
+job_manager.register_handler("github", summarize_github_source)
+job_manager.register_handler("pdf", summarize_pdf_source,
+                             cleanup=lambda payload: remove_file(payload.get("file_path")))
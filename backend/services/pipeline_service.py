@@ -0,0 +1,583 @@
+import asyncio
+import logging
+import os
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
+from fastapi import status
+from backend.services.article_service import get_article_info
+from backend.services.github_service import get_repo_info
+from backend.services.pdf_service import get_pdf_info
+from backend.services.youtube_service import (
+    format_timestamp, get_video_info, normalize_video_ref, segment_transcript, watch_url
+)
+from backend.services.summary_engines import CHAPTER_CONTENT_TYPE, CHAPTER_SUMMARY_WORDS
+from backend.services.summarizer_service import summarizer_service
+from backend.mysql_db import async_db
+from backend.utils.cache import make_cache_key, normalize_content
+from backend.utils.execution import host_limiter, stage_executor
+from backend.utils.helpers import format_sse
+
+logger = logging.getLogger(__name__)
+
+SUCCESS_MESSAGES = {
+    "article": "Article summarized successfully",
+    "youtube": "YouTube video summarized successfully",
+    "pdf": "PDF document summarized successfully",
+    "github": "GitHub repository summarized successfully"
+}
+
+
+# Summaries produced on these paths are not stored as shared artifacts
+UNSHARED_PATHS = {"empty", "no_response", "error"}
+
+# Videos at least this long are summarized chapter by chapter unless the
+# request says otherwise
+CHAPTERS_MIN_DURATION = float(os.getenv("YOUTUBE_CHAPTERS_MIN_DURATION", 1200))
+
+# Largest number of distinct videos accepted in one batch request
+BATCH_MAX_VIDEOS = int(os.getenv("YOUTUBE_BATCH_MAX_VIDEOS", 50))
+
+
+class SummarizationError(Exception):
+    """
+    Raised by the pipeline handlers with the HTTP status the routes should
+    return. Job workers record ``detail`` as the job error instead.
+    """
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _preview(content: str) -> str:
+    return content[:1000] + "..." if len(content) > 1000 else content
+
+
+def require_engine(engine: Optional[str]):
+    try:
+        summarizer_service.get_engine(engine)
+    except ValueError as e:
+        raise SummarizationError(status.HTTP_400_BAD_REQUEST, str(e))
+
+
+async def extract_article(url: str, include_keywords: bool = False) -> Tuple[str, str, Dict[str, Any]]:
+    article_info = await stage_executor.run("fetch", get_article_info, url, include_keywords)
+
+    if not article_info["success"]:
+        raise SummarizationError(
+            status.HTTP_400_BAD_REQUEST,
+            f"Failed to extract article content: {article_info['error']}"
+        )
+
+    return url, article_info["content"], {
+        "source_url": url,
+        "title": article_info.get("title", "Article"),
+        "domain": article_info.get("domain", ""),
+        "authors": article_info.get("authors", []),
+        "publish_date": article_info.get("publish_date", ""),
+        "keywords": article_info.get("keywords", []),
+        "top_image": article_info.get("top_image", ""),
+        "extraction_method": article_info.get("extraction_method", "unknown"),
+        "quality_score": article_info.get("quality_score")
+    }
+
+
+async def extract_github(repo_url: str) -> Tuple[str, str, Dict[str, Any]]:
+    repo_info = await stage_executor.run("fetch", get_repo_info, repo_url)
+
+    if not repo_info["success"]:
+        raise SummarizationError(
+            status.HTTP_400_BAD_REQUEST,
+            f"Failed to process GitHub repository: {repo_info['error']}"
+        )
+
+    return repo_url, repo_info["content"], {
+        "source_url": repo_url,
+        "owner": repo_info.get("owner", ""),
+        "repo": repo_info.get("repo", ""),
+        "full_name": repo_info.get("full_name", ""),
+        "description": repo_info.get("description", "")
+    }
+
+
+async def extract_pdf(filename: str, file_content: Optional[bytes] = None,
+                      file_path: Optional[str] = None) -> Tuple[str, str, Dict[str, Any]]:
+    # Page ranges are extracted in the cpu stage's process pool; the call
+    # that fans them out only waits on the workers, so it runs on a thread.
+    # Uploads arrive as the path of the saved file, which is memory mapped
+    # rather than read. Whoever received the upload (the route, its stream
+    # or the job manager) owns the file and removes it.
+    cpu_stage = stage_executor.stages["cpu"]
+    if file_path is not None and not os.path.exists(file_path):
+        raise SummarizationError(status.HTTP_410_GONE, "The uploaded PDF is no longer available; please upload it again")
+    pdf_info = await stage_executor.run("fetch", get_pdf_info, file_content, filename,
+                                        file_path=file_path,
+                                        executor=cpu_stage.executor,
+                                        max_in_flight=cpu_stage.concurrency * 2)
+
+    if not pdf_info["success"]:
+        raise SummarizationError(status.HTTP_400_BAD_REQUEST, pdf_info["error"])
+
+    return filename, pdf_info["content"], {
+        "filename": filename,
+        "page_count": pdf_info.get("page_count", 0),
+        "file_size": pdf_info.get("file_size", 0),
+        "metadata": pdf_info.get("metadata", {}),
+        "extraction": pdf_info.get("extraction", {})
+    }
+
+
+async def extract_youtube(url: str, chapters: Optional[bool] = None) -> Tuple[str, str, Dict[str, Any]]:
+    from backend.services.youtube_service import YOUTUBE_API_AVAILABLE
+    if not YOUTUBE_API_AVAILABLE:
+        raise SummarizationError(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "YouTube Transcript API is not installed. Please install with: pip install youtube-transcript-api"
+        )
+
+    # Every transcript request goes to youtube.com, so batches share one
+    # per-host limit; transcripts already in the store skip it entirely
+    video_info = await stage_executor.run("fetch", get_video_info, url, cached_only=True)
+    if video_info is None:
+        async with host_limiter.limit("youtube.com"):
+            video_info = await stage_executor.run("fetch", get_video_info, url)
+
+    if not video_info["success"]:
+        error_msg = video_info["error"]
+        logger.debug("YouTube extraction failed for %s: %s", url, error_msg)
+
+        if "Invalid YouTube URL" in error_msg:
+            detail = "Invalid YouTube URL. Please provide a valid YouTube video URL (e.g., https://youtube.com/watch?v=VIDEO_ID or https://youtu.be/VIDEO_ID)"
+        elif "No transcript" in error_msg or "captions" in error_msg:
+            detail = "This video does not have transcripts/captions available. Please try a different video that has captions enabled."
+        elif "Could not access transcripts" in error_msg:
+            detail = "Unable to access video transcripts. The video may be private, restricted, or have disabled captions."
+        else:
+            detail = f"Failed to process YouTube video: {error_msg}"
+        raise SummarizationError(status.HTTP_400_BAD_REQUEST, detail)
+
+    video_content = video_info["content"]
+
+    if len(video_content.strip()) < 50:
+        raise SummarizationError(
+            status.HTTP_400_BAD_REQUEST,
+            "The video transcript is too short to generate a meaningful summary."
+        )
+
+    fields = {
+        "source_url": url,
+        "video_id": video_info.get("video_id", ""),
+        "title": video_info.get("title", "YouTube Video"),
+        "duration": video_info.get("duration", "Unknown"),
+        "language": video_info.get("language", "Unknown"),
+        "transcript_type": video_info.get("transcript_type", "Unknown"),
+        "transcript_length": len(video_content)
+    }
+
+    if chapters is None:
+        chapters = video_info.get("duration_seconds", 0) >= CHAPTERS_MIN_DURATION
+    if chapters and video_info.get("snippets"):
+        segments = segment_transcript(video_info["snippets"])
+        if len(segments) > 1:
+            # Chapters carry the whole transcript; only summarize_source sees their text
+            video_content = "\n\n".join(segment["text"] for segment in segments)
+            fields["transcript_length"] = len(video_content)
+            fields["_chapters"] = segments
+
+    return url, video_content, fields
+
+
+EXTRACTORS = {
+    "article": extract_article,
+    "youtube": extract_youtube,
+    "pdf": extract_pdf,
+    "github": extract_github
+}
+
+
+def _source_id(source_type: str, content: str) -> str:
+    # Identical extracted content is one source, whichever URL or user it came from
+    return make_cache_key("source", source_type, normalize_content(content))
+
+
+def _engine_id(engine: Optional[str], chaptered: bool = False) -> str:
+    engine_id = summarizer_service.get_engine(engine).cache_id
+    return f"{engine_id}:chapters{CHAPTER_SUMMARY_WORDS}" if chaptered else engine_id
+
+
+async def _find_artifact(source_id: str, engine: Optional[str], chaptered: bool = False) -> Optional[Dict[str, Any]]:
+    return await async_db.get_summary_artifact(source_id, _engine_id(engine, chaptered))
+
+
+def _reuse_artifact(artifact: Dict[str, Any], engine: Optional[str]) -> Dict[str, Any]:
+    name = summarizer_service.get_engine(engine).name
+    summarizer_service.record_reused(name)
+    result = {"summary": artifact["summary"], "engine": name, "completion_path": "reused",
+              "artifact_id": artifact["id"]}
+    if artifact.get("details", {}).get("chapters"):
+        result["chapters"] = artifact["details"]["chapters"]
+    return result
+
+
+async def _summarize_chapter(chapter: Dict[str, Any], engine: Optional[str]) -> Dict[str, Any]:
+    # Short chapter summaries keep the outline they are reduced from small
+    # enough for a single request
+    result = await stage_executor.run("llm", summarizer_service.summarize_with_details,
+                                      chapter["text"], CHAPTER_CONTENT_TYPE, engine)
+    return {
+        "index": chapter["index"],
+        "start": chapter["start"],
+        "end": chapter["end"],
+        "start_label": format_timestamp(chapter["start"]),
+        "summary": result["summary"]
+    }
+
+
+def _chapter_outline(entries: List[Dict[str, Any]]) -> str:
+    return "\n\n".join(f"[{entry['start_label']}] {entry['summary']}" for entry in entries)
+
+
+def _chapter_path(path: Optional[str]) -> str:
+    return path if path in UNSHARED_PATHS else "chapters"
+
+
+async def _stream_chapters(chapters: List[Dict[str, Any]], engine: Optional[str]) -> AsyncIterator[Dict[str, Any]]:
+    # Chapter summaries in completion order; pending ones are cancelled if the client goes away
+    tasks = [asyncio.ensure_future(_summarize_chapter(chapter, engine)) for chapter in chapters]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def summarize_chapters(chapters: List[Dict[str, Any]], source_type: str,
+                             engine: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Summarize every chapter briefly in parallel (bounded by the llm stage),
+    then summarize the timestamped chapter summaries into the overall summary.
+    """
+    entries = await asyncio.gather(*(_summarize_chapter(chapter, engine) for chapter in chapters))
+    result = await stage_executor.run("llm", summarizer_service.summarize_with_details,
+                                      _chapter_outline(entries), source_type, engine)
+    return {**result, "completion_path": _chapter_path(result["completion_path"]), "chapters": entries}
+
+
+async def _save_summary(user_id: str, source_type: str, source_url: str, content: str,
+                        summary: str, fields: Dict[str, Any], source_id: str,
+                        details: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Record the summary in the user's history. Fresh summaries are first
+    stored as the shared artifact for (source, engine) so later requests for
+    the same content reuse them; the history row only references it.
+    """
+    artifact_id = details.get("artifact_id")
+    if artifact_id is None and details.get("engine") and details.get("completion_path") not in UNSHARED_PATHS:
+        chapters = details.get("chapters")
+        artifact = await async_db.save_summary_artifact(
+            source_id, source_type, source_url, _preview(content), len(content),
+            _engine_id(details["engine"], bool(chapters)), summary, details["completion_path"],
+            {"chapters": chapters} if chapters else None
+        )
+        artifact_id = artifact["id"]
+
+    if artifact_id is not None:
+        summary_record = await async_db.create_summary(
+            user_id=user_id,
+            source_type=source_type,
+            source_url=source_url,
+            original_content=None,
+            summary=None,
+            artifact_id=artifact_id
+        )
+    else:
+        summary_record = await async_db.create_summary(
+            user_id=user_id,
+            source_type=source_type,
+            source_url=source_url,
+            original_content=_preview(content),
+            summary=summary
+        )
+
+    return {
+        "success": True,
+        "message": SUCCESS_MESSAGES[source_type],
+        "summary": {
+            "id": summary_record["id"],
+            "source_type": source_type,
+            **fields,
+            "summary": summary,
+            "created_at": summary_record["created_at"]
+        }
+    }
+
+
+def _summary_details(result: Dict[str, Any]) -> Dict[str, Any]:
+    details = {"engine": result.get("engine"), "completion_path": result.get("completion_path")}
+    if result.get("fallback_reason"):
+        details["fallback_reason"] = result["fallback_reason"]
+    if result.get("chapters"):
+        details["chapters"] = result["chapters"]
+    return details
+
+
+async def summarize_source(user_id: str, source_type: str, engine: Optional[str] = None,
+                           **params) -> Dict[str, Any]:
+    require_engine(engine)
+
+    source_url, content, fields = await EXTRACTORS[source_type](**params)
+    chapters = fields.pop("_chapters", None)
+
+    source_id = _source_id(source_type, content)
+    artifact = await _find_artifact(source_id, engine, bool(chapters))
+    if artifact is not None:
+        result = _reuse_artifact(artifact, engine)
+    elif chapters:
+        result = await summarize_chapters(chapters, source_type, engine)
+    else:
+        result = await stage_executor.run("llm", summarizer_service.summarize_with_details,
+                                          content, source_type, engine)
+
+    response = await _save_summary(user_id, source_type, source_url, content, result["summary"],
+                                   fields, source_id, result)
+    response["summary"].update(_summary_details(result))
+    return response
+
+
+async def stream_source_summary(user_id: str, source_type: str, engine: Optional[str] = None,
+                                **params) -> AsyncIterator[str]:
+    """
+    Server-Sent Events version of summarize_source.
+
+    Emits ``status`` while extracting, ``metadata`` once the source is
+    known, a ``token`` event per generated chunk, and finally ``done`` with
+    the same payload the blocking endpoint returns. Failures end the stream
+    with an ``error`` event.
+    """
+    try:
+        require_engine(engine)
+
+        yield format_sse("status", {"stage": "extracting"})
+        source_url, content, fields = await EXTRACTORS[source_type](**params)
+        chapters = fields.pop("_chapters", None)
+        yield format_sse("metadata", {"source_type": source_type, **fields})
+
+        source_id = _source_id(source_type, content)
+        artifact = await _find_artifact(source_id, engine, bool(chapters))
+        if artifact is not None:
+            details = _reuse_artifact(artifact, engine)
+            for entry in details.get("chapters", []):
+                yield format_sse("chapter", entry)
+            chunks = [artifact["summary"]]
+            yield format_sse("token", {"text": artifact["summary"]})
+        else:
+            text_to_summarize = content
+            entries = None
+            if chapters:
+                yield format_sse("status", {"stage": "summarizing_chapters", "chapters": len(chapters)})
+                entries = []
+                async for entry in _stream_chapters(chapters, engine):
+                    entries.append(entry)
+                    yield format_sse("chapter", entry)
+                entries.sort(key=lambda entry: entry["index"])
+                text_to_summarize = _chapter_outline(entries)
+
+            yield format_sse("status", {"stage": "summarizing"})
+            chunks = []
+            details = {}
+            async for text in stage_executor.iterate("llm", summarizer_service.stream_summary,
+                                                     text_to_summarize, source_type, engine, details):
+                chunks.append(text)
+                yield format_sse("token", {"text": text})
+
+            if entries is not None:
+                details["completion_path"] = _chapter_path(details.get("completion_path"))
+                details["chapters"] = entries
+
+        summary = "".join(chunks).strip()
+        if not summary:
+            raise SummarizationError(
+                status.HTTP_502_BAD_GATEWAY,
+                "Unable to generate summary - no response from AI service."
+            )
+
+        result = await _save_summary(user_id, source_type, source_url, content, summary,
+                                     fields, source_id, details)
+        result["summary"].update(_summary_details(details))
+        yield format_sse("done", result)
+
+    except SummarizationError as e:
+        yield format_sse("error", {"status_code": e.status_code, "detail": e.detail})
+    except Exception as e:
+        yield format_sse("error", {
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "detail": f"Summarization failed: {str(e)}"
+        })
+
+
+def _batch_items(videos: List[str]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    One item per distinct video, in request order. Repeated ids are dropped
+    and counted; inputs that are not a YouTube URL or id become items
+    without a ``video_id`` so they are reported back as failures.
+    """
+    items = []
+    seen = set()
+    duplicates = 0
+    for index, value in enumerate(videos):
+        video_id = normalize_video_ref(value)
+        if video_id in seen:
+            duplicates += 1
+            continue
+        if video_id is not None:
+            seen.add(video_id)
+        items.append({"index": index, "input": value, "video_id": video_id})
+
+    if not items:
+        raise SummarizationError(status.HTTP_400_BAD_REQUEST, "No videos to summarize")
+    if len(items) > BATCH_MAX_VIDEOS:
+        raise SummarizationError(
+            status.HTTP_400_BAD_REQUEST,
+            f"Too many videos: {len(items)} (at most {BATCH_MAX_VIDEOS} per batch)"
+        )
+    return items, duplicates
+
+
+async def _summarize_batch_item(user_id: str, item: Dict[str, Any], engine: Optional[str],
+                                chapters: Optional[bool]) -> Dict[str, Any]:
+    result = {"index": item["index"], "input": item["input"], "video_id": item["video_id"]}
+    if item["video_id"] is None:
+        return {**result, "success": False, "status_code": status.HTTP_400_BAD_REQUEST,
+                "detail": "Invalid YouTube URL or video id"}
+    try:
+        response = await summarize_source(user_id, "youtube", engine,
+                                          url=watch_url(item["video_id"]), chapters=chapters)
+        return {**result, "success": True, "summary": response["summary"]}
+    except SummarizationError as e:
+        return {**result, "success": False, "status_code": e.status_code, "detail": e.detail}
+    except Exception as e:
+        return {**result, "success": False, "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "detail": f"Summarization failed: {str(e)}"}
+
+
+async def _stream_batch(user_id: str, items: List[Dict[str, Any]], engine: Optional[str],
+                        chapters: Optional[bool]) -> AsyncIterator[Dict[str, Any]]:
+    # Item results in completion order; pending ones are cancelled if the client goes away
+    tasks = [asyncio.ensure_future(_summarize_batch_item(user_id, item, engine, chapters)) for item in items]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _batch_outline(results: List[Dict[str, Any]]) -> Optional[str]:
+    # Transcripts carry no real title, so videos are told apart by position and id
+    summaries = [result["summary"] for result in results if result["success"]]
+    if len(summaries) < 2:
+        return None
+    return "\n\n".join(f"[Video {position} of {len(summaries)}: {summary['video_id']}]\n{summary['summary']}"
+                        for position, summary in enumerate(summaries, start=1))
+
+
+def _batch_response(results: List[Dict[str, Any]], duplicates: int) -> Dict[str, Any]:
+    results.sort(key=lambda result: result["index"])
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "success": succeeded > 0,
+        "message": f"Summarized {succeeded} of {len(results)} videos",
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "duplicates": duplicates,
+        "items": results
+    }
+
+
+async def summarize_youtube_batch(user_id: str, videos: List[str], engine: Optional[str] = None,
+                                  chapters: Optional[bool] = None, combined: bool = False) -> Dict[str, Any]:
+    """
+    Summarize several videos in parallel. Each video goes through
+    summarize_source, so it lands in the user's history and reuses shared
+    artifacts; transcript fetches are bounded by the youtube.com host limit
+    and summaries by the llm stage. With ``combined`` the per-video
+    summaries are summarized once more into ``combined_summary``.
+    """
+    require_engine(engine)
+    items, duplicates = _batch_items(videos)
+
+    results = [result async for result in _stream_batch(user_id, items, engine, chapters)]
+    response = _batch_response(results, duplicates)
+
+    outline = _batch_outline(response["items"]) if combined else None
+    if outline:
+        result = await stage_executor.run("llm", summarizer_service.summarize_with_details,
+                                          outline, "youtube", engine)
+        response["combined_summary"] = {"summary": result["summary"], **_summary_details(result)}
+    return response
+
+
+async def stream_youtube_batch(user_id: str, videos: List[str], engine: Optional[str] = None,
+                               chapters: Optional[bool] = None, combined: bool = False) -> AsyncIterator[str]:
+    """
+    Server-Sent Events version of summarize_youtube_batch.
+
+    Emits ``status`` with the number of videos, an ``item`` event per video
+    as soon as it finishes (successful or not), ``token`` events for the
+    combined summary when requested, and finally ``done`` with the same
+    payload the blocking endpoint returns.
+    """
+    try:
+        require_engine(engine)
+        items, duplicates = _batch_items(videos)
+        yield format_sse("status", {"stage": "summarizing_videos", "videos": len(items),
+                                    "duplicates": duplicates})
+
+        results = []
+        async for result in _stream_batch(user_id, items, engine, chapters):
+            results.append(result)
+            yield format_sse("item", result)
+        response = _batch_response(results, duplicates)
+
+        outline = _batch_outline(response["items"]) if combined else None
+        if outline:
+            yield format_sse("status", {"stage": "combining"})
+            chunks = []
+            details = {}
+            async for text in stage_executor.iterate("llm", summarizer_service.stream_summary,
+                                                     outline, "youtube", engine, details):
+                chunks.append(text)
+                yield format_sse("token", {"text": text})
+            response["combined_summary"] = {"summary": "".join(chunks).strip(), **_summary_details(details)}
+
+        yield format_sse("done", response)
+
+    except SummarizationError as e:
+        yield format_sse("error", {"status_code": e.status_code, "detail": e.detail})
+    except Exception as e:
+        yield format_sse("error", {
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "detail": f"Summarization failed: {str(e)}"
+        })
+
+
+async def summarize_article_source(user_id: str, url: str, engine: Optional[str] = None,
+                                   include_keywords: bool = False) -> Dict[str, Any]:
+    return await summarize_source(user_id, "article", engine, url=url, include_keywords=include_keywords)
+
+
+async def summarize_github_source(user_id: str, repo_url: str, engine: Optional[str] = None) -> Dict[str, Any]:
+    return await summarize_source(user_id, "github", engine, repo_url=repo_url)
+
+
+async def summarize_pdf_source(user_id: str, filename: str, file_content: Optional[bytes] = None,
+                               file_path: Optional[str] = None, engine: Optional[str] = None) -> Dict[str, Any]:
+    return await summarize_source(user_id, "pdf", engine, filename=filename,
+                                  file_content=file_content, file_path=file_path)
+
+
+async def summarize_youtube_source(user_id: str, url: str, engine: Optional[str] = None,
+                                   chapters: Optional[bool] = None) -> Dict[str, Any]:
+    return await summarize_source(user_id, "youtube", engine, url=url, chapters=chapters)
@@ -1,285 +1,240 @@
-from google import genai
-from google.genai.types import GenerateContentConfig
 import os
-from typing import Optional
+import threading
+from typing import Any, Dict, Iterator, Optional
+from backend.services.summary_engines import (
+    ExtractiveEngine,
+    GeminiEngine,
+    SummaryEngine
+)
+from backend.utils.cache import create_cache, make_cache_key, normalize_content
 
 
 class SummarizerService:
+    """
+    Dispatches summarization to a pluggable engine.
+
+    ``gemini`` produces abstractive summaries through the Gemini API;
+    ``extractive`` is a local TextRank summarizer that needs no network.
+    SUMMARY_ENGINE picks the default (gemini when GEMINI_API_KEY is set,
+    extractive otherwise) and callers may choose one per request. When the
+    chosen engine fails, times out or is over quota, the request falls back
+    to SUMMARY_FALLBACK_ENGINE (``none`` disables the fallback).
+    """
     
-    def __init__(self):
+    def __init__(self, engines: Optional[Dict[str, SummaryEngine]] = None):
+        
+        self.cache = create_cache("summary", "SUMMARY_CACHE", default_ttl=7 * 86400)
+        
+        if engines is None:
+            engines = {
+                "gemini": GeminiEngine(cache=self.cache),
+                "extractive": ExtractiveEngine(
+                    target_words=int(os.getenv("EXTRACTIVE_TARGET_WORDS", 400)),
+                    max_sentences=int(os.getenv("EXTRACTIVE_MAX_SENTENCES", 1500))
+                )
+            }
+        self.engines = engines
         
-        self.api_key = os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
+        gemini = self.engines.get("gemini")
+        default_engine = "gemini" if gemini is not None and gemini.configured else "extractive"
+        self.default_engine = os.getenv("SUMMARY_ENGINE", default_engine)
+        if self.default_engine not in self.engines:
+            raise ValueError(f"Unknown SUMMARY_ENGINE: {self.default_engine}")
         
-        self.client = genai.Client(api_key=self.api_key)
+        fallback_engine = os.getenv("SUMMARY_FALLBACK_ENGINE", "extractive")
+        self.fallback_engine = fallback_engine if fallback_engine in self.engines else None
         
-        self.model_name = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+        self._stats_lock = threading.Lock()
+        self._completion_paths = {}
+        self._engine_usage = {}
+        self._fallbacks = 0
+    
+    @property
+    def model_name(self) -> str:
+        gemini = self.engines.get("gemini")
+        return gemini.model_name if gemini is not None else self.default_engine
+    
+    def get_engine(self, engine: Optional[str] = None) -> SummaryEngine:
+        name = engine or self.default_engine
+        if name not in self.engines:
+            raise ValueError(f"Unknown summary engine: {name}. Available engines: {', '.join(self.engines)}")
+        return self.engines[name]
+    
+    def _cache_key(self, text: str, content_type: str, engine: SummaryEngine) -> str:
+        return make_cache_key(normalize_content(text), content_type, engine.cache_id)
+    
+    def cache_stats(self) -> dict:
+        return self.cache.stats() if self.cache else {"backend": "disabled"}
+    
+    def completion_stats(self) -> dict:
+        with self._stats_lock:
+            return dict(self._completion_paths)
+    
+    def engine_stats(self) -> dict:
+        with self._stats_lock:
+            usage = dict(self._engine_usage)
+            fallbacks = self._fallbacks
+        return {
+            "default": self.default_engine,
+            "fallback": self.fallback_engine,
+            "engines": {name: engine.info() for name, engine in self.engines.items()},
+            "usage": usage,
+            "fallbacks": fallbacks
+        }
+    
+    def _record_path(self, path: str, engine: Optional[str] = None, fallback: bool = False):
+        with self._stats_lock:
+            self._completion_paths[path] = self._completion_paths.get(path, 0) + 1
+            if engine:
+                self._engine_usage[engine] = self._engine_usage.get(engine, 0) + 1
+            if fallback:
+                self._fallbacks += 1
+    
+    def record_reused(self, engine: str):
+        # A stored summary artifact was served without running the engine
+        self._record_path("reused", engine)
+    
+    def _fallback_for(self, engine: SummaryEngine) -> Optional[SummaryEngine]:
+        if self.fallback_engine is None or self.fallback_engine == engine.name:
+            return None
+        return self.engines[self.fallback_engine]
     
     def summarize_text(self, text: str, content_type: str = "text", max_sentences: int = 5) -> str:
-        try:
-            if not text or not text.strip():
-                return "No content available to summarize."
-            
-            if len(text) > 15000:
-                text = "..." + text[-15000:]
+        return self.summarize_with_details(text, content_type)["summary"]
+    
+    def summarize_with_details(self, text: str, content_type: str = "text",
+                               engine: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Summarize ``text`` and report how the summary was produced.
+        
+        ``completion_path`` is one of ``cached``, ``single_pass``, ``trimmed``
+        (the model stopped mid-sentence and the dangling fragment was cut),
+        ``continuation`` (the output hit the token limit and only the tail was
+        sent back for completion), ``extractive``, ``no_response`` or ``error``. ``engine`` names
+        the engine that produced the summary; ``fallback_reason`` is set when
+        it is not the one that was asked for.
+        """
+        selected = self.get_engine(engine)
+        
+        if not text or not text.strip():
+            return {"summary": "No content available to summarize.", "completion_path": "empty",
+                    "usage": {}, "engine": selected.name}
+        
+        candidates = [selected]
+        fallback = self._fallback_for(selected)
+        if fallback is not None:
+            candidates.append(fallback)
+        
+        fallback_reason = None
+        for candidate in candidates:
+            cache_key = self._cache_key(text, content_type, candidate) if self.cache else None
+            if cache_key:
+                cached_summary = self.cache.get(cache_key)
+                if cached_summary:
+                    self._record_path("cached", candidate.name, fallback=fallback_reason is not None)
+                    return self._result(cached_summary, "cached", {}, candidate, fallback_reason)
             
-            prompt = self._create_prompt(text, content_type)
+            try:
+                result = candidate.summarize(text, content_type)
+            except Exception as e:
+                fallback_reason = str(e) or type(e).__name__
+                continue
             
-            config = GenerateContentConfig(
-                temperature=0.3, 
-                max_output_tokens=3000,  
-                top_p=0.8,
-                top_k=40,
-                stop_sequences=None 
-            )
+            self._record_path(result["completion_path"], candidate.name, fallback=fallback_reason is not None)
             
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=config
-            )
+            if not result["summary"]:
+                return self._result("Unable to generate summary - no response from AI service.",
+                                    "no_response", result["usage"], candidate, fallback_reason)
             
-            if response and response.text:
-                summary = response.text.strip()
-                
-                if self._is_summary_truncated(summary):
-                    completion_prompt = f"""
-{prompt}
-
-CRITICAL INSTRUCTIONS:
-1. Provide a COMPLETE summary that ends with a proper conclusion
-2. Ensure the summary is 300-500 words long
-3. End with a complete sentence and proper punctuation
-4. Do not cut off mid-sentence or mid-thought
-5. Include a clear concluding statement
-
-Please generate the complete summary now:
-"""
-                    
-                    extended_config = GenerateContentConfig(
-                        temperature=0.3,
-                        max_output_tokens=4000,  # Even higher limit
-                        top_p=0.8,
-                        top_k=40
-                    )
-                    
-                    response = self.client.models.generate_content(
-                        model=self.model_name,
-                        contents=completion_prompt,
-                        config=extended_config
-                    )
-                    
-                    if response and response.text:
-                        summary = response.text.strip()
-                
-                if summary and not summary.endswith(('.', '!', '?')):
-                    sentences = summary.split('.')
-                    if len(sentences) > 1:
-                        complete_summary = '.'.join(sentences[:-1]) + '.'
-                        return complete_summary
-                
-                return summary if summary else "Unable to generate complete summary."
-            else:
-                return "Unable to generate summary - no response from AI service."
+            if cache_key:
+                self.cache.set(cache_key, result["summary"])
             
-        except Exception as e:
-            return f"Error generating summary: {str(e)}"
-    
-    def _is_summary_truncated(self, summary: str) -> bool:
-        if not summary:
-            return True
-        
-        truncation_indicators = [
-            not summary.strip().endswith(('.', '!', '?')),
-            summary.strip().endswith((',', ';', ':', 'and', 'or', 'but', 'the', 'a', 'an')),
-            # Very short summary (likely cut off)
-            len(summary.split()) < 30,
-            # Ends with "ultimately" or similar transition words without completion
-            any(summary.strip().endswith(word) for word in ['ultimately', 'therefore', 'however', 'moreover', 'furthermore', 'additionally', 'consequently'])
-        ]
+            return self._result(result["summary"], result["completion_path"], result["usage"],
+                                candidate, fallback_reason)
         
-        return any(truncation_indicators)
+        self._record_path("error")
+        return {"summary": f"Error generating summary: {fallback_reason}", "completion_path": "error",
+                "usage": {}, "engine": selected.name}
     
-    def _create_prompt(self, content: str, content_type: str) -> str:
-        base_instruction = """Please provide a comprehensive, detailed summary of the following content. 
-
-IMPORTANT REQUIREMENTS:
-- The summary must be approximately 300-500 words
-- Provide a COMPLETE summary that ends with a proper conclusion
-- End with a complete sentence and proper punctuation
-- Do not cut off mid-sentence or leave thoughts incomplete
-- Cover all important aspects thoroughly
-- Write in clear, flowing paragraphs"""
-        
-        if content_type == "article":
-            prompt = f"""
-{base_instruction}
-
-Article Content:
-{content}
-
-Please create a detailed summary (300-500 words) of this article that includes:
-
-1. **Main Topic & Context**: What is the article about and why is it important?
-2. **Key Points & Arguments**: What are the main ideas, findings, or arguments presented?
-3. **Supporting Details**: Important facts, statistics, examples, or evidence mentioned
-4. **Implications & Impact**: What are the broader implications or potential impact?
-5. **Conclusions & Takeaways**: What are the main conclusions and key takeaways for readers?
-
-Write the summary in clear, flowing paragraphs that provide a comprehensive understanding of the article's content. Make it informative and engaging for someone who hasn't read the original article.
-
-ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
-
-Summary:
-"""
-        
-        elif content_type == "youtube":
-            prompt = f"""
-{base_instruction}
-
-YouTube Video Transcript:
-{content}
-
-Please create a detailed summary (300-500 words) of this video content that includes:
-
-1. **Video Overview**: What is the main topic and purpose of the video?
-2. **Key Content**: What are the main points, lessons, or information shared?
-3. **Important Details**: Specific examples, demonstrations, or explanations provided
-4. **Insights & Analysis**: Any analysis, opinions, or insights offered by the creator
-5. **Practical Value**: What can viewers learn or apply from this content?
-
-Write the summary in clear, engaging paragraphs that capture the essence of the video content. Make it comprehensive enough that someone could understand the main value without watching the video.
-
-ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
-
-Summary:
-"""
-        
-        elif content_type == "github":
-            prompt = f"""
-{base_instruction}
-
-GitHub Repository Information:
-{content}
-
-Please create a detailed summary (300-500 words) of this repository that includes:
-
-1. **Project Overview**: What does this project do and what problem does it solve?
-2. **Technical Details**: What technologies, frameworks, or languages are used?
-3. **Features & Functionality**: What are the main features and capabilities?
-4. **Architecture & Structure**: How is the project organized and structured?
-5. **Usage & Getting Started**: How can developers use, install, or contribute to this project?
-
-Write the summary in clear paragraphs that would help a developer understand whether this project is relevant to their needs and how they might use it.
-
-ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
-
-Summary:
-"""
-        
-        elif content_type == "pdf":
-            prompt = f"""
-{base_instruction}
-
-PDF Document Content:
-{content}
-
-Please create a detailed summary (300-500 words) of this document that includes:
-
-1. **Document Purpose**: What is the main purpose and scope of this document?
-2. **Key Sections**: What are the main sections or chapters and their focus?
-3. **Important Information**: Key facts, findings, data, or insights presented
-4. **Methodology & Approach**: Any methods, processes, or approaches described
-5. **Conclusions & Recommendations**: Main conclusions, recommendations, or outcomes
-
-Write the summary in clear, informative paragraphs that provide a comprehensive overview of the document's content and value.
-
-ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
-
-Summary:
-"""
-        
-        else:  # Default text summarization
-            prompt = f"""
-{base_instruction}
-
-Content:
-{content}
-
-Please create a detailed summary (300-500 words) that includes:
-
-1. **Main Topic**: What is the primary subject or theme?
-2. **Key Information**: What are the most important points or details?
-3. **Supporting Details**: Relevant examples, evidence, or explanations
-4. **Context & Significance**: Why is this information important or relevant?
-5. **Key Takeaways**: What should readers remember or understand from this content?
-
-Write the summary in clear, comprehensive paragraphs that thoroughly cover the content while remaining engaging and informative.
-
-ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
-
-Summary:
-"""
-        
-        return prompt
+    @staticmethod
+    def _result(summary: str, path: str, usage: Dict[str, int], engine: SummaryEngine,
+                fallback_reason: Optional[str]) -> Dict[str, Any]:
+        result = {"summary": summary, "completion_path": path, "usage": usage, "engine": engine.name}
+        if fallback_reason is not None:
+            result["fallback_reason"] = fallback_reason
+        return result
     
-    def test_connection(self) -> dict:
+    def stream_summary(self, text: str, content_type: str = "text", engine: Optional[str] = None,
+                       details: Optional[Dict[str, Any]] = None) -> Iterator[str]:
         """
-        Test the connection to Gemini API and check model capabilities
-        
-        Returns:
-            Dictionary with connection test results
+        Yield the summary as the engine produces it. A cached summary is
+        yielded in one piece; a freshly streamed one is cached once it
+        completes. If the engine fails before producing any text, the
+        fallback engine is streamed instead; errors after the first piece
+        propagate to the caller. ``details``, when given, is filled with the
+        ``engine`` and ``completion_path`` that produced the summary.
         """
-        try:
-            # Test with a simple prompt that should generate a complete response
-            test_prompt = """Please write a complete 200-word summary about the importance of APIs in modern software development. 
-            Make sure to end with a proper conclusion and complete sentence."""
+        if details is None:
+            details = {}
+        selected = self.get_engine(engine)
+        
+        if not text or not text.strip():
+            yield "No content available to summarize."
+            return
+        
+        fallback = self._fallback_for(selected)
+        candidates = [selected] + ([fallback] if fallback is not None else [])
+        
+        for position, candidate in enumerate(candidates):
+            is_fallback = position > 0
+            cache_key = self._cache_key(text, content_type, candidate) if self.cache else None
+            if cache_key:
+                cached_summary = self.cache.get(cache_key)
+                if cached_summary:
+                    self._record_path("cached", candidate.name, fallback=is_fallback)
+                    details.update(engine=candidate.name, completion_path="cached")
+                    yield cached_summary
+                    return
             
-            config = GenerateContentConfig(
-                temperature=0.3,
-                max_output_tokens=1000
-            )
+            chunks = []
+            try:
+                path = yield from self._stream_engine(candidate, text, content_type, chunks)
+            except Exception as e:
+                if chunks or position == len(candidates) - 1:
+                    self._record_path("error")
+                    raise
+                details["fallback_reason"] = str(e) or type(e).__name__
+                continue
             
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=test_prompt,
-                config=config
-            )
+            path = path or "single_pass"
+            self._record_path(path, candidate.name, fallback=is_fallback)
+            details.update(engine=candidate.name, completion_path=path)
             
-            if response and response.text:
-                response_text = response.text.strip()
-                word_count = len(response_text.split())
-                is_complete = response_text.endswith(('.', '!', '?'))
-                
-                return {
-                    "success": True,
-                    "message": "Gemini API connection successful",
-                    "model": self.model_name,
-                    "response_length": word_count,
-                    "response_complete": is_complete,
-                    "sample_response": response_text[:100] + "..." if len(response_text) > 100 else response_text
-                }
-            else:
-                return {
-                    "success": False,
-                    "message": "No response from Gemini API",
-                    "model": self.model_name
-                }
-                
-        except Exception as e:
-            return {
-                "success": False,
-                "message": f"Gemini API connection failed: {str(e)}",
-                "model": self.model_name
-            }
+            summary = "".join(chunks).strip()
+            if cache_key and summary:
+                self.cache.set(cache_key, summary)
+            return
+    
+    @staticmethod
+    def _stream_engine(engine: SummaryEngine, text: str, content_type: str, chunks: list):
+        stream = engine.stream(text, content_type)
+        while True:
+            try:
+                piece = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            chunks.append(piece)
+            yield piece
+    
+    def test_connection(self) -> dict:
+        gemini = self.engines.get("gemini")
+        if gemini is None:
+            return {"success": False, "message": "Gemini engine is not registered", "model": None}
+        return gemini.test_connection()
 
 
 # Create global summarizer service instance
-try:
-    summarizer_service = SummarizerService()
-except ValueError:
-    summarizer_service = None
+summarizer_service = SummarizerService()
 
 
 # Legacy function for backward compatibility
@@ -292,24 +247,7 @@ def summarize_text(text: str, max_sentences: int = 5) -> str:
         max_sentences: Maximum sentences (deprecated, now generates 300-500 word summaries)
         
     Returns:
-        Generated comprehensive summary (300-500 words)
+        Generated summary from the default engine, falling back to the
+        local extractive engine when Gemini is not available
     """
-    if summarizer_service:
-        return summarizer_service.summarize_text(text, "text")
-    else:
-        # Fallback to simple summarization if Gemini is not available
-        if not text:
-            return ""
-        
-        # For fallback, try to create a longer summary by taking more content
-        sentences = text.split('.')
-        # Take more sentences for a longer fallback summary
-        longer_summary = '.'.join(s.strip() for s in sentences[:max_sentences * 3] if s.strip())
-        
-        if longer_summary:
-            longer_summary += '.'
-            # Add a note about the fallback
-            if len(longer_summary) < 200:
-                longer_summary += " (Note: This is a basic text extraction as AI summarization is not available.)"
-        
-        return longer_summary
\ No newline at end of file
+    return summarizer_service.summarize_text(text, "text")
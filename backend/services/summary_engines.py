@@ -0,0 +1,761 @@
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional
+from backend.utils.cache import make_cache_key, normalize_content
+from backend.utils.chunking import estimate_tokens, split_into_chunks
+from backend.utils.lazy_import import lazy_import, module_available
+
+# Both are imported on first use; google-genai alone adds most of the
+# backend's import time.
+genai = lazy_import("google.genai")
+genai_types = lazy_import("google.genai.types")
+GENAI_AVAILABLE = module_available("google.genai")
+
+np = lazy_import("numpy")
+NUMPY_AVAILABLE = module_available("numpy")
+
+# Bump whenever _create_prompt or the generation settings change so cached
+# summaries produced by the old prompt are no longer served.
+PROMPT_VERSION = "3"
+
+# Content type for one chapter of a longer source. Chapter summaries are
+# short (CHAPTER_SUMMARY_WORDS) so the outline they are reduced from stays
+# within a single request; the content type keeps them apart in the cache.
+CHAPTER_CONTENT_TYPE = "chapter"
+CHAPTER_SUMMARY_WORDS = int(os.getenv("CHAPTER_SUMMARY_WORDS", 120))
+
+SOURCE_LABELS = {
+    "article": "web article",
+    "youtube": "video transcript",
+    "pdf": "PDF document",
+    "github": "GitHub repository description",
+    "text": "text",
+    CHAPTER_CONTENT_TYPE: "video chapter"
+}
+
+
+class EngineUnavailableError(RuntimeError):
+    """Raised when an engine cannot serve requests right now."""
+
+
+class SummaryEngine:
+    """
+    A summarization backend that SummarizerService dispatches to.
+
+    ``summarize`` returns ``{"summary", "completion_path", "usage"}`` and
+    raises on failure so the caller can fall back to another engine.
+    ``stream`` yields text pieces and returns the completion path.
+    ``cache_id`` goes into the summary cache key, so two engines (or two
+    configurations of one engine) never share cached summaries.
+    """
+
+    name = "base"
+
+    @property
+    def cache_id(self) -> str:
+        return self.name
+
+    def is_available(self) -> bool:
+        return True
+
+    def summarize(self, text: str, content_type: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def stream(self, text: str, content_type: str) -> Iterator[str]:
+        result = self.summarize(text, content_type)
+        if result["summary"]:
+            yield result["summary"]
+        return result["completion_path"]
+
+    def info(self) -> Dict[str, Any]:
+        return {"available": self.is_available()}
+
+
+_STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have having
+he her here hers herself him himself his how i if in into is it its itself just me more most my myself no
+nor not now of off on once only or other our ours ourselves out over own same she should so some such than
+that the their theirs them themselves then there these they this those through to too under until up very
+was we were what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'(\[])')
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9'\-]*")
+
+
+class ExtractiveEngine(SummaryEngine):
+    """
+    Local extractive summarizer: TextRank over TF-IDF sentence vectors.
+
+    Sentences are scored by PageRank (power iteration) on their cosine
+    similarity graph, and the best ones are returned in their original order
+    until ``target_words`` is reached. Runs entirely in-process, so it needs
+    no network and finishes in milliseconds for typical documents. Without
+    NumPy, sentences are ranked by their summed TF-IDF weight instead.
+    """
+
+    name = "extractive"
+
+    def __init__(self, target_words: int = 400, max_sentences: int = 1500,
+                 max_vocabulary: int = 5000, damping: float = 0.85):
+        self.target_words = target_words
+        self.max_sentences = max_sentences
+        self.max_vocabulary = max_vocabulary
+        self.damping = damping
+
+    @property
+    def cache_id(self) -> str:
+        return f"extractive:{self.target_words}"
+
+    def info(self) -> Dict[str, Any]:
+        return {"available": True, "vectorized": NUMPY_AVAILABLE, "target_words": self.target_words}
+
+    def _target_words(self, content_type: str) -> int:
+        if content_type == CHAPTER_CONTENT_TYPE:
+            return min(self.target_words, CHAPTER_SUMMARY_WORDS)
+        return self.target_words
+
+    def summarize(self, text: str, content_type: str) -> Dict[str, Any]:
+        sentences = self._select(text, self._target_words(content_type))
+        return {"summary": self._join(sentences) or None, "completion_path": "extractive", "usage": {}}
+
+    def stream(self, text: str, content_type: str) -> Iterator[str]:
+        sentences = self._select(text, self._target_words(content_type))
+        for index, sentence in enumerate(sentences):
+            yield sentence if index == 0 else " " + sentence
+        return "extractive"
+
+    @staticmethod
+    def _join(sentences: List[str]) -> str:
+        return " ".join(sentences)
+
+    def _split_sentences(self, text: str) -> List[str]:
+        sentences = []
+        for paragraph in re.split(r'\n\s*\n', text):
+            paragraph = re.sub(r'\s+', ' ', paragraph).strip()
+            if not paragraph:
+                continue
+            sentences.extend(s.strip() for s in _SENTENCE_SPLIT.split(paragraph) if s.strip())
+        return sentences
+
+    def _select(self, text: str, target_words: int) -> List[str]:
+        sentences = self._split_sentences(text)
+        # Very long inputs are thinned evenly so the similarity matrix stays small
+        if len(sentences) > self.max_sentences:
+            step = len(sentences) / self.max_sentences
+            sentences = [sentences[int(i * step)] for i in range(self.max_sentences)]
+
+        if sum(len(s.split()) for s in sentences) <= target_words:
+            return sentences
+
+        tokens = [[t for t in _TOKEN.findall(s.lower()) if len(t) > 2 and t not in _STOPWORDS] for s in sentences]
+        if NUMPY_AVAILABLE:
+            scores = self._textrank_scores(tokens)
+        else:
+            scores = self._tfidf_scores(tokens)
+
+        chosen = []
+        words = 0
+        for index in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+            length = len(sentences[index].split())
+            # Skip fragments and run-on boilerplate such as navigation text
+            if length < 4 or length > 120:
+                continue
+            chosen.append(index)
+            words += length
+            if words >= target_words:
+                break
+
+        if not chosen:
+            return self._lead(sentences, target_words)
+        return [sentences[index] for index in sorted(chosen)]
+
+    def _lead(self, sentences: List[str], target_words: int) -> List[str]:
+        lead = []
+        words = 0
+        for sentence in sentences:
+            lead.append(sentence)
+            words += len(sentence.split())
+            if words >= target_words:
+                break
+        return lead
+
+    def _vocabulary(self, tokens: List[List[str]]) -> Dict[str, int]:
+        document_frequency = Counter(term for sentence in tokens for term in set(sentence))
+        terms = [term for term, _ in document_frequency.most_common(self.max_vocabulary)]
+        return {term: index for index, term in enumerate(terms)}
+
+    def _textrank_scores(self, tokens: List[List[str]]):
+        vocabulary = self._vocabulary(tokens)
+        count = len(tokens)
+        if not vocabulary or count < 2:
+            return np.ones(count)
+
+        rows, cols = [], []
+        for row, sentence in enumerate(tokens):
+            for term in sentence:
+                column = vocabulary.get(term)
+                if column is not None:
+                    rows.append(row)
+                    cols.append(column)
+
+        term_counts = np.zeros((count, len(vocabulary)), dtype=np.float32)
+        np.add.at(term_counts, (np.array(rows, dtype=np.intp), np.array(cols, dtype=np.intp)), 1.0)
+
+        document_frequency = np.count_nonzero(term_counts, axis=0)
+        idf = np.log((1.0 + count) / (1.0 + document_frequency)) + 1.0
+        vectors = np.log1p(term_counts) * idf
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors /= np.where(norms == 0, 1.0, norms)
+
+        similarity = vectors @ vectors.T
+        np.fill_diagonal(similarity, 0.0)
+        out_weight = similarity.sum(axis=1, keepdims=True)
+        # Sentences with no similar neighbours link uniformly to everything
+        transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1.0, out_weight), 1.0 / count)
+
+        scores = np.full(count, 1.0 / count)
+        teleport = (1.0 - self.damping) / count
+        for _ in range(100):
+            updated = teleport + self.damping * (transition.T @ scores)
+            converged = np.abs(updated - scores).sum() < 1e-6
+            scores = updated
+            if converged:
+                break
+
+        # Light lead bias: opening sentences usually state the topic
+        position = np.arange(count)
+        return scores * (1.0 + 0.15 * np.exp(-position / max(1.0, count / 10)))
+
+    def _tfidf_scores(self, tokens: List[List[str]]) -> List[float]:
+        count = len(tokens)
+        document_frequency = Counter(term for sentence in tokens for term in set(sentence))
+        scores = []
+        for index, sentence in enumerate(tokens):
+            if not sentence:
+                scores.append(0.0)
+                continue
+            weight = sum(math.log((1.0 + count) / (1.0 + document_frequency[term])) + 1.0 for term in sentence)
+            lead_bonus = 1.0 + 0.15 * math.exp(-index / max(1.0, count / 10))
+            scores.append(weight / math.sqrt(len(sentence)) * lead_bonus)
+        return scores
+
+
+class GeminiEngine(SummaryEngine):
+    """
+    Gemini-backed abstractive summaries: map-reduce for long content and a
+    tail-only continuation when the output hits the token limit.
+
+    Quota errors (HTTP 429 / RESOURCE_EXHAUSTED) put the engine into a
+    cooldown of GEMINI_QUOTA_COOLDOWN seconds during which it reports itself
+    unavailable, so callers fall back without waiting on a request that is
+    bound to fail. GEMINI_TIMEOUT_SECONDS (default 60, 0 disables) caps each
+    API call so a slow response falls back instead of hanging the request.
+    """
+
+    name = "gemini"
+
+    def __init__(self, cache=None):
+        self.api_key = os.getenv("GEMINI_API_KEY")
+        self.model_name = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+        self.cache = cache
+
+        self.configured = GENAI_AVAILABLE and bool(self.api_key)
+        self.timeout = float(os.getenv("GEMINI_TIMEOUT_SECONDS", 60))
+        self._client = None
+
+        # Content up to single_pass_tokens is summarized in one request; longer
+        # content is split into chunk_tokens pieces that are summarized in
+        # parallel (map) and then combined into the final summary (reduce).
+        self.single_pass_tokens = int(os.getenv("SUMMARY_SINGLE_PASS_TOKENS", 4000))
+        self.chunk_tokens = int(os.getenv("SUMMARY_CHUNK_TOKENS", 3000))
+        self.chunk_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv("SUMMARY_CHUNK_CONCURRENCY", 4)),
+            thread_name_prefix="summary-chunk"
+        )
+
+        # How much of a cut-off summary is sent back for a continuation request
+        self.continuation_tail_chars = int(os.getenv("SUMMARY_CONTINUATION_TAIL_CHARS", 1500))
+
+        self.quota_cooldown = float(os.getenv("GEMINI_QUOTA_COOLDOWN", 60))
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> Optional["genai.Client"]:
+        # Built on first request so importing the service never loads the SDK
+        if not self.configured:
+            return None
+        with self._client_lock:
+            if self._client is None:
+                http_options = (
+                    genai_types.HttpOptions(timeout=int(self.timeout * 1000)) if self.timeout > 0 else None
+                )
+                self._client = genai.Client(api_key=self.api_key, http_options=http_options)
+            return self._client
+
+    @property
+    def cache_id(self) -> str:
+        return f"gemini:{self.model_name}:{PROMPT_VERSION}"
+
+    def is_available(self) -> bool:
+        return self.configured and time.monotonic() >= self._cooldown_until
+
+    def info(self) -> Dict[str, Any]:
+        cooldown = max(0.0, self._cooldown_until - time.monotonic())
+        return {
+            "available": self.is_available(),
+            "configured": self.configured,
+            "model": self.model_name,
+            "cooldown_seconds": round(cooldown, 1)
+        }
+
+    def _check_available(self):
+        if not self.configured:
+            raise EngineUnavailableError("Gemini is not configured. Please check GEMINI_API_KEY configuration.")
+        if time.monotonic() < self._cooldown_until:
+            raise EngineUnavailableError("Gemini quota exhausted; cooling down")
+
+    @staticmethod
+    def is_quota_error(error: Exception) -> bool:
+        code = getattr(error, "code", None) or getattr(error, "status_code", None)
+        return code == 429 or "RESOURCE_EXHAUSTED" in str(error)
+
+    def _note_error(self, error: Exception):
+        if self.is_quota_error(error):
+            with self._lock:
+                self._cooldown_until = time.monotonic() + self.quota_cooldown
+
+    def summarize(self, text: str, content_type: str) -> Dict[str, Any]:
+        self._check_available()
+        try:
+            return self._generate_summary(text, content_type)
+        except Exception as e:
+            self._note_error(e)
+            raise
+
+    def stream(self, text: str, content_type: str) -> Iterator[str]:
+        """
+        Yield the summary as Gemini produces it. If the stream stops at the
+        token limit, a tail-only continuation is streamed after it.
+        """
+        self._check_available()
+        try:
+            prompt = self._prepare_prompt(text, content_type)
+
+            chunks = []
+            finish_reason = None
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config()
+            ):
+                finish_reason = self._finish_reason(chunk) or finish_reason
+                if chunk.text:
+                    chunks.append(chunk.text)
+                    yield chunk.text
+
+            if finish_reason == "MAX_TOKENS" and chunks:
+                continuation_prompt = self._create_continuation_prompt("".join(chunks))
+                first = True
+                for chunk in self.client.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=continuation_prompt,
+                    config=self._continuation_config()
+                ):
+                    if chunk.text:
+                        text_part = chunk.text
+                        if first:
+                            text_part = self._continuation_separator(chunks[-1], text_part) + text_part
+                        first = False
+                        chunks.append(text_part)
+                        yield text_part
+                return "continuation"
+            return "single_pass"
+        except Exception as e:
+            self._note_error(e)
+            raise
+
+    def _prepare_prompt(self, text: str, content_type: str) -> str:
+        if estimate_tokens(text) <= self.single_pass_tokens:
+            return self._create_prompt(text, content_type)
+        
+        partial_summaries = self._map_chunks(text, content_type)
+        
+        # Keep reducing until the section summaries fit in a single request
+        while estimate_tokens("\n\n".join(partial_summaries)) > self.single_pass_tokens and len(partial_summaries) > 1:
+            partial_summaries = self._map_chunks("\n\n".join(partial_summaries), "text")
+        
+        sections = "\n\n".join(
+            f"[Section {index} of {len(partial_summaries)}]\n{partial}"
+            for index, partial in enumerate(partial_summaries, start=1)
+        )
+        content = (
+            "The original content was too long to include in full. Below are summaries "
+            "of its consecutive sections, in order. Base the summary on all of them.\n\n"
+            f"{sections}"
+        )
+        return self._create_prompt(content, content_type)
+    
+    def _map_chunks(self, text: str, content_type: str) -> List[str]:
+        chunks = split_into_chunks(text, self.chunk_tokens)
+        futures = [
+            self.chunk_executor.submit(self._summarize_chunk, chunk, index, len(chunks), content_type)
+            for index, chunk in enumerate(chunks, start=1)
+        ]
+        return [future.result() for future in futures]
+    
+    def _summarize_chunk(self, chunk: str, index: int, total: int, content_type: str) -> str:
+        # Chunk summaries are cached on their own, so re-running a document
+        # where only some sections changed only recomputes those sections.
+        cache_key = make_cache_key("chunk", normalize_content(chunk), content_type,
+                                   self.model_name, PROMPT_VERSION) if self.cache else None
+        if cache_key:
+            cached_summary = self.cache.get(cache_key)
+            if cached_summary:
+                return cached_summary
+        
+        source_label = SOURCE_LABELS.get(content_type, "text")
+        prompt = f"""
+The following is section {index} of {total} from a longer {source_label}.
+
+Summarize this section in 150-250 words. Keep every important fact, name, figure, argument and conclusion it contains, in the order they appear. Do not add an introduction or refer to "this section"; write plain prose that can be combined with the summaries of the other sections.
+
+Section Content:
+{chunk}
+
+Section Summary:
+"""
+        
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=genai_types.GenerateContentConfig(
+                temperature=0.2,
+                max_output_tokens=800,
+                top_p=0.8,
+                top_k=40
+            )
+        )
+        
+        if not response or not response.text:
+            raise RuntimeError(f"No response from AI service for section {index} of {total}")
+        
+        summary = response.text.strip()
+        if cache_key:
+            self.cache.set(cache_key, summary)
+        return summary
+    
+    def _generation_config(self) -> "genai_types.GenerateContentConfig":
+        return genai_types.GenerateContentConfig(
+            temperature=0.3, 
+            max_output_tokens=3000,  
+            top_p=0.8,
+            top_k=40,
+            stop_sequences=None 
+        )
+    
+    def _generate_summary(self, text: str, content_type: str) -> Dict[str, Any]:
+        """
+        Call Gemini for a single summary. The summary is None when the model
+        gives back no text; API errors raise so failures are never cached.
+        """
+        prompt = self._prepare_prompt(text, content_type)
+        
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=self._generation_config()
+        )
+        
+        if not response or not response.text:
+            return {"summary": None, "completion_path": "single_pass", "usage": self._usage(response)}
+        
+        summary = response.text.strip()
+        usage = self._usage(response)
+        path = "single_pass"
+        
+        # Only a real token-limit stop needs more output. Instead of resending
+        # the whole prompt, ask the model to finish from the tail of what it
+        # already wrote.
+        if self._finish_reason(response) == "MAX_TOKENS":
+            continuation = self.client.models.generate_content(
+                model=self.model_name,
+                contents=self._create_continuation_prompt(summary),
+                config=self._continuation_config()
+            )
+            if continuation and continuation.text:
+                addition = continuation.text.strip()
+                summary = summary + self._continuation_separator(summary, addition) + addition
+                path = "continuation"
+                for key, value in self._usage(continuation).items():
+                    usage[key] = usage.get(key, 0) + value
+        
+        if not summary.endswith(('.', '!', '?')):
+            trimmed = self._trim_to_last_sentence(summary)
+            if trimmed != summary:
+                summary = trimmed
+                if path == "single_pass":
+                    path = "trimmed"
+        
+        return {"summary": summary or None, "completion_path": path, "usage": usage}
+    
+    @staticmethod
+    def _finish_reason(response) -> Optional[str]:
+        try:
+            reason = response.candidates[0].finish_reason
+        except (AttributeError, IndexError, TypeError):
+            return None
+        if reason is None:
+            return None
+        return getattr(reason, "name", str(reason)).split(".")[-1]
+    
+    @staticmethod
+    def _usage(response) -> Dict[str, int]:
+        metadata = getattr(response, "usage_metadata", None)
+        if not metadata:
+            return {}
+        usage = {}
+        for field in ("prompt_token_count", "candidates_token_count", "total_token_count"):
+            value = getattr(metadata, field, None)
+            if value is not None:
+                usage[field] = value
+        return usage
+    
+    @staticmethod
+    def _trim_to_last_sentence(summary: str) -> str:
+        sentences = summary.split('.')
+        if len(sentences) > 1:
+            return '.'.join(sentences[:-1]) + '.'
+        return summary
+    
+    @staticmethod
+    def _continuation_separator(existing: str, addition: str) -> str:
+        if not existing or existing[-1].isspace() or not addition or addition[0].isspace() or addition[0] in ".,;:!?":
+            return ""
+        return " "
+    
+    def _create_continuation_prompt(self, partial_summary: str) -> str:
+        tail = partial_summary[-self.continuation_tail_chars:]
+        return f"""
+The following summary was cut off before it was finished. Here is how it currently ends:
+
+...{tail}
+
+Continue the summary from exactly where it stops. Output ONLY the continuation text, without repeating anything above. Finish the current thought, then close with a brief concluding statement in at most 150 words, ending with a complete sentence and proper punctuation.
+
+Continuation:
+"""
+    
+    def _continuation_config(self) -> "genai_types.GenerateContentConfig":
+        return genai_types.GenerateContentConfig(
+            temperature=0.3,
+            max_output_tokens=600,
+            top_p=0.8,
+            top_k=40
+        )
+    
+    def _create_prompt(self, content: str, content_type: str) -> str:
+        if content_type == CHAPTER_CONTENT_TYPE:
+            return self._create_chapter_prompt(content)
+
+        base_instruction = """Please provide a comprehensive, detailed summary of the following content. 
+
+IMPORTANT REQUIREMENTS:
+- The summary must be approximately 300-500 words
+- Provide a COMPLETE summary that ends with a proper conclusion
+- End with a complete sentence and proper punctuation
+- Do not cut off mid-sentence or leave thoughts incomplete
+- Cover all important aspects thoroughly
+- Write in clear, flowing paragraphs"""
+        
+        if content_type == "article":
+            prompt = f"""
+{base_instruction}
+
+Article Content:
+{content}
+
+Please create a detailed summary (300-500 words) of this article that includes:
+
+1. **Main Topic & Context**: What is the article about and why is it important?
+2. **Key Points & Arguments**: What are the main ideas, findings, or arguments presented?
+3. **Supporting Details**: Important facts, statistics, examples, or evidence mentioned
+4. **Implications & Impact**: What are the broader implications or potential impact?
+5. **Conclusions & Takeaways**: What are the main conclusions and key takeaways for readers?
+
+Write the summary in clear, flowing paragraphs that provide a comprehensive understanding of the article's content. Make it informative and engaging for someone who hasn't read the original article.
+
+ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
+
+Summary:
+"""
+        
+        elif content_type == "youtube":
+            prompt = f"""
+{base_instruction}
+
+YouTube Video Transcript:
+{content}
+
+Please create a detailed summary (300-500 words) of this video content that includes:
+
+1. **Video Overview**: What is the main topic and purpose of the video?
+2. **Key Content**: What are the main points, lessons, or information shared?
+3. **Important Details**: Specific examples, demonstrations, or explanations provided
+4. **Insights & Analysis**: Any analysis, opinions, or insights offered by the creator
+5. **Practical Value**: What can viewers learn or apply from this content?
+
+Write the summary in clear, engaging paragraphs that capture the essence of the video content. Make it comprehensive enough that someone could understand the main value without watching the video.
+
+ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
+
+Summary:
+"""
+        
+        elif content_type == "github":
+            prompt = f"""
+{base_instruction}
+
+GitHub Repository Information:
+{content}
+
+Please create a detailed summary (300-500 words) of this repository that includes:
+
+1. **Project Overview**: What does this project do and what problem does it solve?
+2. **Technical Details**: What technologies, frameworks, or languages are used?
+3. **Features & Functionality**: What are the main features and capabilities?
+4. **Architecture & Structure**: How is the project organized and structured?
+5. **Usage & Getting Started**: How can developers use, install, or contribute to this project?
+
+Write the summary in clear paragraphs that would help a developer understand whether this project is relevant to their needs and how they might use it.
+
+ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
+
+Summary:
+"""
+        
+        elif content_type == "pdf":
+            prompt = f"""
+{base_instruction}
+
+PDF Document Content:
+{content}
+
+Please create a detailed summary (300-500 words) of this document that includes:
+
+1. **Document Purpose**: What is the main purpose and scope of this document?
+2. **Key Sections**: What are the main sections or chapters and their focus?
+3. **Important Information**: Key facts, findings, data, or insights presented
+4. **Methodology & Approach**: Any methods, processes, or approaches described
+5. **Conclusions & Recommendations**: Main conclusions, recommendations, or outcomes
+
+Write the summary in clear, informative paragraphs that provide a comprehensive overview of the document's content and value.
+
+ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
+
+Summary:
+"""
+        
+        else:  # Default text summarization
+            prompt = f"""
+{base_instruction}
+
+Content:
+{content}
+
+Please create a detailed summary (300-500 words) that includes:
+
+1. **Main Topic**: What is the primary subject or theme?
+2. **Key Information**: What are the most important points or details?
+3. **Supporting Details**: Relevant examples, evidence, or explanations
+4. **Context & Significance**: Why is this information important or relevant?
+5. **Key Takeaways**: What should readers remember or understand from this content?
+
+Write the summary in clear, comprehensive paragraphs that thoroughly cover the content while remaining engaging and informative.
+
+ENSURE THE SUMMARY IS COMPLETE AND ENDS WITH A PROPER CONCLUSION.
+
+Summary:
+"""
+        
+        return prompt
+    
+    @staticmethod
+    def _create_chapter_prompt(content: str) -> str:
+        low, high = max(40, CHAPTER_SUMMARY_WORDS - 40), CHAPTER_SUMMARY_WORDS + 30
+        return f"""
+The following is one chapter of a longer video transcript.
+
+Summarize this chapter in {low}-{high} words. Keep its key points, names, figures and conclusions, in the order they appear. Do not add an introduction, headings or lists, and do not refer to "this chapter"; write one plain paragraph that can be combined with the summaries of the other chapters. End with a complete sentence.
+
+Chapter Transcript:
+{content}
+
+Chapter Summary:
+"""
+    
+    def test_connection(self) -> dict:
+        """
+        Test the connection to Gemini API and check model capabilities
+        
+        Returns:
+            Dictionary with connection test results
+        """
+        if not self.configured:
+            return {
+                "success": False,
+                "message": "Gemini API is not configured",
+                "model": self.model_name
+            }
+
+        try:
+            # Test with a simple prompt that should generate a complete response
+            test_prompt = """Please write a complete 200-word summary about the importance of APIs in modern software development. 
+            Make sure to end with a proper conclusion and complete sentence."""
+            
+            config = genai_types.GenerateContentConfig(
+                temperature=0.3,
+                max_output_tokens=1000
+            )
+            
+            response = self.client.models.generate_content(
+                model=self.model_name,
+                contents=test_prompt,
+                config=config
+            )
+            
+            if response and response.text:
+                response_text = response.text.strip()
+                word_count = len(response_text.split())
+                is_complete = response_text.endswith(('.', '!', '?'))
+                
+                return {
+                    "success": True,
+                    "message": "Gemini API connection successful",
+                    "model": self.model_name,
+                    "response_length": word_count,
+                    "response_complete": is_complete,
+                    "sample_response": response_text[:100] + "..." if len(response_text) > 100 else response_text
+                }
+            else:
+                return {
+                    "success": False,
+                    "message": "No response from Gemini API",
+                    "model": self.model_name
+                }
+                
+        except Exception as e:
+            return {
+                "success": False,
+                "message": f"Gemini API connection failed: {str(e)}",
+                "model": self.model_name
+            }
+
@@ -0,0 +1,80 @@
+import os
+import threading
+from typing import Any, Dict, List, Optional
+from backend.utils.cache import create_cache, make_cache_key
+
+
+class TranscriptStore:
+    """
+    Fetched YouTube transcripts keyed by (video_id, language_code,
+    is_generated), holding the raw timestamped snippets and the cleaned text.
+
+    Next to the transcripts it keeps each video's track listing for
+    ``listing_ttl`` seconds, so a repeat request neither lists nor fetches,
+    and a negative entry for ``negative_ttl`` seconds when a video has no
+    usable captions, so known-uncaptioned videos fail without a request.
+    The cache TTL and size limits bound the transcripts themselves.
+    """
+
+    def __init__(self, cache, listing_ttl: float = 86400, negative_ttl: float = 6 * 3600):
+        self.cache = cache
+        self.listing_ttl = listing_ttl
+        self.negative_ttl = negative_ttl
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "listing_hits": 0, "negative_hits": 0, "negative_stored": 0}
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def _get(self, *parts: Any) -> Optional[Any]:
+        return self.cache.get(make_cache_key(*parts)) if self.cache else None
+
+    def _set(self, value: Any, ttl: Optional[float], *parts: Any):
+        if self.cache:
+            self.cache.set(make_cache_key(*parts), value, ttl)
+
+    def unavailable(self, video_id: str) -> Optional[str]:
+        error = self._get("none", video_id)
+        if error is not None:
+            self._count("negative_hits")
+        return error
+
+    def mark_unavailable(self, video_id: str, error: str):
+        if self.negative_ttl > 0:
+            self._count("negative_stored")
+            self._set(error, self.negative_ttl, "none", video_id)
+
+    def listing(self, video_id: str) -> Optional[List[Dict[str, Any]]]:
+        tracks = self._get("listing", video_id)
+        if tracks is not None:
+            self._count("listing_hits")
+        return tracks
+
+    def store_listing(self, video_id: str, tracks: List[Dict[str, Any]]):
+        if self.listing_ttl > 0:
+            self._set(tracks, self.listing_ttl, "listing", video_id)
+
+    def transcript(self, video_id: str, language_code: str, is_generated: bool) -> Optional[Dict[str, Any]]:
+        entry = self._get("transcript", video_id, language_code, is_generated)
+        self._count("hits" if entry is not None else "misses")
+        return entry
+
+    def store_transcript(self, entry: Dict[str, Any]):
+        self._set(entry, None, "transcript", entry["video_id"], entry["language_code"], entry["is_generated"])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["listing_ttl"] = self.listing_ttl
+        stats["negative_ttl"] = self.negative_ttl
+        stats["cache"] = self.cache.stats() if self.cache else {"backend": "disabled"}
+        return stats
+
+
+transcript_store = TranscriptStore(
+    create_cache("transcript", "TRANSCRIPT_CACHE", default_ttl=30 * 86400,
+                 default_memory_entries=500, default_memory_bytes=64 * 1024 * 1024),
+    listing_ttl=float(os.getenv("TRANSCRIPT_LISTING_TTL", 86400)),
+    negative_ttl=float(os.getenv("TRANSCRIPT_NEGATIVE_TTL", 6 * 3600))
+)
@@ -1,13 +1,268 @@
+import os
 import re
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from urllib.parse import urlparse, parse_qs
+from backend.utils.chunking import limit_content
+from backend.services.transcript_store import transcript_store
+from backend.utils.http_client import http_client
+from backend.utils.lazy_import import lazy_import, module_available
 
-try:
-    from youtube_transcript_api import YouTubeTranscriptApi
-    from youtube_transcript_api.formatters import TextFormatter
-    YOUTUBE_API_AVAILABLE = True
-except ImportError:
-    YOUTUBE_API_AVAILABLE = False
+youtube_transcript_api = lazy_import("youtube_transcript_api")
+YOUTUBE_API_AVAILABLE = module_available("youtube_transcript_api")
+
+# Preferred transcript languages, best first, and whether a manual track
+# beats an auto-generated one in the same language
+TRANSCRIPT_LANGUAGES = [
+    code.strip() for code in os.getenv("YOUTUBE_TRANSCRIPT_LANGUAGES", "en,en-US,en-GB,en-CA,en-AU").split(",")
+    if code.strip()
+]
+PREFER_MANUAL_TRANSCRIPTS = os.getenv("YOUTUBE_PREFER_MANUAL", "true").lower() == "true"
+
+# Chapter segmentation: a chapter ends at a pause of at least
+# CHAPTER_PAUSE_SECONDS once it is CHAPTER_MIN_SECONDS long, and is cut
+# regardless at CHAPTER_MAX_SECONDS or CHAPTER_MAX_CHARS.
+CHAPTER_PAUSE_SECONDS = float(os.getenv("YOUTUBE_CHAPTER_PAUSE_SECONDS", 1.5))
+CHAPTER_MIN_SECONDS = float(os.getenv("YOUTUBE_CHAPTER_MIN_SECONDS", 120))
+CHAPTER_MAX_SECONDS = float(os.getenv("YOUTUBE_CHAPTER_MAX_SECONDS", 600))
+CHAPTER_MAX_CHARS = int(os.getenv("YOUTUBE_CHAPTER_MAX_CHARS", 12000))
+
+
+def get_transcript_api() -> "youtube_transcript_api.YouTubeTranscriptApi":
+    # The library sets its own headers and cookies on the session it is
+    # given, so it gets a dedicated pooled session rather than the shared one
+    return youtube_transcript_api.YouTubeTranscriptApi(
+        http_client=http_client.session_for("youtube_transcript_api")
+    )
+
+
+class TranscriptError(Exception):
+    """
+    ``permanent`` marks failures that will not go away on retry (captions
+    disabled, no tracks, video unavailable); those are negatively cached.
+    """
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+def _is_permanent(error: Exception) -> bool:
+    names = ("TranscriptsDisabled", "NoTranscriptFound", "VideoUnavailable", "InvalidVideoId")
+    permanent = tuple(getattr(youtube_transcript_api, name) for name in names
+                      if hasattr(youtube_transcript_api, name))
+    return bool(permanent) and isinstance(error, permanent)
+
+
+def list_transcripts(video_id: str) -> List[Any]:
+    """
+    Every transcript track of a video from a single listing request.
+    """
+    try:
+        return list(get_transcript_api().list(video_id))
+    except Exception as e:
+        raise TranscriptError(
+            f"Could not fetch transcript for video {video_id}. The video may not have captions enabled "
+            f"or may be private/restricted. Details: {str(e)}",
+            permanent=_is_permanent(e)
+        ) from e
+
+
+def select_transcript(tracks: List[Dict[str, Any]], languages: Optional[List[str]] = None,
+                      prefer_manual: bool = PREFER_MANUAL_TRANSCRIPTS) -> Optional[Dict[str, Any]]:
+    """
+    Pick the best track from a listing: exact matches of ``languages`` in
+    order, then tracks sharing a preferred base language (``en`` for
+    ``en-IN``), then whatever the video has. Within the same language a
+    manual track beats an auto-generated one when ``prefer_manual`` is set.
+    """
+    if not tracks:
+        return None
+    languages = TRANSCRIPT_LANGUAGES if languages is None else languages
+    base_languages = [code.split("-")[0] for code in languages]
+
+    def rank(track: Dict[str, Any]) -> Tuple[int, int]:
+        code = track["language_code"]
+        if code in languages:
+            language_rank = languages.index(code)
+        elif code.split("-")[0] in base_languages:
+            language_rank = len(languages) + base_languages.index(code.split("-")[0])
+        else:
+            language_rank = 2 * len(languages)
+        return language_rank, int(prefer_manual and track["is_generated"])
+
+    # min() keeps the listing order among equally ranked tracks
+    return min(tracks, key=rank)
+
+
+def describe_transcripts(transcripts: List[Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "language": transcript.language,
+            "language_code": transcript.language_code,
+            "is_generated": transcript.is_generated,
+            "is_translatable": getattr(transcript, "is_translatable", False)
+        }
+        for transcript in transcripts
+    ]
+
+
+def serialize_snippets(snippets) -> List[Dict[str, Any]]:
+    return [
+        {"text": snippet.text, "start": getattr(snippet, "start", 0.0), "duration": getattr(snippet, "duration", 0.0)}
+        for snippet in snippets if hasattr(snippet, "text")
+    ]
+
+
+def snippets_to_text(snippets: List[Dict[str, Any]]) -> str:
+    formatted_transcript = " ".join(snippet["text"] for snippet in snippets)
+
+    # Long transcripts are chunked by the summarizer; this only caps runaway sizes
+    return limit_content(clean_transcript_text(formatted_transcript))
+
+
+def format_timestamp(seconds: float) -> str:
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+def _snippet_end(snippet: Dict[str, Any]) -> float:
+    return snippet["start"] + snippet["duration"]
+
+
+def _make_chapter(index: int, snippets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "index": index,
+        "start": snippets[0]["start"],
+        "end": max(_snippet_end(snippet) for snippet in snippets),
+        "text": clean_transcript_text(" ".join(snippet["text"] for snippet in snippets))
+    }
+
+
+def segment_transcript(snippets: List[Dict[str, Any]], pause_seconds: float = CHAPTER_PAUSE_SECONDS,
+                       min_seconds: float = CHAPTER_MIN_SECONDS, max_seconds: float = CHAPTER_MAX_SECONDS,
+                       max_chars: int = CHAPTER_MAX_CHARS) -> List[Dict[str, Any]]:
+    """
+    Group timestamped snippets into chapters of ``index``, ``start``/``end``
+    seconds and cleaned ``text``. Boundaries fall on natural pauses where
+    possible; a trailing chapter shorter than half ``min_seconds`` is merged
+    into the one before it when that stays within ``max_chars``.
+    """
+    groups = []
+    current = []
+    chars = 0
+    for snippet in snippets:
+        if current:
+            elapsed = snippet["start"] - current[0]["start"]
+            gap = snippet["start"] - _snippet_end(current[-1])
+            if (elapsed >= max_seconds or chars + len(snippet["text"]) > max_chars
+                    or (elapsed >= min_seconds and gap >= pause_seconds)):
+                groups.append(current)
+                current = []
+                chars = 0
+        current.append(snippet)
+        chars += len(snippet["text"]) + 1
+    if current:
+        groups.append(current)
+
+    if len(groups) > 1:
+        tail = groups[-1]
+        tail_chars = sum(len(snippet["text"]) + 1 for snippet in tail)
+        previous_chars = sum(len(snippet["text"]) + 1 for snippet in groups[-2])
+        if (_snippet_end(tail[-1]) - tail[0]["start"] < min_seconds / 2
+                and tail_chars + previous_chars <= max_chars):
+            groups.pop()
+            groups[-1] = groups[-1] + tail
+
+    return [_make_chapter(index, group) for index, group in enumerate(groups)]
+
+
+def _list_tracks(video_id: str) -> Tuple[List[Dict[str, Any]], Optional[List[Any]]]:
+    # The track listing, from the store when possible; the live transcript
+    # objects are only returned when a request was made
+    tracks = transcript_store.listing(video_id)
+    if tracks is not None:
+        return tracks, None
+    
+    try:
+        transcripts = list_transcripts(video_id)
+    except TranscriptError as e:
+        if e.permanent:
+            transcript_store.mark_unavailable(video_id, str(e))
+        raise
+    
+    tracks = describe_transcripts(transcripts)
+    transcript_store.store_listing(video_id, tracks)
+    return tracks, transcripts
+
+
+def _fetch_track(video_id: str, track: Dict[str, Any], transcripts: Optional[List[Any]]) -> Dict[str, Any]:
+    if transcripts is None:
+        # The listing came from the store but the transcript did not
+        transcripts = list_transcripts(video_id)
+    
+    transcript = next((t for t in transcripts if t.language_code == track["language_code"]
+                       and t.is_generated == track["is_generated"]), None)
+    if transcript is None:
+        raise TranscriptError(f"Transcript {track['language_code']} is no longer available for video {video_id}.")
+    
+    try:
+        fetched_transcript = transcript.fetch()
+    except Exception as e:
+        raise TranscriptError(
+            f"Could not fetch transcript for video {video_id}. The video may not have captions enabled "
+            f"or may be private/restricted. Details: {str(e)}"
+        ) from e
+    
+    snippets = serialize_snippets(fetched_transcript.snippets)
+    return {
+        "video_id": video_id,
+        "language": track["language"],
+        "language_code": track["language_code"],
+        "is_generated": track["is_generated"],
+        "snippets": snippets,
+        "text": snippets_to_text(snippets)
+    }
+
+
+def resolve_transcript(video_id: str, languages: Optional[List[str]] = None,
+                       cached_only: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    List the video's tracks once, choose the best one and fetch only that
+    track: at most two requests per video, and none when the listing and the
+    chosen transcript are already in the transcript store. The listing also
+    provides the language metadata, so nothing else has to ask YouTube again.
+    Videos known to have no captions fail from the store without a request.
+    With ``cached_only``, returns None instead of making any request.
+    """
+    unavailable = transcript_store.unavailable(video_id)
+    if unavailable is not None:
+        raise TranscriptError(unavailable, permanent=True)
+    
+    if cached_only and transcript_store.listing(video_id) is None:
+        return None
+    tracks, transcripts = _list_tracks(video_id)
+    track = select_transcript(tracks, languages)
+    if track is None:
+        error = "No transcript available for this video. The video may not have captions enabled."
+        transcript_store.mark_unavailable(video_id, error)
+        raise TranscriptError(error, permanent=True)
+    
+    entry = transcript_store.transcript(video_id, track["language_code"], track["is_generated"])
+    if entry is None and cached_only:
+        return None
+    if entry is None:
+        entry = _fetch_track(video_id, track, transcripts)
+        transcript_store.store_transcript(entry)
+    
+    return {
+        "text": entry["text"],
+        "snippets": entry["snippets"],
+        "language": track["language_code"],
+        "transcript_type": "Auto-generated" if track["is_generated"] else "Manual",
+        "available_languages": tracks
+    }
 
 
 def fetch_transcript_sync(video_url: str) -> str:
@@ -19,57 +274,10 @@ def fetch_transcript_sync(video_url: str) -> str:
         if not video_id:
             return "Error: Could not extract video ID from URL"
         
-        # Create YouTube Transcript API instance
-        ytt_api = YouTubeTranscriptApi()
-        
-        # Try to get transcript in different languages (preference order)
-        language_codes = ['en', 'en-US', 'en-GB', 'en-CA', 'en-AU']
-        transcript_data = None
-        used_language = None
-        transcript_type = "Unknown"
-        
-        # Try each language code
-        for lang_code in language_codes:
-            try:
-                fetched_transcript = ytt_api.fetch(video_id, languages=[lang_code])
-                transcript_data = fetched_transcript.snippets
-                used_language = fetched_transcript.language_code
-                transcript_type = "Auto-generated" if fetched_transcript.is_generated else "Manual"
-                break
-            except Exception:
-                continue
-        
-        # If no specific language worked, try auto-detection
-        if not transcript_data:
-            try:
-                fetched_transcript = ytt_api.fetch(video_id)
-                transcript_data = fetched_transcript.snippets
-                used_language = fetched_transcript.language_code
-                transcript_type = "Auto-generated" if fetched_transcript.is_generated else "Manual"
-            except Exception as e:
-                return f"Error: Could not fetch transcript for video {video_id}. The video may not have captions enabled or may be private/restricted. Details: {str(e)}"
-        
-        if not transcript_data:
-            return "Error: No transcript available for this video. The video may not have captions enabled."
-        
-        # Convert snippets to readable text
-        try:
-            # Extract text from transcript snippets
-            transcript_texts = [snippet.text for snippet in transcript_data if hasattr(snippet, 'text')]
-            formatted_transcript = " ".join(transcript_texts)
-        except Exception:
-            # Fallback: try to convert to string
-            formatted_transcript = str(transcript_data)
-        
-        # Clean up the transcript
-        cleaned_transcript = clean_transcript_text(formatted_transcript)
-        
-        # Limit transcript length for API efficiency
-        if len(cleaned_transcript) > 15000:
-            cleaned_transcript = cleaned_transcript[:15000] + "..."
-        
-        return cleaned_transcript
+        return resolve_transcript(video_id)["text"]
         
+    except TranscriptError as e:
+        return f"Error: {str(e)}"
     except Exception as e:
         error_msg = f"Error fetching YouTube transcript: {str(e)}"
         return error_msg
@@ -145,132 +353,104 @@ def extract_video_id(video_url: str) -> Optional[str]:
         return None
 
 
-def get_video_info(video_url: str) -> Dict[str, Any]:
+VIDEO_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{11}$')
+
+
+def normalize_video_ref(value: str) -> Optional[str]:
+    """
+    Video id for a YouTube URL or a bare 11-character video id.
+    """
+    value = (value or "").strip()
+    if VIDEO_ID_PATTERN.match(value):
+        return value
+    video_id = extract_video_id(value)
+    return video_id if video_id and VIDEO_ID_PATTERN.match(video_id) else None
+
+
+def watch_url(video_id: str) -> str:
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def validate_youtube_url(video_url: str) -> bool:
+    return extract_video_id(video_url) is not None
+
+
+def _failed_video_info(error: str, video_id: str = "") -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": error,
+        "content": "",
+        "transcript": "",
+        "video_id": video_id,
+        "language": "Unknown",
+        "transcript_type": "Unknown",
+        "transcript_length": 0,
+        "available_languages": []
+    }
+
+
+def get_video_info(video_url: str, cached_only: bool = False) -> Optional[Dict[str, Any]]:
+    # ``cached_only`` answers from the transcript store alone and returns
+    # None when YouTube would have to be asked
     try:
         # Check if YouTube API is available
         if not YOUTUBE_API_AVAILABLE:
-            return {
-                "success": False,
-                "error": "YouTube Transcript API not available. Please install with: pip install youtube-transcript-api",
-                "transcript": "",
-                "video_id": "",
-                "language": "Unknown",
-                "transcript_type": "Unknown",
-                "transcript_length": 0,
-                "available_languages": []
-            }
+            return _failed_video_info(
+                "YouTube Transcript API not available. Please install with: pip install youtube-transcript-api"
+            )
         
         video_id = extract_video_id(video_url)
         
         if not video_id:
-            return {
-                "success": False,
-                "error": "Could not extract video ID from URL",
-                "transcript": "",
-                "video_id": "",
-                "language": "Unknown",
-                "transcript_type": "Unknown",
-                "transcript_length": 0,
-                "available_languages": []
-            }
-        
-        transcript = fetch_transcript_sync(video_url)
-        
-        if transcript.startswith("Error:"):
-            return {
-                "success": False,
-                "error": transcript,
-                "transcript": "",
-                "video_id": video_id,
-                "language": "Unknown",
-                "transcript_type": "Unknown",
-                "transcript_length": 0,
-                "available_languages": []
-            }
-        
-        metadata = get_video_metadata(video_id)
+            return _failed_video_info("Could not extract video ID from URL")
         
+        try:
+            resolved = resolve_transcript(video_id, cached_only=cached_only)
+        except TranscriptError as e:
+            return _failed_video_info(f"Error: {str(e)}", video_id)
+        if resolved is None:
+            return None
+        
+        transcript = resolved["text"]
+        snippets = resolved["snippets"]
+        duration_seconds = max((_snippet_end(snippet) for snippet in snippets), default=0.0)
         return {
             "success": True,
+            "content": transcript,
             "transcript": transcript,
+            "snippets": snippets,
             "video_id": video_id,
-            "language": metadata.get("language", "Unknown"),
-            "transcript_type": metadata.get("transcript_type", "Unknown"),
+            "duration": format_timestamp(duration_seconds) if snippets else "Unknown",
+            "duration_seconds": duration_seconds,
+            "language": resolved["language"],
+            "transcript_type": resolved["transcript_type"],
             "transcript_length": len(transcript),
-            "available_languages": metadata.get("available_languages", [])
+            "available_languages": resolved["available_languages"]
         }
         
     except Exception as e:
-        error_msg = f"Failed to process YouTube video: {str(e)}"
-        return {
-            "success": False,
-            "error": error_msg,
-            "transcript": "",
-            "video_id": "",
-            "language": "Unknown",
-            "transcript_type": "Unknown",
-            "transcript_length": 0,
-            "available_languages": []
-        }
+        return _failed_video_info(f"Failed to process YouTube video: {str(e)}")
 
 
 def get_video_metadata(video_id: str) -> Dict[str, Any]:
+    unknown = {"language": "Unknown", "transcript_type": "Unknown", "available_languages": []}
     if not YOUTUBE_API_AVAILABLE:
-        return {
-            "language": "Unknown",
-            "transcript_type": "Unknown",
-            "available_languages": []
-        }
+        return unknown
     
     try:
-        ytt_api = YouTubeTranscriptApi()
-        
-        try:
-            transcript_list = ytt_api.list(video_id)
-            
-            available_languages = []
-            primary_language = "Unknown"
-            transcript_type = "Unknown"
-            
-            for transcript in transcript_list:
-                lang_info = {
-                    "language": transcript.language,
-                    "language_code": transcript.language_code,
-                    "is_generated": transcript.is_generated
-                }
-                available_languages.append(lang_info)
-                
-                if primary_language == "Unknown":
-                    primary_language = transcript.language_code
-                    transcript_type = "Auto-generated" if transcript.is_generated else "Manual"
-            
-            return {
-                "language": primary_language,
-                "transcript_type": transcript_type,
-                "available_languages": available_languages
-            }
-            
-        except Exception:
-            try:
-                fetched_transcript = ytt_api.fetch(video_id)
-                return {
-                    "language": fetched_transcript.language_code,
-                    "transcript_type": "Auto-generated" if fetched_transcript.is_generated else "Manual",
-                    "available_languages": [{"language": fetched_transcript.language, "language_code": fetched_transcript.language_code, "is_generated": fetched_transcript.is_generated}]
-                }
-            except Exception:
-                return {
-                    "language": "Unknown",
-                    "transcript_type": "Unknown",
-                    "available_languages": []
-                }
-        
-    except Exception:
-        return {
-            "language": "Unknown",
-            "transcript_type": "Unknown",
-            "available_languages": []
-        }
+        tracks, _ = _list_tracks(video_id)
+    except TranscriptError:
+        return unknown
+    
+    track = select_transcript(tracks)
+    if track is None:
+        return unknown
+    
+    return {
+        "language": track["language_code"],
+        "transcript_type": "Auto-generated" if track["is_generated"] else "Manual",
+        "available_languages": tracks
+    }
 
 
 def get_available_languages(video_id: str) -> List[Dict[str, Any]]:
@@ -278,41 +458,10 @@ def get_available_languages(video_id: str) -> List[Dict[str, Any]]:
         return []
     
     try:
-        ytt_api = YouTubeTranscriptApi()
-        transcript_list = ytt_api.list(video_id)
-        
-        available_languages = []
-        for transcript in transcript_list:
-            lang_info = {
-                "language": transcript.language,
-                "language_code": transcript.language_code,
-                "is_generated": transcript.is_generated,
-                "is_translatable": transcript.is_translatable if hasattr(transcript, 'is_translatable') else False
-            }
-            available_languages.append(lang_info)
-        
-        return available_languages
-        
-    except Exception:
-        available_languages = []
-        common_languages = ['en', 'en-US', 'en-GB']
-        
-        ytt_api = YouTubeTranscriptApi()
-        for lang_code in common_languages:
-            try:
-                fetched_transcript = ytt_api.fetch(video_id, languages=[lang_code])
-                lang_info = {
-                    "language": fetched_transcript.language,
-                    "language_code": fetched_transcript.language_code,
-                    "is_generated": fetched_transcript.is_generated,
-                    "is_translatable": False
-                }
-                available_languages.append(lang_info)
-                break  # If one works, we have at least one language
-            except Exception:
-                continue
-        
-        return available_languages
+        tracks, _ = _list_tracks(video_id)
+        return tracks
+    except TranscriptError:
+        return []
 
 
 # Legacy function for backward compatibility
@@ -0,0 +1,364 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+
+def normalize_content(content: str) -> str:
+    return re.sub(r'\s+', ' ', content or '').strip()
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable SHA-256 key from the given parts.
+
+    Parts are joined with a separator that cannot appear in normal text so
+    that ("ab", "c") and ("a", "bc") never collide.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            digest.update(part)
+        else:
+            digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+class CacheBackend:
+    """
+    Interface shared by all cache tiers. Values must be JSON serializable.
+    """
+
+    name = "base"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0, "errors": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def _count(self, stat: str, amount: int = 1):
+        with self._lock:
+            self._stats[stat] += amount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["backend"] = self.name
+        return stats
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache with per-entry TTL, bounded by entry count and
+    optionally by the approximate serialized size of the stored values.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1000, default_ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        super().__init__()
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    @staticmethod
+    def _size_of(value: Any) -> int:
+        if isinstance(value, str):
+            return len(value)
+        return len(json.dumps(value, default=str))
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, expires_at, size = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                self._bytes -= size
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        size = self._size_of(value) if self.max_bytes else 0
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            self._stats["sets"] += 1
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes and self._bytes > self.max_bytes and len(self._entries) > 1
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats["evictions"] += 1
+
+    def delete(self, key: str):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats["entries"] = len(self._entries)
+            stats["bytes"] = self._bytes
+        return stats
+
+
+class MySQLCache(CacheBackend):
+    """
+    Persistent cache tier stored in the ``cache_entries`` table.
+
+    Entries are partitioned by namespace. Expired rows are dropped on read,
+    and every ``prune_every`` writes the namespace is trimmed back to
+    ``max_entries`` rows, evicting the least recently accessed first.
+    """
+
+    name = "mysql"
+
+    def __init__(self, database, namespace: str, max_entries: int = 10000,
+                 default_ttl: Optional[float] = None, prune_every: int = 100):
+        super().__init__()
+        self.database = database
+        self.namespace = namespace
+        self.max_entries = max(1, max_entries)
+        self.default_ttl = default_ttl
+        self.prune_every = max(1, prune_every)
+        self._writes_since_prune = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        try:
+            connection = self.database._get_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT value, expires_at FROM cache_entries
+                        WHERE namespace = %s AND cache_key = %s
+                    """, (self.namespace, key))
+                    row = cursor.fetchone()
+
+                    if not row:
+                        self._count("misses")
+                        return None
+
+                    now = datetime.now()
+                    if row['expires_at'] is not None and row['expires_at'] <= now:
+                        cursor.execute("""
+                            DELETE FROM cache_entries WHERE namespace = %s AND cache_key = %s
+                        """, (self.namespace, key))
+                        connection.commit()
+                        self._count("expirations")
+                        self._count("misses")
+                        return None
+
+                    cursor.execute("""
+                        UPDATE cache_entries SET accessed_at = %s
+                        WHERE namespace = %s AND cache_key = %s
+                    """, (now, self.namespace, key))
+                connection.commit()
+            finally:
+                connection.close()
+
+            self._count("hits")
+            return json.loads(row['value'])
+
+        except Exception:
+            self._count("errors")
+            self._count("misses")
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        ttl = self.default_ttl if ttl is None else ttl
+        now = datetime.now()
+        expires_at = now + timedelta(seconds=ttl) if ttl else None
+        serialized = json.dumps(value, default=str)
+
+        try:
+            connection = self.database._get_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("""
+                        INSERT INTO cache_entries (namespace, cache_key, value, size_bytes,
+                                                   created_at, accessed_at, expires_at)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE value = VALUES(value), size_bytes = VALUES(size_bytes),
+                            created_at = VALUES(created_at), accessed_at = VALUES(accessed_at),
+                            expires_at = VALUES(expires_at)
+                    """, (self.namespace, key, serialized, len(serialized), now, now, expires_at))
+                connection.commit()
+            finally:
+                connection.close()
+            self._count("sets")
+        except Exception:
+            self._count("errors")
+            return
+
+        with self._lock:
+            self._writes_since_prune += 1
+            should_prune = self._writes_since_prune >= self.prune_every
+            if should_prune:
+                self._writes_since_prune = 0
+        if should_prune:
+            self.prune()
+
+    def delete(self, key: str):
+        try:
+            connection = self.database._get_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("""
+                        DELETE FROM cache_entries WHERE namespace = %s AND cache_key = %s
+                    """, (self.namespace, key))
+                connection.commit()
+            finally:
+                connection.close()
+        except Exception:
+            self._count("errors")
+
+    def prune(self):
+        try:
+            connection = self.database._get_connection()
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("""
+                        DELETE FROM cache_entries
+                        WHERE namespace = %s AND expires_at IS NOT NULL AND expires_at <= %s
+                    """, (self.namespace, datetime.now()))
+                    self._count("expirations", cursor.rowcount or 0)
+
+                    cursor.execute("""
+                        SELECT accessed_at FROM cache_entries
+                        WHERE namespace = %s
+                        ORDER BY accessed_at DESC
+                        LIMIT 1 OFFSET %s
+                    """, (self.namespace, self.max_entries - 1))
+                    cutoff = cursor.fetchone()
+
+                    if cutoff:
+                        cursor.execute("""
+                            DELETE FROM cache_entries
+                            WHERE namespace = %s AND accessed_at < %s
+                        """, (self.namespace, cutoff['accessed_at']))
+                        self._count("evictions", cursor.rowcount or 0)
+                connection.commit()
+            finally:
+                connection.close()
+        except Exception:
+            self._count("errors")
+
+
+class TieredCache(CacheBackend):
+    """
+    Read-through combination of a fast local tier and a shared persistent
+    tier. Hits in the persistent tier are promoted into the local tier.
+    """
+
+    name = "tiered"
+
+    def __init__(self, local: CacheBackend, persistent: CacheBackend):
+        super().__init__()
+        self.local = local
+        self.persistent = persistent
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.local.get(key)
+        if value is not None:
+            self._count("hits")
+            return value
+
+        value = self.persistent.get(key)
+        if value is not None:
+            self.local.set(key, value)
+            self._count("hits")
+            return value
+
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.local.set(key, value, ttl)
+        self.persistent.set(key, value, ttl)
+        self._count("sets")
+
+    def delete(self, key: str):
+        self.local.delete(key)
+        self.persistent.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["tiers"] = {
+            "local": self.local.stats(),
+            "persistent": self.persistent.stats()
+        }
+        return stats
+
+
+def create_cache(namespace: str, env_prefix: str, default_backend: str = "tiered",
+                 default_ttl: float = 86400, default_max_entries: int = 10000,
+                 default_memory_entries: int = 1000,
+                 default_memory_bytes: Optional[int] = None) -> Optional[CacheBackend]:
+    """
+    Build a cache from ``<env_prefix>_BACKEND`` (memory, mysql, tiered or
+    none), ``<env_prefix>_TTL``, ``<env_prefix>_MAX_ENTRIES``,
+    ``<env_prefix>_MEMORY_ENTRIES`` and ``<env_prefix>_MEMORY_MAX_BYTES``
+    environment variables.
+    """
+    backend = os.getenv(f"{env_prefix}_BACKEND", default_backend).lower()
+    ttl = float(os.getenv(f"{env_prefix}_TTL", default_ttl)) or None
+    max_entries = int(os.getenv(f"{env_prefix}_MAX_ENTRIES", default_max_entries))
+    memory_entries = int(os.getenv(f"{env_prefix}_MEMORY_ENTRIES", default_memory_entries))
+    memory_bytes = int(os.getenv(f"{env_prefix}_MEMORY_MAX_BYTES", default_memory_bytes or 0)) or None
+
+    if backend in ("none", "off", "disabled"):
+        return None
+
+    if backend == "memory":
+        return MemoryCache(max_entries=memory_entries, default_ttl=ttl, max_bytes=memory_bytes)
+
+    from backend.mysql_db import db
+    persistent = MySQLCache(db, namespace, max_entries=max_entries, default_ttl=ttl)
+
+    if backend == "mysql":
+        return persistent
+
+    return TieredCache(MemoryCache(max_entries=memory_entries, default_ttl=ttl, max_bytes=memory_bytes), persistent)
@@ -0,0 +1,87 @@
+import os
+import re
+from typing import List
+
+# Gemini tokenizes English prose at roughly four characters per token.
+CHARS_PER_TOKEN = 4
+
+# Upper bound on extracted content kept for summarization. Long content is
+# chunked rather than cut, so this only guards against pathological inputs.
+MAX_CONTENT_CHARS = int(os.getenv("MAX_CONTENT_CHARS", 500000))
+
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+
+def limit_content(text: str) -> str:
+    if len(text) > MAX_CONTENT_CHARS:
+        return text[:MAX_CONTENT_CHARS] + "..."
+    return text
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _split_oversized(piece: str, max_chars: int) -> List[str]:
+    # Last resort for a single sentence longer than the budget: cut on words
+    parts = []
+    current = ""
+    for word in piece.split(' '):
+        if current and len(current) + 1 + len(word) > max_chars:
+            parts.append(current)
+            current = ""
+        while len(word) > max_chars:
+            parts.append(word[:max_chars])
+            word = word[max_chars:]
+        current = f"{current} {word}" if current else word
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_into_chunks(text: str, max_tokens: int) -> List[str]:
+    """
+    Split text into chunks of at most ``max_tokens`` (estimated), breaking
+    on paragraph boundaries first, then sentences, then words.
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+
+    units = []
+    for paragraph in _PARAGRAPH_SPLIT.split(text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            units.append((paragraph, "\n\n"))
+            continue
+        for sentence in _SENTENCE_SPLIT.split(paragraph):
+            sentence = sentence.strip()
+            if not sentence:
+                continue
+            if len(sentence) <= max_chars:
+                units.append((sentence, " "))
+            else:
+                units.extend((part, " ") for part in _split_oversized(sentence, max_chars))
+
+    chunks = []
+    current = []
+    current_len = 0
+    for unit, separator in units:
+        added = len(unit) + (len(separator) if current else 0)
+        if current and current_len + added > max_chars:
+            chunks.append("".join(current))
+            current = []
+            current_len = 0
+            added = len(unit)
+        if current:
+            current.append(separator)
+        current.append(unit)
+        current_len += added
+    if current:
+        chunks.append("".join(current))
+
+    return chunks
@@ -0,0 +1,228 @@
+import asyncio
+import contextlib
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    # Workers are started lazily, often while a request holds files open.
+    # Forked workers would inherit those descriptors and memory maps and keep
+    # deleted uploads alive, so start them from a clean forkserver instead.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class Stage:
+    """
+    One step of the summarization pipeline with its own executor and an
+    asyncio semaphore capping how many calls may be in flight at once.
+    """
+
+    def __init__(self, name: str, kind: str, concurrency: int):
+        self.name = name
+        self.kind = kind
+        self.concurrency = max(1, concurrency)
+        self._executor = None
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    self._executor = ProcessPoolExecutor(max_workers=self.concurrency,
+                                                         mp_context=_process_context())
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.concurrency,
+                        thread_name_prefix=f"stage-{self.name}"
+                    )
+            return self._executor
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Semaphores are bound to the running loop, so keep one per loop.
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.concurrency)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        self.waiting += 1
+        async with self._semaphore():
+            self.waiting -= 1
+            self.in_flight += 1
+            try:
+                result = await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+                self.completed += 1
+                return result
+            except Exception:
+                self.failed += 1
+                raise
+            finally:
+                self.in_flight -= 1
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "failed": self.failed
+        }
+
+
+class StageExecutor:
+    """
+    Runs blocking pipeline steps off the event loop.
+
+    - ``fetch``: network-bound extraction (articles, transcripts, GitHub)
+    - ``llm``: Gemini generate_content calls
+    - ``cpu``: CPU-bound parsing such as PDF text extraction, in a process pool
+
+    Concurrency for each stage is configured with FETCH_CONCURRENCY,
+    LLM_CONCURRENCY and CPU_WORKERS.
+    """
+
+    def __init__(self, stages: Dict[str, Stage]):
+        self.stages = stages
+
+    @classmethod
+    def from_env(cls) -> "StageExecutor":
+        cpu_default = os.cpu_count() or 2
+        return cls({
+            "fetch": Stage("fetch", "thread", int(os.getenv("FETCH_CONCURRENCY", 16))),
+            "llm": Stage("llm", "thread", int(os.getenv("LLM_CONCURRENCY", 8))),
+            "cpu": Stage("cpu", "process", int(os.getenv("CPU_WORKERS", cpu_default))),
+        })
+
+    async def run(self, stage: str, func: Callable, *args, **kwargs) -> Any:
+        return await self.stages[stage].run(func, *args, **kwargs)
+
+    async def iterate(self, stage: str, factory: Callable[..., Iterable], *args, **kwargs) -> AsyncIterator:
+        """
+        Consume a blocking iterator on a stage thread and re-yield its items
+        on the event loop. Iteration stops early if the consumer goes away.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        finished = object()
+        cancelled = threading.Event()
+
+        def pump():
+            try:
+                for item in factory(*args, **kwargs):
+                    if cancelled.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, (finished, e))
+                return
+            loop.call_soon_threadsafe(queue.put_nowait, (finished, None))
+
+        # Keep a reference so the pump task is not garbage collected mid-stream
+        pump_task = asyncio.ensure_future(self.run(stage, pump))
+        try:
+            while True:
+                item, error = await queue.get()
+                if item is finished:
+                    if error is not None:
+                        raise error
+                    return
+                yield item
+        finally:
+            cancelled.set()
+            if pump_task.done() and not pump_task.cancelled():
+                pump_task.exception()
+
+    def shutdown(self, wait: bool = True):
+        for stage in self.stages.values():
+            stage.shutdown(wait=wait)
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: stage.stats() for name, stage in self.stages.items()}
+
+
+stage_executor = StageExecutor.from_env()
+
+
+class HostLimiter:
+    """
+    Caps how many fetches may talk to one remote host at once, on top of the
+    fetch stage's global limit, so a batch of requests to the same site does
+    not trip its rate limiting. The default comes from HOST_CONCURRENCY;
+    ``limits`` overrides it for individual hosts.
+    """
+
+    def __init__(self, default_limit: int, limits: Optional[Dict[str, int]] = None):
+        self.default_limit = max(1, default_limit)
+        self.limits = {host: max(1, limit) for host, limit in (limits or {}).items()}
+        self._semaphores = {}
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        # Semaphores are bound to the running loop, so keep one per (loop, host).
+        key = (asyncio.get_running_loop(), host)
+        with self._lock:
+            semaphore = self._semaphores.get(key)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.limits.get(host, self.default_limit))
+                self._semaphores[key] = semaphore
+            return semaphore
+
+    @contextlib.asynccontextmanager
+    async def limit(self, host: str):
+        semaphore = self._semaphore(host)
+        self._waiting[host] = self._waiting.get(host, 0) + 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._waiting[host] -= 1
+        self._in_flight[host] = self._in_flight.get(host, 0) + 1
+        try:
+            yield
+        finally:
+            self._in_flight[host] -= 1
+            semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        hosts = set(self._in_flight) | set(self.limits)
+        return {
+            "default_limit": self.default_limit,
+            "hosts": {
+                host: {
+                    "limit": self.limits.get(host, self.default_limit),
+                    "in_flight": self._in_flight.get(host, 0),
+                    "waiting": self._waiting.get(host, 0)
+                }
+                for host in sorted(hosts)
+            }
+        }
+
+
+host_limiter = HostLimiter(
+    int(os.getenv("HOST_CONCURRENCY", 4)),
+    {"youtube.com": int(os.getenv("YOUTUBE_CONCURRENCY", 4))}
+)
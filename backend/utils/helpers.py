@@ -1,12 +1,245 @@
 import os
-from pathlib import Path
+import json
+import uuid
+import base64
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from python_multipart import MultipartParser
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import parse_options_header
 
 UPLOAD_DIR = os.getenv("UPLOAD_DIR", "uploads")
+# Text fields sent alongside an upload (e.g. the engine name) are tiny
+MAX_FORM_FIELD_BYTES = 64 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_FILE_SIZE_MB", "10")) * 1024 * 1024
 
 
-def save_upload_file(upload_file, destination: str) -> str:
-    dest_path = Path(destination)
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(dest_path, "wb") as f:
-        f.write(upload_file.file.read())
-    return str(dest_path)
+class UploadTooLargeError(ValueError):
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"File size exceeds {max_bytes // (1024 * 1024)}MB limit")
+        self.max_bytes = max_bytes
+
+
+def upload_destination(prefix: str, suffix: str = "") -> str:
+    return os.path.join(UPLOAD_DIR, f"{prefix}-{uuid.uuid4()}{suffix}")
+
+
+class UploadFormError(ValueError):
+    """Raised when an upload request is not a well-formed multipart form."""
+
+
+class _MultipartUpload:
+    """
+    python-multipart callbacks that write the ``field`` file part straight
+    to its destination and keep the (small) text fields in memory.
+    """
+
+    def __init__(self, field: str, prefix: str, max_bytes: Optional[int]):
+        self.field = field
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.fields: Dict[str, str] = {}
+        self.upload: Optional[Dict[str, str]] = None
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+        self._name = ""
+        self._data: Optional[bytearray] = None
+        self._file = None
+        self._size = 0
+
+    def callbacks(self) -> Dict[str, Callable]:
+        return {name: getattr(self, name) for name in (
+            "on_part_begin", "on_part_data", "on_part_end", "on_header_field",
+            "on_header_value", "on_header_end", "on_headers_finished"
+        )}
+
+    def on_part_begin(self):
+        self._headers = {}
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def on_header_end(self):
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = self._header_value = b""
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+        self._data = None
+        if filename is None:
+            self._data = bytearray()
+        elif self._name == self.field and self.upload is None:
+            filename = filename.decode("utf-8", "replace")
+            path = upload_destination(self.prefix, os.path.splitext(filename)[1][:16])
+            self._file = open(path, "wb")
+            self._size = 0
+            self.upload = {"filename": filename, "path": path}
+        # Any other file part is skipped without being stored
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if self._file is not None:
+            self._size += end - start
+            if self.max_bytes is not None and self._size > self.max_bytes:
+                raise UploadTooLargeError(self.max_bytes)
+            self._file.write(data[start:end])
+        elif self._data is not None:
+            if len(self._data) + end - start > MAX_FORM_FIELD_BYTES:
+                raise UploadFormError(f"Form field '{self._name}' is too large")
+            self._data.extend(data[start:end])
+
+    def on_part_end(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        elif self._data is not None:
+            self.fields[self._name] = self._data.decode("utf-8", "replace")
+            self._data = None
+
+    def discard(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.upload is not None:
+            remove_file(self.upload["path"])
+            self.upload = None
+
+
+async def receive_upload(request, field: str = "file", prefix: str = "upload",
+                         max_bytes: Optional[int] = None) -> Tuple[Dict[str, str], Optional[Dict[str, str]]]:
+    """
+    Parse a multipart upload request, streaming the ``field`` file straight
+    into UPLOAD_DIR so it is written to disk exactly once (FastAPI's
+    ``UploadFile`` would first spool it to a temporary file of its own).
+
+    Returns the text form fields and ``{"filename", "path"}`` for the file,
+    or None when the request has no such file. From then on the caller owns
+    the file and must remove it. Raises UploadTooLargeError as soon as the
+    file passes ``max_bytes`` and UploadFormError for malformed bodies;
+    nothing is left on disk in either case.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or not params.get(b"boundary"):
+        raise UploadFormError("Expected a multipart/form-data upload")
+
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    receiver = _MultipartUpload(field, prefix, max_bytes)
+    parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+        parser.finalize()
+        if receiver._file is not None:
+            raise UploadFormError("Upload ended before the file was complete")
+    except MultipartParseError as e:
+        receiver.discard()
+        raise UploadFormError(f"Malformed upload: {e}") from e
+    except BaseException:
+        receiver.discard()
+        raise
+    return receiver.fields, receiver.upload
+
+
+def remove_file(path: Optional[str]):
+    # Best-effort cleanup of a spooled upload; it may already be gone
+    if path is None:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class BodySizeLimitMiddleware:
+    """
+    Rejects request bodies over ``max_bytes`` on the given path prefixes
+    with 413 before they are buffered: immediately when Content-Length is
+    too large, otherwise as soon as the streamed body passes the limit.
+    """
+
+    def __init__(self, app, max_bytes: int, path_prefixes: Tuple[str, ...] = ("/",)):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefixes = tuple(path_prefixes)
+
+    def _detail(self) -> str:
+        return f"Request body exceeds {self.max_bytes // (1024 * 1024)}MB limit"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            response = JSONResponse({"detail": self._detail()}, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=self._detail())
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def encode_cursor(created_at: str, item_id: str) -> str:
+    # Opaque to clients: the last row's (created_at, id) for keyset pagination
+    return base64.urlsafe_b64encode(f"{created_at}|{item_id}".encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, item_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), item_id
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def format_sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+class _ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that runs ``on_close`` however the response ends,
+    including a client that disconnects before the body is iterated, when
+    neither the generator's own ``finally`` nor a background task runs.
+    """
+
+    def __init__(self, *args, on_close: Callable[[], None], **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_close = on_close
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self.on_close()
+
+
+def sse_response(events: AsyncIterator[str],
+                 on_close: Optional[Callable[[], None]] = None) -> StreamingResponse:
+    # X-Accel-Buffering stops nginx-style proxies from buffering the stream
+    options = dict(
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+    if on_close is not None:
+        return _ClosingStreamingResponse(events, on_close=on_close, **options)
+    return StreamingResponse(events, **options)
\ No newline at end of file
@@ -0,0 +1,175 @@
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class DNSCache:
+    """
+    TTL cache in front of ``socket.getaddrinfo``. Opt-in only: installing it
+    patches the resolver process-wide, so it also affects the database
+    driver and third-party clients, and entries live for ``ttl`` seconds
+    whatever the record's own DNS TTL is.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._original = None
+        self.hits = 0
+        self.misses = 0
+
+    def install(self):
+        with self._lock:
+            if self._original is not None:
+                return
+            self._original = socket.getaddrinfo
+            socket.getaddrinfo = self._getaddrinfo
+
+    def _getaddrinfo(self, host, port, *args, **kwargs):
+        key = (host, port, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        result = self._original(host, port, *args, **kwargs)
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries = {k: v for k, v in self._entries.items() if v[0] > now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.clear()
+            self._entries[key] = (now + self.ttl, result)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"ttl": self.ttl, "entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+class HTTPClient:
+    """
+    Process-wide outbound HTTP client.
+
+    The sync side is one ``requests.Session`` whose adapters keep a
+    connection pool per host (``pool_connections`` hosts, ``pool_maxsize``
+    connections each) and retry connection errors and 429/5xx responses
+    with jittered exponential backoff, honouring Retry-After. Libraries
+    that change session state (headers, cookies, adapters) get their own
+    session from ``session_for`` with the same pooling and retries.
+    Requests get the default timeouts unless they pass their own.
+    """
+
+    def __init__(self, pool_connections: int = 32, pool_maxsize: int = 16, retries: int = 2,
+                 backoff_factor: float = 0.3, connect_timeout: float = 5, read_timeout: float = 15,
+                 dns_cache: Optional[DNSCache] = None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.timeout = (connect_timeout, read_timeout)
+        self.dns_cache = dns_cache
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "errors": 0}
+
+    @classmethod
+    def from_env(cls) -> "HTTPClient":
+        dns_ttl = float(os.getenv("HTTP_DNS_CACHE_TTL", 0))
+        return cls(
+            pool_connections=int(os.getenv("HTTP_POOL_HOSTS", 32)),
+            pool_maxsize=int(os.getenv("HTTP_POOL_SIZE", 16)),
+            retries=int(os.getenv("HTTP_RETRIES", 2)),
+            backoff_factor=float(os.getenv("HTTP_BACKOFF", 0.3)),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", 5)),
+            read_timeout=float(os.getenv("HTTP_READ_TIMEOUT", 15)),
+            dns_cache=DNSCache(ttl=dns_ttl) if dns_ttl > 0 else None
+        )
+
+    def _retry(self) -> Retry:
+        options = dict(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        try:
+            return Retry(backoff_jitter=self.backoff_factor, **options)
+        except TypeError:
+            # urllib3 < 2 has no jitter option
+            return Retry(**options)
+
+    def _new_session(self) -> requests.Session:
+        if self.dns_cache is not None:
+            self.dns_cache.install()
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=self._retry()
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def session_for(self, name: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None:
+                session = self._sessions[name] = self._new_session()
+            return session
+
+    @property
+    def session(self) -> requests.Session:
+        return self.session_for("default")
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        self._count("requests")
+        try:
+            return self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            self._count("errors")
+            raise
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def close(self):
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["dns_cache"] = self.dns_cache.stats() if self.dns_cache else {"ttl": 0}
+        return stats
+
+
+http_client = HTTPClient.from_env()
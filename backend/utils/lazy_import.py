@@ -0,0 +1,71 @@
+import importlib
+import importlib.util
+import threading
+import time
+import types
+from typing import Dict, List
+
+
+def module_available(name: str) -> bool:
+    """
+    Whether a top-level module can be imported, checked without importing it.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule(types.ModuleType):
+    """
+    Placeholder for a heavy optional dependency. The real module is imported
+    on first attribute access, so importing a service (and with it every
+    router) costs nothing until a request actually needs the library.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        with self._lock:
+            if self._module is None:
+                self._module = importlib.import_module(self.__name__)
+            return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+_registry: List[LazyModule] = []
+
+
+def lazy_import(name: str) -> LazyModule:
+    module = LazyModule(name)
+    _registry.append(module)
+    return module
+
+
+def preload_all() -> Dict[str, float]:
+    """
+    Import every registered lazy module now and return the import time of
+    each in milliseconds. The multi-worker launcher calls this in the master
+    before forking so workers share the loaded code instead of each paying
+    for it on their first request. Missing optional packages are skipped.
+    """
+    timings = {}
+    for module in list(_registry):
+        if module._module is not None or not module_available(module.__name__.split(".")[0]):
+            continue
+        started = time.perf_counter()
+        try:
+            module._load()
+        except ImportError:
+            continue
+        timings[module.__name__] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
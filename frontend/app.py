@@ -4,6 +4,44 @@ from utils import summarize_article, summarize_pdf, summarize_youtube, summarize
 
 st.set_page_config(page_title="Rapidread", layout="wide")
 
+JOB_STATUS_LABELS = {
+    "queued": "Waiting for a free worker...",
+    "running": "Summarizing...",
+    "extracting": "Fetching content...",
+    "summarizing": "Generating summary...",
+    "succeeded": "Done",
+    "failed": "Failed"
+}
+
+
+def job_status_callback(placeholder):
+    def on_status(job_status: str):
+        placeholder.caption(f"Status: {JOB_STATUS_LABELS.get(job_status, job_status)}")
+    return on_status
+
+
+def run_summarization(summarize_fn, *args, spinner_text: str = "Summarizing..."):
+    status_placeholder = st.empty()
+    
+    if st.session_state.get("stream_summaries", True):
+        # Render tokens as they arrive, then clear so the final result is shown once
+        summary_placeholder = st.empty()
+        streamed = []
+        
+        def on_token(text: str):
+            streamed.append(text)
+            summary_placeholder.markdown("".join(streamed) + " ▌")
+        
+        result = summarize_fn(*args, stream=True, on_token=on_token,
+                              on_status=job_status_callback(status_placeholder))
+        summary_placeholder.empty()
+    else:
+        with st.spinner(spinner_text):
+            result = summarize_fn(*args, on_status=job_status_callback(status_placeholder))
+    
+    status_placeholder.empty()
+    return result
+
 
 def show_main_app():
   
@@ -23,6 +61,12 @@ def show_main_app():
     st.sidebar.title("Summarization Options")
     st.sidebar.markdown(f"**Logged in as:** {st.session_state.full_name}")
     st.sidebar.markdown(f"**Email:** {st.session_state.email}")
+    st.sidebar.checkbox(
+        "Stream summaries as they are generated",
+        value=True,
+        key="stream_summaries",
+        help="Turn off to run summaries as background jobs instead"
+    )
     st.sidebar.markdown("---")
     
     mode = st.sidebar.selectbox(
@@ -44,24 +88,23 @@ def show_main_app():
         if uploaded:
             st.success(f"File uploaded: {uploaded.name}")
             if st.button("Summarize PDF", use_container_width=True):
-                with st.spinner("Analyzing PDF..."):
-                    file_content = uploaded.read()
+                file_content = uploaded.read()
+                
+                result = run_summarization(summarize_pdf, file_content, uploaded.name, spinner_text="Analyzing PDF...")
+                
+                if result.get("success"):
+                    st.success("PDF summarized successfully!")
+                    summary_data = result["summary"]
                     
-                    result = summarize_pdf(file_content, uploaded.name)
+                    st.subheader("Summary")
+                    st.write(summary_data["summary"])
                     
-                    if result.get("success"):
-                        st.success("PDF summarized successfully!")
-                        summary_data = result["summary"]
-                        
-                        st.subheader("Summary")
-                        st.write(summary_data["summary"])
-                        
-                        with st.expander("Details"):
-                            st.write(f"**Filename:** {summary_data['filename']}")
-                            st.write(f"**Created:** {summary_data['created_at']}")
-                            st.write(f"**Summary ID:** {summary_data['id']}")
-                    else:
-                        st.error(f"{result.get('error', 'Summarization failed')}")
+                    with st.expander("Details"):
+                        st.write(f"**Filename:** {summary_data['filename']}")
+                        st.write(f"**Created:** {summary_data['created_at']}")
+                        st.write(f"**Summary ID:** {summary_data['id']}")
+                else:
+                    st.error(f"{result.get('error', 'Summarization failed')}")
     
     elif mode == "Article URL":
         st.header("Web Article Summarizer")
@@ -75,45 +118,44 @@ def show_main_app():
         
         if st.button("Summarize Article", use_container_width=True):
             if url:
-                with st.spinner("Fetching and analyzing article..."):
-                    result = summarize_article(url)
+                result = run_summarization(summarize_article, url, spinner_text="Fetching and analyzing article...")
+                
+                if result.get("success"):
+                    st.success("Article summarized successfully!")
+                    summary_data = result["summary"]
                     
-                    if result.get("success"):
-                        st.success("Article summarized successfully!")
-                        summary_data = result["summary"]
+                    st.subheader("Summary")
+                    st.write(summary_data["summary"])
+                    
+                    with st.expander("Article Details"):
+                        st.write(f"**Title:** {summary_data.get('title', 'Article')}")
+                        st.write(f"**URL:** {summary_data['source_url']}")
+                        st.write(f"**Domain:** {summary_data.get('domain', 'Unknown')}")
                         
-                        st.subheader("Summary")
-                        st.write(summary_data["summary"])
+                        authors = summary_data.get('authors', [])
+                        if authors:
+                            st.write(f"**Authors:** {', '.join(authors)}")
                         
-                        with st.expander("Article Details"):
-                            st.write(f"**Title:** {summary_data.get('title', 'Article')}")
-                            st.write(f"**URL:** {summary_data['source_url']}")
-                            st.write(f"**Domain:** {summary_data.get('domain', 'Unknown')}")
-                            
-                            authors = summary_data.get('authors', [])
-                            if authors:
-                                st.write(f"**Authors:** {', '.join(authors)}")
-                            
-                            publish_date = summary_data.get('publish_date', '')
-                            if publish_date:
-                                st.write(f"**Published:** {publish_date}")
-                            
-                            keywords = summary_data.get('keywords', [])
-                            if keywords:
-                                st.write(f"**Keywords:** {', '.join(keywords)}")
-                            
-                            st.write(f"**Extraction Method:** {summary_data.get('extraction_method', 'Unknown')}")
-                            st.write(f"**Created:** {summary_data['created_at']}")
-                            st.write(f"**Summary ID:** {summary_data['id']}")
-                            
-                            top_image = summary_data.get('top_image', '')
-                            if top_image:
-                                try:
-                                    st.image(top_image, caption="Article Image", width=300)
-                                except:
-                                    st.write(f"**Image URL:** {top_image}")
-                    else:
-                        st.error(f"{result.get('error', 'Summarization failed')}")
+                        publish_date = summary_data.get('publish_date', '')
+                        if publish_date:
+                            st.write(f"**Published:** {publish_date}")
+                        
+                        keywords = summary_data.get('keywords', [])
+                        if keywords:
+                            st.write(f"**Keywords:** {', '.join(keywords)}")
+                        
+                        st.write(f"**Extraction Method:** {summary_data.get('extraction_method', 'Unknown')}")
+                        st.write(f"**Created:** {summary_data['created_at']}")
+                        st.write(f"**Summary ID:** {summary_data['id']}")
+                        
+                        top_image = summary_data.get('top_image', '')
+                        if top_image:
+                            try:
+                                st.image(top_image, caption="Article Image", width=300)
+                            except:
+                                st.write(f"**Image URL:** {top_image}")
+                else:
+                    st.error(f"{result.get('error', 'Summarization failed')}")
             else:
                 st.error("Please enter a valid URL")
     
@@ -130,37 +172,36 @@ def show_main_app():
         
         if st.button(" Summarize Video", use_container_width=True):
             if url:
-                with st.spinner("Extracting transcript and analyzing video..."):
-                    result = summarize_youtube(url)
+                result = run_summarization(summarize_youtube, url, spinner_text="Extracting transcript and analyzing video...")
+                
+                if result.get("success"):
+                    st.success("YouTube video summarized successfully!")
+                    summary_data = result["summary"]
                     
-                    if result.get("success"):
-                        st.success("YouTube video summarized successfully!")
-                        summary_data = result["summary"]
-                        
-                        st.subheader("Summary")
-                        st.write(summary_data["summary"])
-                        
-                        with st.expander("Video Details"):
-                            st.write(f"**Video URL:** {summary_data['source_url']}")
-                            st.write(f"**Video ID:** {summary_data.get('video_id', 'N/A')}")
-                            st.write(f"**Language:** {summary_data.get('language', 'Unknown')}")
-                            st.write(f"**Transcript Type:** {summary_data.get('transcript_type', 'Unknown')}")
-                            st.write(f"**Transcript Length:** {summary_data.get('transcript_length', 0)} characters")
-                            st.write(f"**Created:** {summary_data['created_at']}")
-                            st.write(f"**Summary ID:** {summary_data['id']}")
+                    st.subheader("Summary")
+                    st.write(summary_data["summary"])
+                    
+                    with st.expander("Video Details"):
+                        st.write(f"**Video URL:** {summary_data['source_url']}")
+                        st.write(f"**Video ID:** {summary_data.get('video_id', 'N/A')}")
+                        st.write(f"**Language:** {summary_data.get('language', 'Unknown')}")
+                        st.write(f"**Transcript Type:** {summary_data.get('transcript_type', 'Unknown')}")
+                        st.write(f"**Transcript Length:** {summary_data.get('transcript_length', 0)} characters")
+                        st.write(f"**Created:** {summary_data['created_at']}")
+                        st.write(f"**Summary ID:** {summary_data['id']}")
+                else:
+                    error_msg = result.get('error', 'Summarization failed')
+                    
+                    if "Invalid YouTube URL" in error_msg:
+                        st.error("Invalid YouTube URL. Please enter a valid YouTube video URL.")
+                        st.info("**Supported formats:**\n- https://youtube.com/watch?v=VIDEO_ID\n- https://youtu.be/VIDEO_ID\n- https://youtube.com/embed/VIDEO_ID")
+                    elif "transcript" in error_msg.lower() or "captions" in error_msg.lower():
+                        st.error("This video doesn't have transcripts/captions available.")
+                        st.info("**Try these solutions:**\n- Choose a different video that has captions\n- Look for videos with the 'CC' icon\n- Try educational or news videos (they usually have captions)")
+                    elif "too short" in error_msg:
+                        st.error("The video transcript is too short to generate a meaningful summary.")
                     else:
-                        error_msg = result.get('error', 'Summarization failed')
-                        
-                        if "Invalid YouTube URL" in error_msg:
-                            st.error("Invalid YouTube URL. Please enter a valid YouTube video URL.")
-                            st.info("**Supported formats:**\n- https://youtube.com/watch?v=VIDEO_ID\n- https://youtu.be/VIDEO_ID\n- https://youtube.com/embed/VIDEO_ID")
-                        elif "transcript" in error_msg.lower() or "captions" in error_msg.lower():
-                            st.error("This video doesn't have transcripts/captions available.")
-                            st.info("**Try these solutions:**\n- Choose a different video that has captions\n- Look for videos with the 'CC' icon\n- Try educational or news videos (they usually have captions)")
-                        elif "too short" in error_msg:
-                            st.error("The video transcript is too short to generate a meaningful summary.")
-                        else:
-                            st.error(f"{error_msg}")
+                        st.error(f"{error_msg}")
             else:
                 st.error("Please enter a valid YouTube URL")
     
@@ -176,24 +217,23 @@ def show_main_app():
         
         if st.button("Summarize Repository", use_container_width=True):
             if repo:
-                with st.spinner("Analyzing repository..."):
-                    result = summarize_github(repo)
+                result = run_summarization(summarize_github, repo, spinner_text="Analyzing repository...")
+                
+                if result.get("success"):
+                    st.success("GitHub repository summarized successfully!")
+                    summary_data = result["summary"]
                     
-                    if result.get("success"):
-                        st.success("GitHub repository summarized successfully!")
-                        summary_data = result["summary"]
-                        
-                        st.subheader("Summary")
-                        st.write(summary_data["summary"])
-                        
-                        # Display metadata
-                        with st.expander("Details"):
-                            st.write(f"**Repository:** {summary_data.get('owner', '')}/{summary_data.get('repo', '')}")
-                            st.write(f"**URL:** {summary_data['source_url']}")
-                            st.write(f"**Created:** {summary_data['created_at']}")
-                            st.write(f"**Summary ID:** {summary_data['id']}")
-                    else:
-                        st.error(f"{result.get('error', 'Summarization failed')}")
+                    st.subheader("Summary")
+                    st.write(summary_data["summary"])
+                    
+                    # Display metadata
+                    with st.expander("Details"):
+                        st.write(f"**Repository:** {summary_data.get('owner', '')}/{summary_data.get('repo', '')}")
+                        st.write(f"**URL:** {summary_data['source_url']}")
+                        st.write(f"**Created:** {summary_data['created_at']}")
+                        st.write(f"**Summary ID:** {summary_data['id']}")
+                else:
+                    st.error(f"{result.get('error', 'Summarization failed')}")
             else:
                 st.error("Please enter a valid GitHub repository URL")
     
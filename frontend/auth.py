@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+from http_session import session
 from typing import Dict, Any
 import json
 
@@ -13,7 +14,7 @@ class AuthService:
     
     def register_user(self, full_name: str, email: str, password: str) -> Dict[str, Any]:
         try:
-            response = requests.post(
+            response = session.post(
                 f"{self.backend_url}/auth/register",
                 json={
                     "full_name": full_name,
@@ -50,7 +51,7 @@ class AuthService:
     def login_user(self, email: str, password: str) -> Dict[str, Any]:
         
         try:
-            response = requests.post(
+            response = session.post(
                 f"{self.backend_url}/auth/login",
                 json={
                     "email": email,
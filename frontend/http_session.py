@@ -0,0 +1,38 @@
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def build_session() -> requests.Session:
+    """
+    Keep-alive session shared by every call to the backend. Connection
+    errors are retried with jittered backoff, and so are 502/503/504 on
+    idempotent requests; POSTs are never resent once they reach the server.
+    """
+    retries = int(os.getenv("BACKEND_RETRIES", 2))
+    options = dict(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=retries,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False
+    )
+    try:
+        retry = Retry(backoff_jitter=0.3, **options)
+    except TypeError:
+        retry = Retry(**options)
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=int(os.getenv("BACKEND_POOL_SIZE", 10)),
+                          max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Streamlit re-runs the page script, not imported modules, so this session
+# lives for the whole frontend process.
+session = build_session()
@@ -1,8 +1,12 @@
+import json
+import time
 import requests
+from http_session import session
 import streamlit as st
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 
 BACKEND_URL = "http://localhost:8000"
+JOB_POLL_INTERVAL = 2
 
 
 def get_auth_headers() -> Dict[str, str]:
@@ -14,91 +18,162 @@ def get_auth_headers() -> Dict[str, str]:
     return headers
 
 
-def summarize_article(url: str) -> Dict[str, Any]:
+def _error_detail(response, default: str) -> str:
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/article/summarize",
-            json={"url": url},
+        return response.json().get("detail", default)
+    except ValueError:
+        return default
+
+
+def submit_job(job_type: str, json_body: Optional[Dict[str, Any]] = None, files=None) -> Dict[str, Any]:
+    headers = get_auth_headers()
+    if files:
+        headers.pop("Content-Type", None)
+    
+    response = session.post(
+        f"{BACKEND_URL}/jobs/{job_type}",
+        json=json_body,
+        files=files,
+        headers=headers,
+        timeout=120 if files else 30
+    )
+    
+    if response.status_code == 202:
+        return response.json()
+    return {"success": False, "error": _error_detail(response, "Failed to submit job")}
+
+
+def wait_for_job(job_id: str, timeout: int = 900,
+                 on_status: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    deadline = time.time() + timeout
+    
+    while time.time() < deadline:
+        response = session.get(
+            f"{BACKEND_URL}/jobs/{job_id}",
             headers=get_auth_headers(),
-            timeout=60
+            timeout=30
         )
+        if response.status_code != 200:
+            return {"success": False, "error": _error_detail(response, "Failed to get job status")}
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_data = response.json()
-            return {"success": False, "error": error_data.get("detail", "Summarization failed")}
-            
-    except requests.exceptions.RequestException as e:
-        return {"success": False, "error": f"Request failed: {str(e)}"}
+        job = response.json()
+        if on_status:
+            on_status(job["status"])
+        
+        if job["status"] == "succeeded":
+            result = session.get(
+                f"{BACKEND_URL}/jobs/{job_id}/result",
+                headers=get_auth_headers(),
+                timeout=30
+            )
+            if result.status_code == 200:
+                return result.json()
+            return {"success": False, "error": _error_detail(result, "Failed to get job result")}
+        
+        if job["status"] == "failed":
+            return {"success": False, "error": job.get("error") or "Summarization failed"}
+        
+        time.sleep(JOB_POLL_INTERVAL)
+    
+    return {"success": False, "error": "Timed out waiting for the summary. Check My Summaries later."}
 
 
-def summarize_pdf(file_content: bytes, filename: str) -> Dict[str, Any]:
+def run_job(job_type: str, json_body: Optional[Dict[str, Any]] = None, files=None,
+            on_status: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
     try:
-        files = {"file": (filename, file_content, "application/pdf")}
-        headers = {}
-        if st.session_state.get('user_token'):
-            headers["Authorization"] = f"Bearer {st.session_state.user_token}"
+        job = submit_job(job_type, json_body=json_body, files=files)
+        if not job.get("success"):
+            return job
         
-        response = requests.post(
-            f"{BACKEND_URL}/pdf/summarize",
-            files=files,
-            headers=headers,
-            timeout=120
-        )
+        if on_status:
+            on_status(job["status"])
+        return wait_for_job(job["job_id"], on_status=on_status)
         
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_data = response.json()
-            return {"success": False, "error": error_data.get("detail", "PDF summarization failed")}
-            
     except requests.exceptions.RequestException as e:
         return {"success": False, "error": f"Request failed: {str(e)}"}
 
 
-def summarize_youtube(url: str) -> Dict[str, Any]:
+def stream_summary(source: str, json_body: Optional[Dict[str, Any]] = None, files=None,
+                   on_token: Optional[Callable[[str], None]] = None,
+                   on_status: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    headers = get_auth_headers()
+    headers["Accept"] = "text/event-stream"
+    if files:
+        headers.pop("Content-Type", None)
+    
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/youtube/summarize",
-            json={"url": url},
-            headers=get_auth_headers(),
-            timeout=120
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_data = response.json()
-            return {"success": False, "error": error_data.get("detail", "YouTube summarization failed")}
+        with session.post(
+            f"{BACKEND_URL}/{source}/summarize/stream",
+            json=json_body,
+            files=files,
+            headers=headers,
+            stream=True,
+            timeout=(10, 300)
+        ) as response:
+            if response.status_code != 200:
+                return {"success": False, "error": _error_detail(response, "Summarization failed")}
             
+            event = "message"
+            for line in response.iter_lines(decode_unicode=True):
+                if not line:
+                    event = "message"
+                elif line.startswith("event:"):
+                    event = line[len("event:"):].strip()
+                elif line.startswith("data:"):
+                    data = json.loads(line[len("data:"):].strip())
+                    
+                    if event == "token" and on_token:
+                        on_token(data["text"])
+                    elif event == "status" and on_status:
+                        on_status(data["stage"])
+                    elif event == "done":
+                        return data
+                    elif event == "error":
+                        return {"success": False, "error": data.get("detail", "Summarization failed")}
+        
+        return {"success": False, "error": "The summary stream ended unexpectedly"}
+        
     except requests.exceptions.RequestException as e:
         return {"success": False, "error": f"Request failed: {str(e)}"}
 
 
-def summarize_github(repo_url: str) -> Dict[str, Any]:
-    try:
-        response = requests.post(
-            f"{BACKEND_URL}/github/summarize",
-            json={"repo_url": repo_url},
-            headers=get_auth_headers(),
-            timeout=180
-        )
-        
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_data = response.json()
-            return {"success": False, "error": error_data.get("detail", "GitHub summarization failed")}
-            
-    except requests.exceptions.RequestException as e:
-        return {"success": False, "error": f"Request failed: {str(e)}"}
+def summarize_article(url: str, on_status: Optional[Callable[[str], None]] = None,
+                      stream: bool = False, on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    if stream:
+        return stream_summary("article", json_body={"url": url}, on_token=on_token, on_status=on_status)
+    return run_job("article", json_body={"url": url}, on_status=on_status)
+
+
+def summarize_pdf(file_content: bytes, filename: str, on_status: Optional[Callable[[str], None]] = None,
+                  stream: bool = False, on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    files = {"file": (filename, file_content, "application/pdf")}
+    if stream:
+        return stream_summary("pdf", files=files, on_token=on_token, on_status=on_status)
+    return run_job("pdf", files=files, on_status=on_status)
+
+
+def summarize_youtube(url: str, on_status: Optional[Callable[[str], None]] = None,
+                      stream: bool = False, on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    if stream:
+        return stream_summary("youtube", json_body={"url": url}, on_token=on_token, on_status=on_status)
+    return run_job("youtube", json_body={"url": url}, on_status=on_status)
+
+
+def summarize_github(repo_url: str, on_status: Optional[Callable[[str], None]] = None,
+                     stream: bool = False, on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    if stream:
+        return stream_summary("github", json_body={"repo_url": repo_url}, on_token=on_token, on_status=on_status)
+    return run_job("github", json_body={"repo_url": repo_url}, on_status=on_status)
 
 
-def get_my_summaries() -> Dict[str, Any]:
+def get_my_summaries(cursor: Optional[str] = None, limit: int = 20) -> Dict[str, Any]:
+    params = {"limit": limit}
+    if cursor:
+        params["cursor"] = cursor
     try:
-        response = requests.get(
+        response = session.get(
             f"{BACKEND_URL}/summaries/my-summaries",
+            params=params,
             headers=get_auth_headers(),
             timeout=30
         )
@@ -4,48 +4,183 @@ Rapidread Backend Startup Script
 
 This script starts the FastAPI backend server with proper configuration.
 Run this from the project root directory.
+
+Development mode (the default) runs a single uvicorn process with auto-reload.
+Production mode (``--mode production`` or ``SERVER_MODE=production``) runs
+several worker processes under gunicorn, falling back to uvicorn's own
+process manager where gunicorn is not installed (e.g. Windows).
 """
 
+import argparse
+import importlib.util
+import multiprocessing
 import sys
 import os
-import subprocess
 from pathlib import Path
 
+APP_PATH = "backend.main:app"
+
+
+def module_available(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def optional_int(value: str):
+    return int(value) if value else None
+
+
+def server_settings(args) -> dict:
+    """
+    Production server settings from the command line and environment.
+    """
+    workers = args.workers or int(os.getenv("WEB_CONCURRENCY", 0)) or multiprocessing.cpu_count()
+    return {
+        "host": os.getenv("HOST", "0.0.0.0"),
+        "port": int(os.getenv("PORT", 8000)),
+        "workers": max(1, workers),
+        # uvloop and httptools ship with uvicorn[standard]; fall back to the
+        # pure-Python implementations when they are not installed
+        "loop": "uvloop" if module_available("uvloop") else "asyncio",
+        "http": "httptools" if module_available("httptools") else "h11",
+        "keepalive": int(os.getenv("SERVER_KEEPALIVE", 5)),
+        "backlog": int(os.getenv("SERVER_BACKLOG", 2048)),
+        # Per-worker cap on concurrent connections/tasks; extra requests get a 503
+        "limit_concurrency": optional_int(os.getenv("SERVER_LIMIT_CONCURRENCY", "")),
+        "graceful_timeout": int(os.getenv("SERVER_GRACEFUL_TIMEOUT", 30)),
+        "timeout": int(os.getenv("SERVER_WORKER_TIMEOUT", 120)),
+        # Recycle workers after this many requests (0 disables) to bound memory growth
+        "max_requests": int(os.getenv("SERVER_MAX_REQUESTS", 0)),
+        "max_requests_jitter": int(os.getenv("SERVER_MAX_REQUESTS_JITTER", 0)),
+        "preload": os.getenv("SERVER_PRELOAD", "true").lower() == "true",
+    }
+
+
+def preload_app():
+    """
+    Import the app and its heavy dependencies in the master process so forked
+    workers share them copy-on-write and are ready as soon as they start.
+    """
+    from backend.main import app
+    from backend.utils.lazy_import import preload_all
+
+    timings = preload_all()
+    if timings:
+        print("Preloaded: " + ", ".join(f"{name} ({ms:.0f} ms)" for name, ms in timings.items()))
+    return app
+
+
+def run_gunicorn(settings: dict):
+    from gunicorn.app.base import BaseApplication
+    from uvicorn.workers import UvicornWorker
+
+    class RapidreadWorker(UvicornWorker):
+        CONFIG_KWARGS = {
+            "loop": settings["loop"],
+            "http": settings["http"],
+            "limit_concurrency": settings["limit_concurrency"],
+        }
+
+    class RapidreadApplication(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"{settings['host']}:{settings['port']}",
+                "workers": settings["workers"],
+                "worker_class": RapidreadWorker,
+                "keepalive": settings["keepalive"],
+                "backlog": settings["backlog"],
+                "graceful_timeout": settings["graceful_timeout"],
+                "timeout": settings["timeout"],
+                "max_requests": settings["max_requests"],
+                "max_requests_jitter": settings["max_requests_jitter"],
+                "preload_app": settings["preload"],
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            if settings["preload"]:
+                return preload_app()
+            from backend.main import app
+            return app
+
+    # gunicorn restarts workers gracefully on SIGHUP and adds/removes them on SIGTTIN/SIGTTOU
+    RapidreadApplication().run()
+
+
+def run_uvicorn_workers(settings: dict):
+    import uvicorn
+
+    # uvicorn's process manager spawns fresh interpreters, so there is
+    # nothing to preload here; each worker imports the app itself.
+    uvicorn.run(
+        APP_PATH,
+        host=settings["host"],
+        port=settings["port"],
+        workers=settings["workers"],
+        loop=settings["loop"],
+        http=settings["http"],
+        backlog=settings["backlog"],
+        timeout_keep_alive=settings["keepalive"],
+        limit_concurrency=settings["limit_concurrency"],
+        timeout_graceful_shutdown=settings["graceful_timeout"],
+        limit_max_requests=settings["max_requests"] or None,
+    )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Start the Rapidread backend")
+    parser.add_argument("--mode", choices=("development", "production"),
+                        default=os.getenv("SERVER_MODE", "development"))
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker processes in production mode (default: WEB_CONCURRENCY or CPU count)")
+    return parser.parse_args()
+
+
 def main():
     """
     Main function to start the backend server
     """
+    args = parse_args()
     print("Starting Rapidread Summarizer Backend...")
-    
+
     # Get the project root directory
     project_root = Path(__file__).parent
     os.chdir(project_root)
-    
+
     # Add the project root to Python path
     sys.path.insert(0, str(project_root))
-    
+
     # Import and run the FastAPI app
     try:
         import uvicorn
-        from backend.main import app
-        
+
         # Get configuration from environment
         host = os.getenv("HOST", "0.0.0.0")
         port = int(os.getenv("PORT", 8000))
-        
+
         print(f"Server will run on: http://{host}:{port}")
         print(f"API Documentation: http://{host}:{port}/docs")
         print(f"Health Check: http://{host}:{port}/health")
         print("Press Ctrl+C to stop the server\n")
-        
+
+        if args.mode == "production":
+            settings = server_settings(args)
+            print(f"Production mode: {settings['workers']} workers, loop={settings['loop']}, "
+                  f"http={settings['http']}, limit_concurrency={settings['limit_concurrency']}")
+            if module_available("gunicorn"):
+                run_gunicorn(settings)
+            else:
+                run_uvicorn_workers(settings)
+            return
+
         # Start the server
         uvicorn.run(
-            app,
+            APP_PATH,
             host=host,
             port=port,
             reload=True
         )
-        
+
     except ImportError as e:
         print(f"Import error: {e}")
         print("Make sure you have installed all dependencies:")
@@ -56,4 +191,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()